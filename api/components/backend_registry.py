@@ -0,0 +1,309 @@
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from components.rate_limiter import UpstreamGate
+from components.tracing import Tracing
+
+# 백엔드 설정 - BACKEND_SITES 가 없으면 BACKEND_URL 단일 백엔드로 동작
+# BACKEND_SITES 예시 (JSON 리스트):
+# [{"id": "plant-a", "url": "https://a.example", "site": "plant-a", "channels": ["1-64"]},
+#  {"id": "plant-b-1", "url": "https://b1.example", "site": "plant-b", "sharded": true},
+#  {"id": "plant-b-2", "url": "https://b2.example", "site": "plant-b", "sharded": true}]
+BACKEND_URL = os.environ.get('BACKEND_URL', 'http://127.0.0.1:8000')
+BACKEND_TIMEOUT = float(os.environ.get('BACKEND_TIMEOUT', '10'))
+BACKEND_POOL_SIZE = int(os.environ.get('BACKEND_POOL_SIZE', '10'))
+
+
+class BackendResult:
+    """단일 백엔드 호출 결과"""
+
+    def __init__(self, backend, status_code, data=None, error=None):
+        self.backend = backend
+        self.status_code = status_code
+        self.data = data
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.status_code == 200 and self.error is None
+
+
+class Backend:
+    """NVR 백엔드 - 커넥션 풀과 헬스 상태 관리"""
+
+    FAILURE_THRESHOLD = 3
+    COOLDOWN_SECONDS = 30
+    # 모든 백엔드가 비정상일 때 백엔드별 복구 확인 요청 최소 간격
+    PROBE_INTERVAL_SECONDS = 5
+
+    def __init__(self, backend_id, url, site=None, channel_ranges=None, sharded=False):
+        self.id = backend_id
+        self.url = url.rstrip('/')
+        self.site = site
+        self.channel_ranges = channel_ranges or []
+        self.sharded = sharded
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=BACKEND_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.last_failure_at = None
+        self.last_error = None
+        self.last_latency_ms = None
+        self.last_probe_at = None
+
+    def owns_channel(self, channel_id):
+        """채널 범위 설정에 해당 채널이 포함되는지 확인"""
+        try:
+            ch_int = int(channel_id)
+        except (TypeError, ValueError):
+            return False
+        return any(start <= ch_int <= end for start, end in self.channel_ranges)
+
+    def is_healthy(self):
+        """연속 실패 임계값 초과 시 쿨다운 동안 비정상으로 간주"""
+        with self._lock:
+            if self.consecutive_failures < Backend.FAILURE_THRESHOLD:
+                return True
+            return time.time() - self.last_failure_at >= Backend.COOLDOWN_SECONDS
+
+    def claim_probe(self):
+        """비정상 상태에서 복구 확인 요청 허용 여부 (간격당 한 요청만 허용)"""
+        with self._lock:
+            now = time.time()
+            if self.last_probe_at is not None and now - self.last_probe_at < Backend.PROBE_INTERVAL_SECONDS:
+                return False
+            self.last_probe_at = now
+            return True
+
+    def _record(self, started, error=None):
+        with self._lock:
+            self.last_latency_ms = round((time.perf_counter() - started) * 1000, 2)
+            if error is None:
+                self.consecutive_failures = 0
+                self.last_error = None
+            else:
+                self.consecutive_failures += 1
+                self.last_failure_at = time.time()
+                self.last_error = error
+
+    def get(self, path, params=None):
+        """백엔드 GET 호출 - 전역 동시 호출 상한 대기열을 거쳐 호출"""
+        # 대기열 마감 초과는 백엔드 장애가 아니므로 헬스 상태에 반영하지 않음
+        with Tracing.span('queue'):
+            acquired = UpstreamGate.acquire()
+        if not acquired:
+            return BackendResult(self, 503, error=UpstreamGate.TIMEOUT_ERROR)
+        try:
+            return self._get(path, params)
+        finally:
+            UpstreamGate.release()
+
+    def _get(self, path, params=None):
+        """백엔드 GET 호출 - 성공/실패를 헬스 상태에 반영"""
+        started = time.perf_counter()
+        try:
+            with Tracing.span('upstream'):
+                response = self.session.get(
+                    f"{self.url}{path}",
+                    params=params,
+                    headers=Tracing.outgoing_headers(),
+                    timeout=BACKEND_TIMEOUT
+                )
+        except requests.RequestException as e:
+            error_msg = f"Backend connection failed: {str(e)}"
+            self._record(started, error_msg)
+            return BackendResult(self, 500, error=error_msg)
+
+        if response.status_code != 200:
+            error_msg = f"Backend returned {response.status_code}"
+            # 4xx 는 요청 문제이므로 백엔드 헬스에는 반영하지 않음
+            self._record(started, error_msg if response.status_code >= 500 else None)
+            return BackendResult(self, response.status_code, error=error_msg)
+
+        try:
+            with Tracing.span('parse'):
+                data = response.json()
+        except ValueError as e:
+            # 200 이지만 JSON 이 아닌 응답은 백엔드 장애로 간주
+            error_msg = f"Backend returned invalid JSON: {str(e)}"
+            self._record(started, error_msg)
+            return BackendResult(self, 502, error=error_msg)
+
+        self._record(started)
+        return BackendResult(self, 200, data=data)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'url': self.url,
+            'site': self.site,
+            'channel_ranges': [f"{start}-{end}" for start, end in self.channel_ranges],
+            'sharded': self.sharded,
+            'healthy': self.is_healthy(),
+            'consecutive_failures': self.consecutive_failures,
+            'last_error': self.last_error,
+            'last_latency_ms': self.last_latency_ms
+        }
+
+
+class ConsistentHashRing:
+    """샤딩된 채널을 백엔드에 배정하는 일관된 해싱 링"""
+
+    VIRTUAL_NODES = 64
+
+    def __init__(self, backends):
+        self._ring = []
+        for backend in backends:
+            for replica in range(ConsistentHashRing.VIRTUAL_NODES):
+                self._ring.append((ConsistentHashRing._hash(f"{backend.id}#{replica}"), backend))
+        self._ring.sort(key=lambda node: node[0])
+        self._keys = [node[0] for node in self._ring]
+
+    @staticmethod
+    def _hash(key):
+        return int(hashlib.md5(str(key).encode('utf-8')).hexdigest()[:16], 16)
+
+    def get(self, key):
+        if not self._ring:
+            return None
+        index = bisect(self._keys, ConsistentHashRing._hash(key)) % len(self._ring)
+        return self._ring[index][1]
+
+
+class BackendRegistry:
+    """사이트/채널별 백엔드 라우팅 및 동시 팬아웃"""
+
+    _backends = None
+    _rings = {}
+    _executor = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _parse_ranges(ranges):
+        parsed = []
+        for item in ranges or []:
+            start, _, end = str(item).partition('-')
+            parsed.append((int(start), int(end or start)))
+        return parsed
+
+    @staticmethod
+    def get_backends():
+        """설정된 백엔드 목록 반환 (최초 호출 시 환경변수에서 로드)"""
+        if BackendRegistry._backends is None:
+            with BackendRegistry._lock:
+                if BackendRegistry._backends is None:
+                    BackendRegistry._backends = BackendRegistry._load_backends()
+        return BackendRegistry._backends
+
+    @staticmethod
+    def _load_backends():
+        sites_config = os.environ.get('BACKEND_SITES')
+        if not sites_config:
+            return [Backend('default', BACKEND_URL)]
+
+        backends = []
+        for index, entry in enumerate(json.loads(sites_config)):
+            backends.append(Backend(
+                entry.get('id', f"backend-{index + 1}"),
+                entry['url'],
+                site=entry.get('site'),
+                channel_ranges=BackendRegistry._parse_ranges(entry.get('channels')),
+                sharded=entry.get('sharded', False)
+            ))
+        print(f"[BACKEND_REGISTRY] 백엔드 {len(backends)}개 로드: {[b.id for b in backends]}")
+        return backends
+
+    @staticmethod
+    def select(site=None):
+        """팬아웃 대상 백엔드 목록 (site 지정 시 해당 사이트만)"""
+        backends = BackendRegistry.get_backends()
+        if site:
+            backends = [backend for backend in backends if backend.site == site]
+        return backends
+
+    @staticmethod
+    def _get_ring(site):
+        ring = BackendRegistry._rings.get(site)
+        if ring is None:
+            sharded = [backend for backend in BackendRegistry.select(site) if backend.sharded]
+            ring = BackendRegistry._rings.setdefault(site, ConsistentHashRing(sharded))
+        return ring
+
+    @staticmethod
+    def route_channel(channel_id, site=None):
+        """채널을 담당하는 백엔드 결정 (채널 범위 우선, 그 다음 일관된 해싱)"""
+        backends = BackendRegistry.select(site)
+        if len(backends) == 1:
+            return backends[0]
+
+        for backend in backends:
+            if backend.owns_channel(channel_id):
+                return backend
+
+        backend = BackendRegistry._get_ring(site).get(channel_id)
+        return backend or (backends[0] if backends else None)
+
+    @staticmethod
+    def fan_out(path, params=None, site=None):
+        """대상 백엔드 전체에 동시 요청 후 결과 목록 반환"""
+        backends = BackendRegistry.select(site)
+        if not backends:
+            return [BackendResult(None, 404, error=f"Unknown site: {site}")]
+
+        # 비정상 백엔드는 건너뜀 (모두 비정상이면 백엔드별로 짧은 간격마다 한 요청만 복구 확인)
+        healthy = [backend for backend in backends if backend.is_healthy()]
+        if not healthy:
+            healthy = [backend for backend in backends if backend.claim_probe()]
+        skipped = [BackendResult(backend, 503, error="Backend unhealthy (cooling down)")
+                   for backend in backends if backend not in healthy]
+
+        if not healthy:
+            return skipped
+        if len(healthy) == 1:
+            return [healthy[0].get(path, params)] + skipped
+
+        if BackendRegistry._executor is None:
+            with BackendRegistry._lock:
+                if BackendRegistry._executor is None:
+                    BackendRegistry._executor = ThreadPoolExecutor(max_workers=BACKEND_POOL_SIZE)
+
+        futures = [BackendRegistry._executor.submit(Tracing.propagate(backend.get), path, params)
+                   for backend in healthy]
+        return [future.result() for future in futures] + skipped
+
+    @staticmethod
+    def first_error(results):
+        """실패 결과 중 첫 번째의 (상태 코드, 오류 메시지) 반환"""
+        for result in results:
+            if not result.ok:
+                return result.status_code, result.error
+        return 500, "No backend available"
+
+    @staticmethod
+    def mark_partial(response, results):
+        """일부 백엔드만 실패한 경우 X-Backend-Partial 헤더에 실패한 백엔드 ID 표시"""
+        failed = [result.backend.id for result in results if not result.ok and result.backend]
+        if failed:
+            response.headers['X-Backend-Partial'] = ','.join(failed)
+        return response
+
+
+def merge_ranges(ranges):
+    """여러 백엔드의 기간 정보를 하나로 병합 (가장 이른 시작 ~ 가장 늦은 종료)"""
+    ranges = [item for item in ranges if item and item.get('start') and item.get('end')]
+    if not ranges:
+        return {'start': 'N/A', 'end': 'N/A'}
+    return {
+        'start': min(item['start'] for item in ranges),
+        'end': max(item['end'] for item in ranges)
+    }
@@ -1,10 +1,33 @@
 from flask import Blueprint, jsonify, request
-import requests
+from collections import OrderedDict
+import hashlib
+import json
 import os
+import threading
+import time
+from markupsafe import escape
+from components.backend_registry import BackendRegistry
+from components.rate_limiter import RateLimiter
+from components.tracing import Tracing
 
 # 채널 상세 모달 블루프린트
 channel_detail_bp = Blueprint('channel_detail', __name__)
-BACKEND_URL = os.environ.get('BACKEND_URL', 'http://127.0.0.1:8000')
+
+# 조각 캐시 유효 시간(초) - 이 시간 안의 요청은 백엔드 호출 없이 캐시에서 응답
+FRAGMENT_CACHE_TTL = float(os.environ.get('FRAGMENT_CACHE_TTL', '30'))
+
+
+def _fetch_channel_detail(channel_id, start_date, end_date, severity):
+    """채널을 담당하는 백엔드에서 채널 상세 정보 조회"""
+    backend = BackendRegistry.route_channel(channel_id, site=request.args.get('site'))
+    if backend is None:
+        return None, 404, f"Unknown site: {request.args.get('site')}"
+
+    result = backend.get(
+        f"/api/v1/channels/{channel_id}",
+        {'start': start_date, 'end': end_date, 'severity': severity}
+    )
+    return result.data, result.status_code, result.error
 
 @channel_detail_bp.route('/proxy/channels/<channel_id>')
 def proxy_channel_detail(channel_id):
@@ -16,29 +39,126 @@ def proxy_channel_detail(channel_id):
     if not start_date or not end_date:
         return jsonify({"error": "start and end parameters required"}), 400
 
-    try:
-        # 실제 백엔드 호출
-        backend_url = f"{BACKEND_URL}/api/v1/channels/{channel_id}?start={start_date}&end={end_date}&severity={severity}"
-        response = requests.get(backend_url, timeout=10)
+    # 실제 백엔드 호출 (채널 담당 백엔드로 라우팅)
+    data, status_code, error_msg = _fetch_channel_detail(channel_id, start_date, end_date, severity)
+
+    if error_msg:
+        print(f"[CHANNEL_DETAIL] API 오류 - Channel {channel_id}: {error_msg}")
+        return jsonify({"error": error_msg}), status_code
+
+    print(f"[CHANNEL_DETAIL] API 호출 성공 - Channel {channel_id}: {data}")
+    with Tracing.span('serialize'):
+        return jsonify(data)
+
+
+@channel_detail_bp.route('/proxy/channels/<channel_id>/fragments')
+def proxy_channel_detail_fragments(channel_id):
+    """채널 상세 모달 HTML 조각 반환 (서버 렌더링 + 조각 캐시)"""
+    start_date = request.args.get('start')
+    end_date = request.args.get('end')
+    severity = request.args.get('severity', 'all')
+
+    if not start_date or not end_date:
+        return jsonify({"error": "start and end parameters required"}), 400
 
-        if response.status_code == 200:
-            data = response.json()
-            print(f"[CHANNEL_DETAIL] API 호출 성공 - Channel {channel_id}: {data}")
-            return jsonify(data)
+    # 유효 시간 안의 캐시가 있으면 백엔드 호출 없이 응답
+    with Tracing.span('cache'):
+        cache_key = (str(channel_id), start_date, end_date, severity, request.args.get('site'))
+        entry = ChannelFragmentCache.get(cache_key)
+
+    if entry is not None and ChannelFragmentCache.is_fresh(entry):
+        payload = entry['payload']
+        cache_status = 'HIT'
+        RateLimiter.mark_cache_hit()
+    else:
+        raw_data, status_code, error_msg = _fetch_channel_detail(channel_id, start_date, end_date, severity)
+
+        if error_msg:
+            print(f"[CHANNEL_FRAGMENT] API 오류 - Channel {channel_id}: {error_msg}")
+            return jsonify({"error": error_msg}), status_code
+
+        # 만료된 캐시라도 백엔드 데이터가 같으면 렌더링 결과 재사용
+        data_hash = ChannelFragmentCache.hash_data(raw_data)
+        if entry is not None and entry['payload']['data_hash'] == data_hash:
+            payload = entry['payload']
+            cache_status = 'REVALIDATED'
         else:
-            error_msg = f"Backend returned {response.status_code}"
-            print(f"[CHANNEL_DETAIL] API 오류 - Channel {channel_id}: {error_msg}")
-            return jsonify({"error": error_msg}), response.status_code
+            cache_status = 'MISS'
+            with Tracing.span('render'):
+                channel_data = ChannelDetailModalComponent.format_channel_detail_data(raw_data, channel_id)
+                payload = {
+                    'channel': channel_data,
+                    'fragments': ChannelDetailModalComponent.render_modal_fragments(channel_data, severity),
+                    'data_hash': data_hash
+                }
+        ChannelFragmentCache.set(cache_key, payload)
+
+    print(f"[CHANNEL_FRAGMENT] 조각 캐시 {cache_status} - Channel {channel_id}")
+    with Tracing.span('serialize'):
+        resp = jsonify(payload)
+    resp.headers['X-Fragment-Cache'] = cache_status
+    return resp
+
+
+class ChannelFragmentCache:
+    """채널 모달 HTML 조각 캐시 (LRU + 유효 시간)
 
-    except requests.RequestException as e:
-        error_msg = f"Backend connection failed: {str(e)}"
-        print(f"[CHANNEL_DETAIL] 연결 오류 - Channel {channel_id}: {error_msg}")
-        return jsonify({"error": error_msg}), 500
+    키는 (채널, 기간, 중요도, 사이트) 이며, 유효 시간이 지난 항목도 데이터 해시
+    비교용으로 남겨 두어 백엔드 데이터가 그대로면 다시 렌더링하지 않는다.
+    """
+
+    MAX_ENTRIES = 256
+
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def hash_data(raw_data):
+        """백엔드 응답 데이터 해시 생성"""
+        serialized = json.dumps(raw_data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(serialized.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def get(key):
+        """캐시 항목 조회 - {'payload', 'stored_at'} (조회된 항목은 최신으로 갱신)"""
+        with ChannelFragmentCache._lock:
+            entry = ChannelFragmentCache._entries.get(key)
+            if entry is not None:
+                ChannelFragmentCache._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def is_fresh(entry):
+        """유효 시간 안의 항목인지 확인"""
+        return time.monotonic() - entry['stored_at'] < FRAGMENT_CACHE_TTL
+
+    @staticmethod
+    def set(key, payload):
+        """캐시 저장 (최대 개수 초과 시 가장 오래된 항목 제거)"""
+        with ChannelFragmentCache._lock:
+            ChannelFragmentCache._entries[key] = {'payload': payload, 'stored_at': time.monotonic()}
+            ChannelFragmentCache._entries.move_to_end(key)
+            while len(ChannelFragmentCache._entries) > ChannelFragmentCache.MAX_ENTRIES:
+                ChannelFragmentCache._entries.popitem(last=False)
+
+    @staticmethod
+    def clear():
+        """캐시 초기화"""
+        with ChannelFragmentCache._lock:
+            ChannelFragmentCache._entries.clear()
 
 
 class ChannelDetailModalComponent:
     """채널 상세 모달 컴포넌트 클래스"""
 
+    # 중요도 필터 표시 이름 (dashboard.js getSeverityLabel 과 동일)
+    SEVERITY_LABELS = {'critical': '🔴 위험', 'warn': '🟡 경고', 'info': '🟢 정보', 'all': '전체'}
+
+    @staticmethod
+    def _event_type_label(event_type):
+        """이벤트 타입 표시 이름 (HTML 이스케이프)"""
+        return escape(event_type.get('label') or event_type.get('type_name') or event_type.get('type_code') or 'Unknown')
+
     @staticmethod
     def format_channel_detail_data(raw_data, channel_id):
         """채널 상세 정보 데이터 포맷"""
@@ -83,13 +203,14 @@ class ChannelDetailModalComponent:
         }
 
     @staticmethod
-    def format_detail_section_html(channel_data):
-        """상세 정보 섹션 HTML 생성"""
-        counts = channel_data['counts']
+    def format_detail_section_html(channel_data, severity='all'):
+        """상세 정보 섹션 HTML 생성 (백엔드 값은 모두 이스케이프)"""
+        counts = {key: escape(value) for key, value in channel_data['counts'].items()}
+        severity_label = ChannelDetailModalComponent.SEVERITY_LABELS.get(severity, '전체')
 
-        html = f"""
+        parts = [f"""
         <div class="detail-item">
-            <span>총 이벤트:</span>
+            <span>{severity_label} 이벤트:</span>
             <strong>{counts['total']}건</strong>
         </div>
         <div class="detail-item">
@@ -104,25 +225,24 @@ class ChannelDetailModalComponent:
             <span>Info:</span>
             <strong>{counts['info']}건</strong>
         </div>
-        """
+        """]
 
         if channel_data['by_type']:
-            html += '<div style="border-top: 1px solid #dee2e6; margin: 15px 0; padding-top: 15px;"></div>'
-            for event_type in channel_data['by_type']:
-                html += f"""
+            parts.append('<div style="border-top: 1px solid #dee2e6; margin: 15px 0; padding-top: 15px;"></div>')
+            parts.extend(f"""
                 <div class="detail-item">
-                    <span>{event_type.get('label', event_type.get('type_name', 'Unknown'))}:</span>
-                    <strong>{event_type.get('count', 0)}건</strong>
+                    <span>{ChannelDetailModalComponent._event_type_label(event_type)}:</span>
+                    <strong>{escape(event_type.get('count', 0))}건</strong>
                 </div>
-                """
+                """ for event_type in channel_data['by_type'])
 
-        return html
+        return ''.join(parts)
 
     @staticmethod
     def format_location_info_html(channel_data):
-        """위치 정보 섹션 HTML 생성"""
+        """위치 정보 섹션 HTML 생성 (백엔드 값은 모두 이스케이프)"""
         location = channel_data['location_info']
-        channel_display = channel_data['channel_display']
+        channel_display = escape(channel_data['channel_display'])
 
         return f"""
         <div class="location-item">
@@ -131,51 +251,58 @@ class ChannelDetailModalComponent:
         </div>
         <div class="location-item">
             <h4>설비명</h4>
-            <p>{location['fov_location_name']}</p>
+            <p>{escape(location['fov_location_name'])}</p>
         </div>
         <div class="location-item">
             <h4>공정명</h4>
-            <p>{location['area_name']}</p>
+            <p>{escape(location['area_name'])}</p>
         </div>
         <div class="location-item">
             <h4>상태</h4>
-            <p>{channel_data['status']}</p>
+            <p>{escape(channel_data['status'])}</p>
         </div>
         """
 
     @staticmethod
     def format_archive_section_html(channel_data):
-        """아카이브 섹션 HTML 생성"""
-        channel_display = channel_data['channel_display']
-
+        """아카이브 섹션 HTML 생성 (백엔드 값은 모두 이스케이프)"""
         if channel_data['by_type'] and len(channel_data['by_type']) > 0:
-            html = ""
-            for event_type in channel_data['by_type']:
-                html += f"""
+            return ''.join(f"""
                 <div class="archive-item">
-                    <h4 class="archive-subtitle">{event_type.get('label', 'Unknown')} ({event_type.get('count', 0)}건)</h4>
+                    <h4 class="archive-subtitle">{ChannelDetailModalComponent._event_type_label(event_type)} ({escape(event_type.get('count', 0))}건)</h4>
                     <div class="detail-item">
                         <span>발생 건수:</span>
-                        <strong>{event_type.get('count', 0)}건</strong>
+                        <strong>{escape(event_type.get('count', 0))}건</strong>
+                    </div>
+                    <div class="detail-item">
+                        <span>타입 코드:</span>
+                        <strong>{escape(event_type.get('type_code') or 'N/A')}</strong>
                     </div>
                 </div>
-                """
-        else:
-            html = f"""
+                """ for event_type in channel_data['by_type'])
+
+        return f"""
             <div class="archive-item">
                 <h4 class="archive-subtitle">표시할 이벤트 아카이브가 없습니다</h4>
                 <div class="detail-item">
                     <span>기간:</span>
-                    <strong>{channel_data['range']['start']} ~ {channel_data['range']['end']}</strong>
+                    <strong>{escape(channel_data['range']['start'])} ~ {escape(channel_data['range']['end'])}</strong>
                 </div>
                 <div class="detail-item">
                     <span>총 이벤트:</span>
-                    <strong>{channel_data['counts']['total']}건</strong>
+                    <strong>{escape(channel_data['counts']['total'])}건</strong>
                 </div>
             </div>
             """
 
-        return html
+    @staticmethod
+    def render_modal_fragments(channel_data, severity='all'):
+        """모달 전체 HTML 조각 생성"""
+        return {
+            'detail': ChannelDetailModalComponent.format_detail_section_html(channel_data, severity),
+            'location': ChannelDetailModalComponent.format_location_info_html(channel_data),
+            'archive': ChannelDetailModalComponent.format_archive_section_html(channel_data)
+        }
 
     @staticmethod
     def get_channel_severity_summary(channel_data):
@@ -0,0 +1,379 @@
+from collections import deque
+import json
+import math
+import os
+import queue
+import threading
+import time
+from flask import Blueprint, Response, jsonify, request
+from components.event_analytics_graphs import EventAnalyticsComponent
+from components.refresh_hints import RefreshHintUtils
+
+# 채널 모니터 블루프린트 (상태 변경/이상 징후 이벤트 스트림)
+channel_monitor_bp = Blueprint('channel_monitor', __name__)
+
+# 모니터 활성화 - 백그라운드 스레드와 장시간 SSE 연결이 필요하므로 상주 프로세스에서만 켬
+# (Vercel 등 서버리스는 요청이 끝나면 스레드/스트림이 종료되고 메모리 기준선도 유지되지 않음)
+CHANNEL_MONITOR_ENABLED = os.environ.get('CHANNEL_MONITOR_ENABLED', '0') == '1'
+# 평가 주기(초) - 구독자가 있을 때만 백엔드를 조회
+CHANNEL_MONITOR_INTERVAL = float(os.environ.get('CHANNEL_MONITOR_INTERVAL', '30'))
+# 이상 징후 판단 - 기준선 평균 + ANOMALY_SIGMA * 표준편차 이상이고 최소 ANOMALY_MIN_COUNT 건 이상
+ANOMALY_SIGMA = float(os.environ.get('ANOMALY_SIGMA', '3'))
+ANOMALY_MIN_COUNT = int(os.environ.get('ANOMALY_MIN_COUNT', '5'))
+# 채널+시간대별 기준선 지수 가중 계수 / 기준선 사용에 필요한 최소 관측 일수
+BASELINE_ALPHA = float(os.environ.get('BASELINE_ALPHA', '0.2'))
+BASELINE_MIN_SAMPLES = int(os.environ.get('BASELINE_MIN_SAMPLES', '3'))
+
+STREAM_KEEPALIVE_SECONDS = 15
+STREAM_QUEUE_SIZE = 100
+
+
+@channel_monitor_bp.route('/stream/channel-events')
+def stream_channel_events():
+    """채널 상태 변경/이상 징후 이벤트 스트림 (Server-Sent Events)"""
+    if not CHANNEL_MONITOR_ENABLED:
+        return jsonify({"error": "channel monitor disabled"}), 404
+
+    events = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+    def enqueue(event):
+        try:
+            events.put_nowait(event)
+        except queue.Full:
+            print(f"[CHANNEL_MONITOR] 구독자 대기열 가득 참 - 이벤트 {event['id']} 누락")
+
+    # 재연결 시 Last-Event-ID 이후 놓친 이벤트부터 전달
+    ChannelMonitor.subscribe(enqueue, last_event_id=request.headers.get('Last-Event-ID', type=int))
+
+    def generate():
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    event = events.get(timeout=STREAM_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                payload = json.dumps(event, ensure_ascii=False)
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+        finally:
+            ChannelMonitor.unsubscribe(enqueue)
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+class HourlyBaseline:
+    """채널+시간대별 critical 건수 기준선 (일 단위 지수 가중 평균/분산)
+
+    관측이 없던 날은 해당 시간대에 이벤트가 없었던 것으로 보고 0건을 반영한다.
+    """
+
+    MAX_GAP_DAYS = 30
+
+    __slots__ = ('mean', 'var', 'samples', 'day')
+
+    def __init__(self):
+        self.mean = 0.0
+        self.var = 0.0
+        self.samples = 0
+        self.day = None
+
+    def _update(self, value):
+        if self.samples == 0:
+            self.mean = float(value)
+            self.var = 0.0
+        else:
+            diff = value - self.mean
+            increment = BASELINE_ALPHA * diff
+            self.mean += increment
+            self.var = (1 - BASELINE_ALPHA) * (self.var + diff * increment)
+        self.samples += 1
+
+    def _gap(self, day):
+        if self.day is None:
+            return 0
+        return max(0, min(day - self.day - 1, HourlyBaseline.MAX_GAP_DAYS))
+
+    def observe(self, day, count):
+        """day(서수) 의 해당 시간대 critical 건수 반영"""
+        for _ in range(self._gap(day)):
+            self._update(0)
+        self._update(count)
+        self.day = day
+
+    def expected(self, day):
+        """day 기준 (평균, 표준편차) - 관측 없던 날의 0건을 반영한 값"""
+        decay = (1 - BASELINE_ALPHA) ** self._gap(day)
+        return self.mean * decay, math.sqrt(self.var)
+
+
+class ChannelState:
+    """채널별 직전 스냅샷 및 오늘 시간대별 critical 건수"""
+
+    __slots__ = ('name', 'status', 'count', 'critical', 'day', 'bucket', 'bucket_count', 'today_hours', 'alerted')
+
+    def __init__(self, name, status, count, critical, day):
+        self.name = name
+        self.status = status
+        self.count = count
+        self.critical = critical
+        self.day = day
+        self.bucket = None
+        self.bucket_count = 0
+        self.today_hours = {}
+        self.alerted = None
+
+
+class ChannelMonitor:
+    """채널 스냅샷 비교 기반 상태 변경/이상 징후 감지기
+
+    직전 스냅샷과 (상태, 총 건수) 가 같은 채널은 건너뛰므로 기준선 갱신과
+    이상 징후 평가는 변경된 채널 수에 비례한다. 구독자가 있을 때만 백그라운드
+    스레드가 주기적으로 오늘 채널 목록을 평가하며, 채널 프록시가 오늘 전체
+    스냅샷을 받았으면 그것을 재사용해 백엔드 호출을 생략한다.
+    """
+
+    RECENT_EVENTS = 200
+
+    _states = {}
+    _baselines = {}
+    _recent = deque(maxlen=RECENT_EVENTS)
+    _subscribers = []
+    _next_event_id = 1
+    _pending_snapshot = None
+    _thread = None
+    _lock = threading.Lock()
+    _evaluate_lock = threading.Lock()
+    _stats = {'ticks': 0, 'fetches': 0, 'reused_snapshots': 0, 'channels_scanned': 0,
+              'channels_changed': 0, 'events_emitted': 0, 'last_tick_ms': None}
+
+    @staticmethod
+    def subscribe(callback, last_event_id=None):
+        """이벤트 구독 - last_event_id 이후 최근 이벤트를 먼저 전달하고 평가 스레드 시작"""
+        with ChannelMonitor._lock:
+            ChannelMonitor._subscribers.append(callback)
+            missed = [event for event in ChannelMonitor._recent
+                      if last_event_id is not None and event['id'] > last_event_id]
+        for event in missed:
+            callback(event)
+        ChannelMonitor.ensure_started()
+
+    @staticmethod
+    def unsubscribe(callback):
+        with ChannelMonitor._lock:
+            if callback in ChannelMonitor._subscribers:
+                ChannelMonitor._subscribers.remove(callback)
+
+    @staticmethod
+    def ensure_started():
+        """백그라운드 평가 스레드 시작 (이미 실행 중이거나 비활성화 상태면 무시)"""
+        if not CHANNEL_MONITOR_ENABLED:
+            return
+        with ChannelMonitor._lock:
+            if ChannelMonitor._thread is not None and ChannelMonitor._thread.is_alive():
+                return
+            ChannelMonitor._thread = threading.Thread(target=ChannelMonitor._run, name='channel-monitor', daemon=True)
+            ChannelMonitor._thread.start()
+
+    @staticmethod
+    def _run():
+        while True:
+            if ChannelMonitor._subscribers:
+                try:
+                    ChannelMonitor.tick()
+                except Exception as e:
+                    print(f"[CHANNEL_MONITOR] 평가 오류: {str(e)}")
+            time.sleep(CHANNEL_MONITOR_INTERVAL)
+
+    @staticmethod
+    def offer_snapshot(data, start_date, end_date):
+        """채널 프록시가 받은 severity=critical 스냅샷 전달 - 모니터 활성화 상태이고 오늘 하루 범위일 때만 보관"""
+        if not CHANNEL_MONITOR_ENABLED:
+            return
+        today = RefreshHintUtils.get_today().isoformat()
+        if start_date == today and end_date == today:
+            ChannelMonitor._pending_snapshot = (time.monotonic(), data)
+
+    @staticmethod
+    def tick():
+        """오늘 critical 채널 스냅샷 1회 평가 (최근 프록시 스냅샷이 없으면 백엔드 조회)
+
+        채널 목록 응답에는 이벤트 타입별 중요도가 없으므로 severity=critical 로 조회한
+        채널별 count 를 critical 건수로 사용한다.
+        """
+        pending = ChannelMonitor._pending_snapshot
+        ChannelMonitor._pending_snapshot = None
+
+        if pending is not None and time.monotonic() - pending[0] < CHANNEL_MONITOR_INTERVAL:
+            snapshot = pending[1]
+            ChannelMonitor._stats['reused_snapshots'] += 1
+        else:
+            # 순환 import 방지 - 채널 통계 모듈이 이 모듈을 import 함
+            from components.channel_stats_panel import fetch_channel_list
+
+            today = RefreshHintUtils.get_today().isoformat()
+            snapshot, results = fetch_channel_list(today, today, 'critical')
+            ChannelMonitor._stats['fetches'] += 1
+            if snapshot is None:
+                print(f"[CHANNEL_MONITOR] 채널 목록 조회 실패: {[result.error for result in results]}")
+                return []
+
+        return ChannelMonitor.evaluate(snapshot)
+
+    @staticmethod
+    def evaluate(snapshot, now=None):
+        """스냅샷을 직전 상태와 비교하여 발생한 이벤트 목록 반환"""
+        now = now or RefreshHintUtils.get_now()
+        day = now.date().toordinal()
+        started = time.perf_counter()
+        events = []
+        changed = 0
+
+        with ChannelMonitor._evaluate_lock:
+            items = (snapshot or {}).get('items', [])
+            for item in items:
+                channel_id = str(item.get('channel_id'))
+                status = str(item.get('status', 'OFF')).upper()
+                count = item.get('count', 0)
+
+                state = ChannelMonitor._states.get(channel_id)
+                if state is not None and state.day == day and state.status == status and state.count == count:
+                    continue
+
+                changed += 1
+                events.extend(ChannelMonitor._evaluate_channel(channel_id, item, state, status, count, day, now))
+
+            stats = ChannelMonitor._stats
+            stats['ticks'] += 1
+            stats['channels_scanned'] += len(items)
+            stats['channels_changed'] += changed
+            stats['last_tick_ms'] = round((time.perf_counter() - started) * 1000, 2)
+
+        for event in events:
+            ChannelMonitor._emit(event, now)
+        return events
+
+    @staticmethod
+    def _finalize_bucket(channel_id, state):
+        """지난 시간대 critical 건수를 채널+시간대 기준선에 반영"""
+        if state.bucket is None:
+            return
+        bucket_day, bucket_hour = state.bucket
+        baseline = ChannelMonitor._baselines.get((channel_id, bucket_hour))
+        if baseline is None:
+            baseline = ChannelMonitor._baselines[(channel_id, bucket_hour)] = HourlyBaseline()
+        baseline.observe(bucket_day, state.bucket_count)
+
+    @staticmethod
+    def _evaluate_channel(channel_id, item, state, status, count, day, now):
+        name = item.get('name', f"CH{channel_id.zfill(2)}")
+        # severity=critical 스냅샷이므로 채널 count 가 오늘 누적 critical 건수
+        critical = count
+
+        # 처음 보는 채널은 기준 상태만 기록 (이전 시간대 분포를 알 수 없음)
+        if state is None:
+            ChannelMonitor._states[channel_id] = ChannelState(name, status, count, critical, day)
+            return []
+
+        events = []
+        if state.status != status:
+            events.append({
+                'type': 'status_change',
+                'channel_id': channel_id,
+                'name': name,
+                'from': state.status,
+                'to': status
+            })
+
+        # 스냅샷 건수는 오늘 누적값이므로 날짜가 바뀌면 오늘 건수 전체가 증가분
+        if state.day != day:
+            delta = critical
+            state.today_hours = {}
+        else:
+            delta = max(0, critical - state.critical)
+
+        state.name, state.status, state.count, state.critical, state.day = name, status, count, critical, day
+
+        if delta == 0:
+            return events
+
+        bucket = (day, now.hour)
+        if state.bucket != bucket:
+            ChannelMonitor._finalize_bucket(channel_id, state)
+            state.bucket = bucket
+            state.bucket_count = 0
+        state.bucket_count += delta
+        state.today_hours[now.hour] = state.bucket_count
+
+        anomaly = ChannelMonitor._check_anomaly(channel_id, state, day, now.hour)
+        if anomaly is not None:
+            events.append(dict(anomaly, channel_id=channel_id, name=name))
+        return events
+
+    @staticmethod
+    def _check_anomaly(channel_id, state, day, hour):
+        """현재 시간대 critical 건수가 기준선을 크게 넘으면 이상 징후 반환 (시간대당 1회)"""
+        if state.alerted == (day, hour):
+            return None
+
+        baseline = ChannelMonitor._baselines.get((channel_id, hour))
+        if baseline is not None and baseline.samples >= BASELINE_MIN_SAMPLES:
+            mean, std = baseline.expected(day)
+            basis = 'hourly_baseline'
+        else:
+            # 기준선이 쌓이기 전에는 오늘 시간당 평균을 사용 (포아송 분포 가정)
+            hourly_data = EventAnalyticsComponent.format_hourly_bar_data({
+                'hourly_bar': [{'hour': h, 'count': c} for h, c in state.today_hours.items()]
+            })
+            mean = EventAnalyticsComponent.calculate_hourly_average(hourly_data)
+            std = math.sqrt(mean)
+            basis = 'today_average'
+
+        threshold = max(ANOMALY_MIN_COUNT, mean + ANOMALY_SIGMA * std)
+        if state.bucket_count < threshold:
+            return None
+
+        state.alerted = (day, hour)
+        return {
+            'type': 'critical_spike',
+            'hour': hour,
+            'label': f"{hour:02d}:00",
+            'count': state.bucket_count,
+            'baseline_mean': round(mean, 2),
+            'threshold': round(threshold, 2),
+            'basis': basis
+        }
+
+    @staticmethod
+    def _emit(event, now):
+        with ChannelMonitor._lock:
+            event['id'] = ChannelMonitor._next_event_id
+            event['at'] = now.isoformat(timespec='seconds')
+            ChannelMonitor._next_event_id += 1
+            ChannelMonitor._recent.append(event)
+            ChannelMonitor._stats['events_emitted'] += 1
+            subscribers = list(ChannelMonitor._subscribers)
+
+        print(f"[CHANNEL_MONITOR] {event['type']} - Channel {event['channel_id']}: {event}")
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"[CHANNEL_MONITOR] 구독자 전달 오류: {str(e)}")
+
+    @staticmethod
+    def snapshot():
+        """모니터 상태 및 통계"""
+        with ChannelMonitor._lock:
+            return dict(
+                ChannelMonitor._stats,
+                enabled=CHANNEL_MONITOR_ENABLED,
+                running=ChannelMonitor._thread is not None and ChannelMonitor._thread.is_alive(),
+                subscribers=len(ChannelMonitor._subscribers),
+                tracked_channels=len(ChannelMonitor._states),
+                baselines=len(ChannelMonitor._baselines),
+                recent_events=list(ChannelMonitor._recent)[-20:]
+            )
@@ -1,10 +1,27 @@
 from flask import Blueprint, jsonify, request
-import requests
-import os
+from components.backend_registry import BackendRegistry, merge_ranges
+from components.channel_monitor import ChannelMonitor
+from components.event_summary_panel import EventSummaryComponent
+from components.refresh_hints import RefreshHintUtils
+from components.wire_format import WireFormat, encode_payload
 
 # 채널 통계 패널 블루프린트
 channel_stats_bp = Blueprint('channel_stats', __name__)
-BACKEND_URL = os.environ.get('BACKEND_URL', 'http://127.0.0.1:8000')
+
+
+def fetch_channel_list(start_date, end_date, severity='all', site=None):
+    """백엔드 채널 목록 API 호출 (사이트별 동시 팬아웃 후 병합) - (data, results) 반환"""
+    results = BackendRegistry.fan_out(
+        '/api/v1/channels',
+        {'start': start_date, 'end': end_date, 'severity': severity},
+        site=site
+    )
+    payloads = [result.data for result in results if result.ok]
+
+    if not payloads:
+        return None, results
+    data = payloads[0] if len(payloads) == 1 else ChannelStatsComponent.merge_channel_lists(payloads)
+    return data, results
 
 @channel_stats_bp.route('/proxy/channels')
 def proxy_channels_summary():
@@ -16,24 +33,34 @@ def proxy_channels_summary():
     if not start_date or not end_date:
         return jsonify({"error": "start and end parameters required"}), 400
 
-    try:
-        # 실제 백엔드 호출
-        backend_url = f"{BACKEND_URL}/api/v1/channels?start={start_date}&end={end_date}&severity={severity}"
-        response = requests.get(backend_url, timeout=10)
+    # 실제 백엔드 호출 (사이트별 백엔드에 동시 팬아웃)
+    data, results = fetch_channel_list(start_date, end_date, severity, site=request.args.get('site'))
 
-        if response.status_code == 200:
-            data = response.json()
-            print(f"[CHANNEL_STATS] API 호출 성공: {data}")
-            return jsonify(data)
-        else:
-            error_msg = f"Backend returned {response.status_code}"
-            print(f"[CHANNEL_STATS] API 오류: {error_msg}")
-            return jsonify({"error": error_msg}), response.status_code
+    if data is None:
+        status_code, error_msg = BackendRegistry.first_error(results)
+        print(f"[CHANNEL_STATS] API 오류: {error_msg}")
+        return jsonify({"error": error_msg}), status_code
 
-    except requests.RequestException as e:
-        error_msg = f"Backend connection failed: {str(e)}"
-        print(f"[CHANNEL_STATS] 연결 오류: {error_msg}")
-        return jsonify({"error": error_msg}), 500
+    # 오늘 전체 채널의 critical 스냅샷이면 채널 모니터에 전달 (모니터 자체 백엔드 호출 생략)
+    if severity == 'critical' and not request.args.get('site'):
+        ChannelMonitor.offer_snapshot(data, start_date, end_date)
+
+    # include=summary 이면 채널 응답에서 계산한 요약 카드/분포 데이터를 함께 반환
+    # (계산할 수 없으면 summary 는 null 이며 클라이언트가 요약 API 를 별도 호출)
+    if request.args.get('include') == 'summary':
+        summary = EventSummaryComponent.resolve_summary_for_channels(
+            data, start_date, end_date, severity, site=request.args.get('site')
+        )
+        if summary is not None:
+            summary['distribution'] = ChannelStatsComponent.calculate_channel_event_distribution(
+                ChannelStatsComponent.format_channel_grid_data(data)
+            )
+        data = dict(data, summary=summary)
+
+    print(f"[CHANNEL_STATS] API 호출 성공: {data}")
+    response = WireFormat.respond(data, ChannelStatsComponent.to_columnar)
+    response = RefreshHintUtils.apply(response, 'channels', start_date, end_date, severity, data)
+    return BackendRegistry.mark_partial(response, results)
 
 
 class ChannelStatsComponent:
@@ -51,7 +78,7 @@ class ChannelStatsComponent:
         for channel in channels:
             formatted_channels.append({
                 'channel_id': channel.get('channel_id'),
-                'name': channel.get('name', f"CH{channel.get('channel_id', '00').zfill(2)}"),
+                'name': channel.get('name', f"CH{str(channel.get('channel_id', '00')).zfill(2)}"),
                 'total_events': channel.get('count', 0),
                 'status': channel.get('status', 'OFF').upper(),
                 'by_type': channel.get('by_type', []),
@@ -61,6 +88,28 @@ class ChannelStatsComponent:
         # 채널 번호순으로 정렬
         return sorted(formatted_channels, key=lambda x: int(x['channel_id']) if x['channel_id'] else 0)
 
+    @staticmethod
+    def to_columnar(raw_data):
+        """채널 목록 응답을 컬럼형(struct-of-arrays) 구조로 인코딩
+
+        items 는 백엔드 행 스키마 그대로 인코딩하여 (반복 문자열은 dict 인덱스,
+        채널별 by_type 은 하위 테이블) 복원 시 JSON 응답과 동일한 행이 되며,
+        items 외의 최상위 필드(range, summary 등)는 meta 로 그대로 전달한다.
+        """
+        return encode_payload('channels', raw_data, ('items',))
+
+    @staticmethod
+    def merge_channel_lists(payloads):
+        """여러 백엔드의 채널 목록 응답을 하나로 병합"""
+        items = []
+        for payload in payloads:
+            items.extend(payload.get('items', []))
+
+        return {
+            'items': items,
+            'range': merge_ranges(payload.get('range') for payload in payloads)
+        }
+
     @staticmethod
     def get_channel_status_summary(channels_data):
         """채널 상태 요약 통계"""
@@ -0,0 +1,220 @@
+from datetime import date
+from functools import lru_cache
+import os
+import threading
+import time
+from flask import jsonify, request
+from components.backend_registry import BACKEND_TIMEOUT, BackendRegistry, merge_ranges
+from components.refresh_hints import RefreshHintUtils
+
+# 중앙 날짜 검증 대상 경로 (start/end 파라미터를 백엔드로 전달하는 프록시 API)
+VALIDATED_PATH_PREFIX = '/api/proxy/'
+
+# 날짜 범위 캐시 유효 시간(초) - 전체 성공 / 일부 백엔드만 성공 / 전체 실패
+DATE_RANGE_CACHE_TTL = float(os.environ.get('DATE_RANGE_CACHE_TTL', '300'))
+DATE_RANGE_PARTIAL_TTL = float(os.environ.get('DATE_RANGE_PARTIAL_TTL', '15'))
+DATE_RANGE_NEGATIVE_TTL = float(os.environ.get('DATE_RANGE_NEGATIVE_TTL', '5'))
+# 범위 밖 요청 거절 전 다시 조회하는 캐시 최소 경과 시간(초) - 거절 요청마다 백엔드를 부르지 않도록 제한
+DATE_RANGE_RECHECK_AGE = float(os.environ.get('DATE_RANGE_RECHECK_AGE', '30'))
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_date(value):
+    """YYYY-MM-DD 문자열을 date 로 변환 (형식이 틀리면 None) - 같은 문자열은 다시 파싱하지 않음"""
+    if not isinstance(value, str) or len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class DateRangeCache:
+    """백엔드 조회 가능 날짜 범위 캐시
+
+    범위의 종료일은 하루 중에도 늘어날 수 있으므로 사이트별로 몇 분(DATE_RANGE_CACHE_TTL)만
+    보관하며, 검증에 쓰는 date 경계값은 저장 시점에 한 번만 계산한다.
+    일부 백엔드만 응답한 결과와 전체 실패도 짧게 캐시하여 장애 중 요청마다 팬아웃하지 않고,
+    캐시 미스는 사이트별로 한 요청만 백엔드를 조회하고 나머지는 그 결과를 기다린다.
+    """
+
+    _entries = {}
+    _inflight = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_cached(site=None, max_age=None):
+        """유효 시간 안의 캐시 항목 반환 (없거나 만료되었거나 max_age 초보다 오래되면 None)"""
+        entry = DateRangeCache._entries.get(site)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry['stored_at']
+        if age >= entry['ttl'] or (max_age is not None and age >= max_age):
+            return None
+        return entry
+
+    @staticmethod
+    def remaining_ttl(entry):
+        """캐시 항목의 남은 유효 시간(초)"""
+        return max(0, int(entry['ttl'] - (time.monotonic() - entry['stored_at'])))
+
+    @staticmethod
+    def _store(site, data, results):
+        if data is None:
+            ttl = DATE_RANGE_NEGATIVE_TTL
+        elif all(result.ok for result in results):
+            ttl = DATE_RANGE_CACHE_TTL
+        else:
+            ttl = DATE_RANGE_PARTIAL_TTL
+
+        entry = {
+            'stored_at': time.monotonic(),
+            'ttl': ttl,
+            'data': data,
+            'results': [result for result in results if not result.ok],
+            'start': parse_iso_date(data.get('start')) if data else None,
+            'end': parse_iso_date(data.get('end')) if data else None
+        }
+        with DateRangeCache._lock:
+            DateRangeCache._entries[site] = entry
+        return entry
+
+    @staticmethod
+    def _fetch_backends(site):
+        results = BackendRegistry.fan_out('/api/v1/date-range', site=site)
+        payloads = [result.data for result in results if result.ok]
+        data = None
+        if payloads:
+            data = payloads[0] if len(payloads) == 1 else merge_ranges(payloads)
+        DateRangeCache._store(site, data, results)
+        return data, results
+
+    @staticmethod
+    def fetch(site=None, max_age=None):
+        """캐시 또는 백엔드에서 날짜 범위 조회 - (data, results, cache_hit) 반환
+
+        캐시된 일부 실패/전체 실패 결과는 실패한 백엔드 결과와 함께 반환한다.
+        max_age 를 지정하면 그보다 오래된 캐시는 다시 조회한다.
+        """
+        entry = DateRangeCache.get_cached(site, max_age)
+        if entry is not None:
+            return entry['data'], entry['results'], True
+
+        with DateRangeCache._lock:
+            flight = DateRangeCache._inflight.get(site)
+            leader = flight is None
+            if leader:
+                flight = DateRangeCache._inflight[site] = threading.Event()
+
+        if not leader:
+            # 다른 요청이 조회 중이면 그 결과를 사용
+            flight.wait(BACKEND_TIMEOUT)
+            entry = DateRangeCache.get_cached(site)
+            if entry is not None:
+                return entry['data'], entry['results'], True
+            data, results = DateRangeCache._fetch_backends(site)
+            return data, results, False
+
+        try:
+            data, results = DateRangeCache._fetch_backends(site)
+        finally:
+            with DateRangeCache._lock:
+                DateRangeCache._inflight.pop(site, None)
+            flight.set()
+        return data, results, False
+
+    @staticmethod
+    def clear():
+        with DateRangeCache._lock:
+            DateRangeCache._entries.clear()
+
+
+class DateRangeValidator:
+    """프록시 요청 날짜 파라미터 중앙 검증 (형식/순서/조회 가능 범위)"""
+
+    @staticmethod
+    def _invalid_request(field, value, message, ctx=None):
+        # 백엔드 검증 오류와 같은 형식으로 반환하여 클라이언트 오류 변환 로직을 그대로 사용
+        detail = {'type': 'value_error', 'loc': ['query', field], 'msg': message, 'input': value}
+        if ctx:
+            detail['ctx'] = ctx
+        return jsonify({
+            'error': 'invalid_request',
+            'path': request.path,
+            'method': request.method,
+            'status': 400,
+            'detail': [detail]
+        }), 400
+
+    @staticmethod
+    def check(start_date, end_date, bounds=None):
+        """검증 오류 (field, value, message, ctx) 반환 - 유효하면 None
+
+        bounds 는 (시작 date, 종료 date) 조회 가능 범위이며 없으면 범위 검사는 생략한다.
+        """
+        start = parse_iso_date(start_date)
+        if start is None:
+            return 'start', start_date, 'Input should be a valid date (YYYY-MM-DD)', None
+        end = parse_iso_date(end_date)
+        if end is None:
+            return 'end', end_date, 'Input should be a valid date (YYYY-MM-DD)', None
+        if end < start:
+            return 'end', end_date, 'Value error, end must be >= start', {'error': 'end must be >= start'}
+
+        if bounds and bounds[0] and bounds[1]:
+            if start < bounds[0] or start > bounds[1]:
+                return 'start', start_date, 'Date out of available range', {'error': 'out_of_range'}
+            if end < bounds[0] or end > bounds[1]:
+                return 'end', end_date, 'Date out of available range', {'error': 'out_of_range'}
+        return None
+
+    @staticmethod
+    def _may_have_advanced(start_date, end_date, bounds):
+        """요청 날짜가 캐시된 종료일 이후~오늘 사이인지 (백엔드 범위가 늘어났을 가능성)"""
+        if not bounds or not bounds[1]:
+            return False
+        today = RefreshHintUtils.get_today()
+        requested = [parse_iso_date(start_date), parse_iso_date(end_date)]
+        return any(value is not None and bounds[1] < value <= today for value in requested)
+
+    @staticmethod
+    def before_request():
+        """프록시 요청 날짜 검증 - 잘못되었거나 조회 가능 범위를 벗어나면 백엔드 호출 없이 400 응답"""
+        if not request.path.startswith(VALIDATED_PATH_PREFIX):
+            return None
+
+        start_date = request.args.get('start')
+        end_date = request.args.get('end')
+        if not start_date or not end_date:
+            # 필수 파라미터 누락은 각 라우트의 기존 오류 응답 사용
+            return None
+
+        site = request.args.get('site')
+        # 캐시가 만료된 경우에만 범위를 조회 (실패하면 범위 검사 없이 진행)
+        DateRangeCache.fetch(site)
+        entry = DateRangeCache.get_cached(site)
+        bounds = (entry['start'], entry['end']) if entry else None
+
+        error = DateRangeValidator.check(start_date, end_date, bounds)
+        if error is not None and DateRangeValidator._may_have_advanced(start_date, end_date, bounds):
+            # 캐시 이후 백엔드 종료일이 늘어났을 수 있으므로 거절 전 한 번 다시 조회
+            DateRangeCache.fetch(site, max_age=DATE_RANGE_RECHECK_AGE)
+            entry = DateRangeCache.get_cached(site)
+            bounds = (entry['start'], entry['end']) if entry else None
+            error = DateRangeValidator.check(start_date, end_date, bounds)
+        if error is None:
+            return None
+
+        field, value, message, ctx = error
+        print(f"[DATE_RANGE] 요청 거절 - {request.path}: {field}={value} ({message})")
+        if ctx and ctx.get('error') == 'out_of_range':
+            return jsonify({
+                'error': 'date_out_of_range',
+                'path': request.path,
+                'method': request.method,
+                'status': 400,
+                'detail': message,
+                'input': {'start': start_date, 'end': end_date},
+                'range': entry['data']
+            }), 400
+        return DateRangeValidator._invalid_request(field, value, message, ctx)
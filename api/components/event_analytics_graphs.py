@@ -1,9 +1,9 @@
 from flask import Blueprint, jsonify, request
-import requests
-import os
+from components.backend_registry import BackendRegistry, merge_ranges
+from components.refresh_hints import RefreshHintUtils
+from components.wire_format import WireFormat, encode_payload
 # 이벤트 분석 패널 블루프린트
 event_analytics_bp = Blueprint('event_analytics', __name__)
-BACKEND_URL = os.environ.get('BACKEND_URL', 'http://127.0.0.1:8000')
 
 @event_analytics_bp.route('/proxy/events/analytics')
 def proxy_events_analytics():
@@ -15,24 +15,24 @@ def proxy_events_analytics():
     if not start_date or not end_date:
         return jsonify({"error": "start and end parameters required"}), 400
 
-    try:
-        # 실제 백엔드 호출
-        backend_url = f"{BACKEND_URL}/api/v1/events/analytics?start={start_date}&end={end_date}&severity={severity}"
-        response = requests.get(backend_url, timeout=10)
+    # 실제 백엔드 호출 (사이트별 백엔드에 동시 팬아웃)
+    results = BackendRegistry.fan_out(
+        '/api/v1/events/analytics',
+        {'start': start_date, 'end': end_date, 'severity': severity},
+        site=request.args.get('site')
+    )
+    payloads = [result.data for result in results if result.ok]
 
-        if response.status_code == 200:
-            data = response.json()
-            print(f"[EVENT_ANALYTICS] API 호출 성공: {data}")
-            return jsonify(data)
-        else:
-            error_msg = f"Backend returned {response.status_code}"
-            print(f"[EVENT_ANALYTICS] API 오류: {error_msg}")
-            return jsonify({"error": error_msg}), response.status_code
+    if not payloads:
+        status_code, error_msg = BackendRegistry.first_error(results)
+        print(f"[EVENT_ANALYTICS] API 오류: {error_msg}")
+        return jsonify({"error": error_msg}), status_code
 
-    except requests.RequestException as e:
-        error_msg = f"Backend connection failed: {str(e)}"
-        print(f"[EVENT_ANALYTICS] 연결 오류: {error_msg}")
-        return jsonify({"error": error_msg}), 500
+    data = payloads[0] if len(payloads) == 1 else EventAnalyticsComponent.merge_analytics_data(payloads)
+    print(f"[EVENT_ANALYTICS] API 호출 성공: {data}")
+    response = WireFormat.respond(data, EventAnalyticsComponent.to_columnar)
+    response = RefreshHintUtils.apply(response, 'events_analytics', start_date, end_date, severity, data)
+    return BackendRegistry.mark_partial(response, results)
 
 
 class EventAnalyticsComponent:
@@ -76,6 +76,39 @@ class EventAnalyticsComponent:
 
         return complete_hours
 
+    @staticmethod
+    def to_columnar(raw_data):
+        """분석 응답을 컬럼형(struct-of-arrays) 구조로 인코딩
+
+        type_pie / hourly_bar 는 백엔드 행 스키마 그대로 인코딩하여 (타입 라벨/코드는
+        dict 인덱스) 복원 시 JSON 응답과 동일하며, 차트용 보정(24시간 채우기, 비율 계산)은
+        클라이언트 준비 단계에서 한다.
+        """
+        return encode_payload('analytics', raw_data, ('type_pie', 'hourly_bar'))
+
+    @staticmethod
+    def merge_analytics_data(payloads):
+        """여러 백엔드의 분석 응답을 하나로 병합 (타입별/시간대별 합산)"""
+        type_totals = {}
+        hourly_totals = {}
+
+        for payload in payloads:
+            for item in payload.get('type_pie', []):
+                key = item.get('type_code') or item.get('label', 'Unknown')
+                if key not in type_totals:
+                    type_totals[key] = dict(item, count=0)
+                type_totals[key]['count'] += item.get('count', 0)
+
+            for item in payload.get('hourly_bar', []):
+                hour = item.get('hour')
+                hourly_totals[hour] = hourly_totals.get(hour, 0) + item.get('count', 0)
+
+        return {
+            'type_pie': list(type_totals.values()),
+            'hourly_bar': [{'hour': hour, 'count': hourly_totals[hour]} for hour in sorted(hourly_totals)],
+            'range': merge_ranges(payload.get('range') for payload in payloads)
+        }
+
     @staticmethod
     def _calculate_percentage(value, total_data):
         """전체 대비 퍼센트 계산"""
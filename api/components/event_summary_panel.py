@@ -1,9 +1,34 @@
 from flask import Blueprint, jsonify, request
-import requests
 import os
+import random
+import threading
+from components.backend_registry import BackendRegistry, merge_ranges
+from components.date_range import parse_iso_date
+from components.refresh_hints import RefreshHintUtils
+from components.tracing import Tracing
 # 이벤트 요약 패널 블루프린트
 event_summary_bp = Blueprint('event_summary', __name__)
-BACKEND_URL = os.environ.get('BACKEND_URL', 'http://127.0.0.1:8000')
+
+# 채널 응답에서 요약을 계산하는 모드 (0 이면 항상 백엔드 요약 API 사용)
+# 현재 백엔드 채널 응답의 by_type 에는 severity 필드가 없어 계산되지 않으며 요약 API 를 그대로 사용한다
+SUMMARY_DERIVATION = os.environ.get('SUMMARY_DERIVATION', '1') != '0'
+# 계산된 요약을 백엔드 요약 API 와 대조하는 표본 비율
+SUMMARY_VERIFY_SAMPLE_RATE = float(os.environ.get('SUMMARY_VERIFY_SAMPLE_RATE', '0.05'))
+
+
+def fetch_events_summary(start_date, end_date, site=None):
+    """백엔드 요약 API 호출 (사이트별 동시 팬아웃 후 병합) - (data, results) 반환"""
+    results = BackendRegistry.fan_out(
+        '/api/v1/events/summary',
+        {'start': start_date, 'end': end_date},
+        site=site
+    )
+    payloads = [result.data for result in results if result.ok]
+
+    if not payloads:
+        return None, results
+    data = payloads[0] if len(payloads) == 1 else EventSummaryComponent.merge_summary_data(payloads)
+    return data, results
 
 @event_summary_bp.route('/proxy/events/summary')
 def proxy_events_summary():
@@ -14,24 +39,19 @@ def proxy_events_summary():
     if not start_date or not end_date:
         return jsonify({"error": "start and end parameters required"}), 400
 
-    try:
-        # 실제 백엔드 호출
-        backend_url = f"{BACKEND_URL}/api/v1/events/summary?start={start_date}&end={end_date}"
-        response = requests.get(backend_url, timeout=10)
+    # 실제 백엔드 호출 (사이트별 백엔드에 동시 팬아웃)
+    data, results = fetch_events_summary(start_date, end_date, site=request.args.get('site'))
 
-        if response.status_code == 200:
-            data = response.json()
-            print(f"[EVENT_SUMMARY] API 호출 성공: {data}")
-            return jsonify(data)
-        else:
-            error_msg = f"Backend returned {response.status_code}"
-            print(f"[EVENT_SUMMARY] API 오류: {error_msg}")
-            return jsonify({"error": error_msg}), response.status_code
+    if data is None:
+        status_code, error_msg = BackendRegistry.first_error(results)
+        print(f"[EVENT_SUMMARY] API 오류: {error_msg}")
+        return jsonify({"error": error_msg}), status_code
 
-    except requests.RequestException as e:
-        error_msg = f"Backend connection failed: {str(e)}"
-        print(f"[EVENT_SUMMARY] 연결 오류: {error_msg}")
-        return jsonify({"error": error_msg}), 500
+    print(f"[EVENT_SUMMARY] API 호출 성공: {data}")
+    with Tracing.span('serialize'):
+        response = jsonify(data)
+    response = RefreshHintUtils.apply(response, 'events_summary', start_date, end_date, 'all', data)
+    return BackendRegistry.mark_partial(response, results)
 
 
 class EventSummaryComponent:
@@ -61,24 +81,143 @@ class EventSummaryComponent:
             'range': raw_data.get('range', {'start': 'N/A', 'end': 'N/A'})
         }
 
+    @staticmethod
+    def classify_event_severity(event_type):
+        """백엔드가 준 이벤트 타입의 severity 필드 반환 - 없거나 알 수 없는 값이면 None
+
+        라벨/코드로 중요도를 추측하지 않으며, None 이면 백엔드 요약 API 를 사용한다.
+        """
+        severity = str(event_type.get('severity') or '').lower()
+        if severity in ('critical', 'warn', 'info'):
+            return severity
+        return None
+
+    @staticmethod
+    def derive_summary_from_channels(channels_data):
+        """채널 목록 응답(by_type)에서 요약 데이터 계산
+
+        모든 이벤트 타입에 백엔드 severity 필드가 있고 채널별 by_type 합계가
+        채널 총계와 일치할 때만 계산하며, 그렇지 않으면 None 을 반환한다.
+        """
+        if not channels_data or 'items' not in channels_data:
+            return None
+
+        counts = {'total': 0, 'critical': 0, 'warn': 0, 'info': 0}
+        for channel in channels_data['items']:
+            type_total = 0
+            for event_type in channel.get('by_type') or []:
+                severity = EventSummaryComponent.classify_event_severity(event_type)
+                if severity is None:
+                    return None
+                counts[severity] += event_type.get('count', 0)
+                type_total += event_type.get('count', 0)
+
+            if type_total != channel.get('count', 0):
+                return None
+            counts['total'] += channel.get('count', 0)
+
+        return {
+            'counts': counts,
+            'range': channels_data.get('range', {'start': 'N/A', 'end': 'N/A'})
+        }
+
+    @staticmethod
+    def derived_summary_payload(derived, severity='all'):
+        """계산된 요약을 요약 카드 형식(format_summary_data, get_severity_stats)으로 변환"""
+        formatted = EventSummaryComponent.format_summary_data(derived)
+        return {
+            'counts': get_severity_stats(derived, severity),
+            'range': formatted['range'],
+            'source': 'derived'
+        }
+
+    @staticmethod
+    def summaries_match(derived, backend):
+        """계산된 요약과 백엔드 요약의 건수 일치 여부"""
+        derived_counts = EventSummaryComponent.format_summary_data(derived)
+        backend_counts = EventSummaryComponent.format_summary_data(backend)
+        return all(derived_counts[key] == backend_counts[key] for key in ('total', 'critical', 'warn', 'info'))
+
+    @staticmethod
+    def resolve_summary_for_channels(channels_data, start_date, end_date, severity='all', site=None):
+        """채널 응답에 포함할 요약 데이터 결정 - 계산할 수 없으면 None
+
+        severity 가 all 이면 채널 응답에서 계산하여 요약 API 호출을 생략하고,
+        표본 비율만큼 백엔드 요약과 대조한다. 계산이 불가능하면 채널 요청 안에서
+        요약 API 를 호출하지 않고 None 을 반환한다 (클라이언트가 요약 API 를 별도 호출).
+        """
+        derived = None
+        if SUMMARY_DERIVATION and severity == 'all':
+            derived = EventSummaryComponent.derive_summary_from_channels(channels_data)
+
+        if derived is None:
+            SummaryDerivationStats.record('fallback')
+            return None
+
+        if random.random() >= SUMMARY_VERIFY_SAMPLE_RATE:
+            SummaryDerivationStats.record('derived')
+            return EventSummaryComponent.derived_summary_payload(derived, severity)
+
+        # 표본 대조
+        backend, _ = fetch_events_summary(start_date, end_date, site=site)
+        if backend is None:
+            SummaryDerivationStats.record('verify_failed')
+            return EventSummaryComponent.derived_summary_payload(derived, severity)
+        if EventSummaryComponent.summaries_match(derived, backend):
+            SummaryDerivationStats.record('verified')
+            return EventSummaryComponent.derived_summary_payload(derived, severity)
+
+        SummaryDerivationStats.record('mismatch')
+        print(f"[EVENT_SUMMARY] 계산된 요약 불일치 - derived: {derived['counts']}, backend: {backend.get('counts')}")
+        return dict(backend, source='backend')
+
+    @staticmethod
+    def merge_summary_data(payloads):
+        """여러 백엔드의 요약 응답을 하나로 병합"""
+        counts = {'total': 0, 'critical': 0, 'warn': 0, 'info': 0}
+        for payload in payloads:
+            for key in counts:
+                counts[key] += payload.get('counts', {}).get(key, 0)
+
+        return {
+            'counts': counts,
+            'range': merge_ranges(payload.get('range') for payload in payloads)
+        }
+
     @staticmethod
     def validate_date_range(start_date, end_date):
-        """날짜 범위 유효성 검사"""
+        """날짜 범위 유효성 검사 (파싱 결과는 parse_iso_date 에서 캐시)"""
         if not start_date or not end_date:
             return False, "시작일과 종료일이 필요합니다"
 
-        from datetime import datetime
-        try:
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
+        if start is None or end is None:
+            return False, "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
 
-            if start > end:
-                return False, "시작일이 종료일보다 늦을 수 없습니다"
+        if start > end:
+            return False, "시작일이 종료일보다 늦을 수 없습니다"
 
-            return True, "유효한 날짜 범위입니다"
+        return True, "유효한 날짜 범위입니다"
 
-        except ValueError:
-            return False, "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
+
+class SummaryDerivationStats:
+    """요약 계산 모드 통계 (계산/대조/불일치/대체 횟수)"""
+
+    _counts = {'derived': 0, 'verified': 0, 'mismatch': 0, 'verify_failed': 0, 'fallback': 0}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def record(outcome):
+        with SummaryDerivationStats._lock:
+            SummaryDerivationStats._counts[outcome] += 1
+
+    @staticmethod
+    def snapshot():
+        with SummaryDerivationStats._lock:
+            return dict(SummaryDerivationStats._counts,
+                        sample_rate=SUMMARY_VERIFY_SAMPLE_RATE,
+                        enabled=SUMMARY_DERIVATION)
 
 
 # 추가적인 유틸리티 함수들
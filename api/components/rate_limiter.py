@@ -0,0 +1,252 @@
+from collections import OrderedDict
+import json
+import math
+import os
+import threading
+import time
+from flask import g, jsonify, request
+
+# 요청 제한 상태(토큰 버킷, 동시 호출 슬롯)는 프로세스 메모리에만 있고 공유 저장소를 쓰지 않는다.
+# 상주 프로세스 1개로 실행할 때만 클라이언트별 제한과 전체 동시 호출 상한이 정확히 지켜지며,
+# 워커가 여러 개이면 워커 수만큼, Vercel 등 서버리스는 인스턴스 수만큼 한도가 늘어나고
+# 콜드 스타트마다 버킷이 초기화되므로 서버리스에서는 인스턴스 단위의 완화 장치로만 동작한다.
+
+# 클라이언트+라우트별 토큰 버킷 설정 (초당 보충 토큰 수 / 최대 버스트)
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', '1') != '0'
+RATE_LIMIT_RATE = float(os.environ.get('RATE_LIMIT_RATE', '1'))
+RATE_LIMIT_BURST = float(os.environ.get('RATE_LIMIT_BURST', '20'))
+# 라우트별 설정 (JSON 예시: {"proxy_channel_detail": [2, 40]})
+RATE_LIMIT_ROUTES = os.environ.get('RATE_LIMIT_ROUTES')
+# 앱 앞단의 신뢰하는 프록시 수 (ngrok/Vercel 등) - 0 이면 X-Forwarded-For 를 무시하고 접속 주소 사용
+# N 이면 X-Forwarded-For 의 오른쪽에서 N 번째 주소(신뢰 프록시가 기록한 주소)를 클라이언트로 사용
+RATE_LIMIT_TRUST_FORWARDED = int(os.environ.get('RATE_LIMIT_TRUST_FORWARDED', '0'))
+
+# 백엔드 동시 호출 상한 / 대기열 최대 대기 시간(초) / 거절 시 Retry-After(초)
+UPSTREAM_MAX_CONCURRENCY = int(os.environ.get('UPSTREAM_MAX_CONCURRENCY', '8'))
+UPSTREAM_QUEUE_TIMEOUT = float(os.environ.get('UPSTREAM_QUEUE_TIMEOUT', '5'))
+UPSTREAM_RETRY_AFTER = int(os.environ.get('UPSTREAM_RETRY_AFTER', '2'))
+
+# 제한 대상 경로 (백엔드를 호출하는 프록시 API)
+LIMITED_PATH_PREFIXES = ('/api/proxy/', '/api/date-range')
+
+
+class TokenBucket:
+    """초당 rate 개씩 보충되고 최대 burst 개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def consume(self):
+        """토큰 1개 소비 - 성공 시 0, 부족하면 다음 토큰까지 남은 시간(초) 반환"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else float(UPSTREAM_RETRY_AFTER)
+
+    def refund(self):
+        """캐시로 처리된 요청의 토큰 반환"""
+        self.tokens = min(self.burst, self.tokens + 1)
+
+
+class UpstreamGate:
+    """백엔드 전체 동시 호출 상한 - 슬롯이 없으면 마감 시간까지 대기열에서 대기
+
+    상한은 프로세스(서버리스 인스턴스)마다 따로 적용되므로 백엔드가 받는 전체
+    동시 호출 수는 최대 인스턴스 수 * UPSTREAM_MAX_CONCURRENCY 이다.
+    """
+
+    TIMEOUT_ERROR = "Upstream busy (queue deadline exceeded)"
+
+    _semaphore = threading.BoundedSemaphore(max(1, UPSTREAM_MAX_CONCURRENCY))
+    _lock = threading.Lock()
+    _stats = {'in_flight': 0, 'waiting': 0, 'max_waiting': 0, 'queued': 0, 'timeouts': 0, 'total_wait_ms': 0.0}
+
+    @staticmethod
+    def acquire(timeout=None):
+        """호출 슬롯 획득 (마감 시간 초과 시 False)"""
+        if UpstreamGate._semaphore.acquire(blocking=False):
+            with UpstreamGate._lock:
+                UpstreamGate._stats['in_flight'] += 1
+            return True
+
+        started = time.perf_counter()
+        with UpstreamGate._lock:
+            stats = UpstreamGate._stats
+            stats['waiting'] += 1
+            stats['queued'] += 1
+            stats['max_waiting'] = max(stats['max_waiting'], stats['waiting'])
+
+        acquired = UpstreamGate._semaphore.acquire(
+            timeout=UPSTREAM_QUEUE_TIMEOUT if timeout is None else timeout
+        )
+
+        with UpstreamGate._lock:
+            stats = UpstreamGate._stats
+            stats['waiting'] -= 1
+            stats['total_wait_ms'] += (time.perf_counter() - started) * 1000
+            if acquired:
+                stats['in_flight'] += 1
+            else:
+                stats['timeouts'] += 1
+        return acquired
+
+    @staticmethod
+    def release():
+        with UpstreamGate._lock:
+            UpstreamGate._stats['in_flight'] -= 1
+        UpstreamGate._semaphore.release()
+
+    @staticmethod
+    def snapshot():
+        with UpstreamGate._lock:
+            stats = dict(UpstreamGate._stats)
+        stats['total_wait_ms'] = round(stats['total_wait_ms'], 2)
+        stats['max_concurrency'] = UPSTREAM_MAX_CONCURRENCY
+        stats['queue_timeout_seconds'] = UPSTREAM_QUEUE_TIMEOUT
+        return stats
+
+
+class RateLimiter:
+    """프록시 API 요청 제한 유틸리티
+
+    클라이언트+라우트마다 토큰 버킷을 두어 한 클라이언트가 공유 백엔드를
+    독점하지 못하게 한다. 캐시로 처리된 응답(mark_cache_hit 호출, 304)은 토큰을
+    돌려주며, 캐시 확인 함수가 등록된 라우트는 버킷이 비어도 캐시 적중이면 통과시킨다.
+    버킷은 프로세스 메모리에 있어 서버리스에서는 요청이 닿은 인스턴스 안에서만 제한된다.
+    """
+
+    HEADER_NAME = 'Retry-After'
+    MAX_ENTRIES = 4096
+
+    _buckets = OrderedDict()
+    _route_limits = None
+    _cache_probes = {}
+    _lock = threading.Lock()
+    _stats = {'allowed': 0, 'exempt': 0, 'refunded': 0, 'rejected': {}}
+
+    @staticmethod
+    def get_client_id():
+        """요청 클라이언트 식별자 (신뢰 프록시 뒤에서는 프록시가 기록한 X-Forwarded-For 주소)
+
+        X-Forwarded-For 의 왼쪽 주소는 클라이언트가 임의로 넣을 수 있으므로
+        신뢰하는 프록시 수만큼 오른쪽에서 센 주소만 사용한다.
+        """
+        if RATE_LIMIT_TRUST_FORWARDED > 0:
+            hops = [hop.strip() for hop in request.headers.get('X-Forwarded-For', '').split(',') if hop.strip()]
+            if len(hops) >= RATE_LIMIT_TRUST_FORWARDED:
+                return hops[-RATE_LIMIT_TRUST_FORWARDED]
+        return request.remote_addr or 'unknown'
+
+    @staticmethod
+    def get_route_key():
+        """라우트 식별자 - 지연 로딩/블루프린트 등록 방식과 무관하게 뷰 함수 이름 사용"""
+        return (request.endpoint or request.path).rsplit('.', 1)[-1]
+
+    @staticmethod
+    def get_limits(route_key):
+        """라우트별 (초당 보충 토큰 수, 최대 버스트)"""
+        if RateLimiter._route_limits is None:
+            RateLimiter._route_limits = json.loads(RATE_LIMIT_ROUTES) if RATE_LIMIT_ROUTES else {}
+        rate, burst = RateLimiter._route_limits.get(route_key, (RATE_LIMIT_RATE, RATE_LIMIT_BURST))
+        return float(rate), float(burst)
+
+    @staticmethod
+    def register_cache_probe(route_key, probe):
+        """라우트의 캐시 적중 확인 함수 등록 - probe() 가 True 면 제한에서 제외"""
+        RateLimiter._cache_probes[route_key] = probe
+
+    @staticmethod
+    def mark_cache_hit():
+        """현재 요청이 백엔드 호출 없이 캐시로 처리되었음을 표시 (응답 후 토큰 반환)"""
+        g.rate_limit_cache_hit = True
+
+    @staticmethod
+    def _record_rejection(route_key, reason):
+        with RateLimiter._lock:
+            per_route = RateLimiter._stats['rejected'].setdefault(route_key, {})
+            per_route[reason] = per_route.get(reason, 0) + 1
+
+    @staticmethod
+    def _get_bucket(key, route_key):
+        bucket = RateLimiter._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(*RateLimiter.get_limits(route_key))
+            RateLimiter._buckets[key] = bucket
+        RateLimiter._buckets.move_to_end(key)
+        while len(RateLimiter._buckets) > RateLimiter.MAX_ENTRIES:
+            RateLimiter._buckets.popitem(last=False)
+        return bucket
+
+    @staticmethod
+    def before_request():
+        """요청 전 토큰 소비 - 부족하면 429 + Retry-After 응답"""
+        if not RATE_LIMIT_ENABLED or not request.path.startswith(LIMITED_PATH_PREFIXES):
+            return None
+
+        route_key = RateLimiter.get_route_key()
+        key = (RateLimiter.get_client_id(), route_key)
+
+        with RateLimiter._lock:
+            bucket = RateLimiter._get_bucket(key, route_key)
+            wait_seconds = bucket.consume()
+            if wait_seconds == 0:
+                RateLimiter._stats['allowed'] += 1
+                g.rate_limit_bucket = bucket
+                return None
+
+        probe = RateLimiter._cache_probes.get(route_key)
+        if probe is not None and probe():
+            with RateLimiter._lock:
+                RateLimiter._stats['exempt'] += 1
+            return None
+
+        RateLimiter._record_rejection(route_key, 'rate_limited')
+        retry_after = max(1, math.ceil(wait_seconds))
+        print(f"[RATE_LIMIT] 요청 제한 - client: {key[0]}, route: {route_key}, retry_after: {retry_after}s")
+        response = jsonify({
+            "error": "rate_limited",
+            "detail": f"Too many requests for {route_key}",
+            "retry_after": retry_after
+        })
+        response.status_code = 429
+        response.headers[RateLimiter.HEADER_NAME] = str(retry_after)
+        return response
+
+    @staticmethod
+    def after_request(response):
+        """캐시 응답이면 토큰 반환, 백엔드 혼잡(503) 응답에는 Retry-After 추가"""
+        bucket = g.pop('rate_limit_bucket', None)
+        cache_hit = g.pop('rate_limit_cache_hit', False)
+        if bucket is not None and (response.status_code == 304 or cache_hit):
+            with RateLimiter._lock:
+                bucket.refund()
+                RateLimiter._stats['refunded'] += 1
+
+        if (response.status_code == 503 and RateLimiter.HEADER_NAME not in response.headers
+                and request.path.startswith(LIMITED_PATH_PREFIXES)):
+            RateLimiter._record_rejection(RateLimiter.get_route_key(), 'upstream_busy')
+            response.headers[RateLimiter.HEADER_NAME] = str(UPSTREAM_RETRY_AFTER)
+        return response
+
+    @staticmethod
+    def snapshot():
+        """요청 제한 통계 (라우트별 거절 사유별 횟수 포함)"""
+        with RateLimiter._lock:
+            stats = {
+                'enabled': RATE_LIMIT_ENABLED,
+                'default_limits': {'rate': RATE_LIMIT_RATE, 'burst': RATE_LIMIT_BURST},
+                'tracked_clients': len(RateLimiter._buckets),
+                'allowed': RateLimiter._stats['allowed'],
+                'exempt': RateLimiter._stats['exempt'],
+                'refunded': RateLimiter._stats['refunded'],
+                'rejected': {route: dict(reasons) for route, reasons in RateLimiter._stats['rejected'].items()}
+            }
+        stats['upstream'] = UpstreamGate.snapshot()
+        return stats
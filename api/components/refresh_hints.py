@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import os
+import threading
+import time
+
+# 대시보드 기준 시간대 (기본 KST) - "오늘" 판단에 사용
+DASHBOARD_UTC_OFFSET = int(os.environ.get('DASHBOARD_UTC_OFFSET', '9'))
+
+
+class RefreshHintUtils:
+    """자동 새로고침 주기 힌트 계산 유틸리티
+
+    데이터가 마지막으로 바뀐 뒤 지난 시간과 조회 기간에 오늘이 포함되는지에 따라
+    다음 폴링까지의 권장 간격(초)을 X-Poll-Interval 헤더로 전달한다.
+    0 은 종료된 기간이므로 폴링이 필요 없음을 의미한다.
+
+    간격은 폴링 횟수가 아닌 시간 기준이므로 같은 키를 여러 클라이언트가 폴링해도
+    서로의 간격에 영향을 주지 않는다.
+    """
+
+    HEADER_NAME = 'X-Poll-Interval'
+
+    MIN_INTERVAL = 5
+    DEFAULT_INTERVAL = 30
+    MAX_INTERVAL = 120
+    FINISHED_INTERVAL = 0
+    # 마지막 변경 후 경과 시간 대비 권장 간격 비율
+    CHANGE_AGE_RATIO = 0.5
+
+    MAX_ENTRIES = 1024
+
+    _state = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_now():
+        """대시보드 기준 시간대의 현재 시각 반환"""
+        return datetime.now(timezone(timedelta(hours=DASHBOARD_UTC_OFFSET)))
+
+    @staticmethod
+    def get_today():
+        """대시보드 기준 시간대의 오늘 날짜 반환"""
+        return RefreshHintUtils.get_now().date()
+
+    @staticmethod
+    def hash_payload(data):
+        """응답 데이터 해시 생성"""
+        serialized = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def suggest_interval(route_key, start_date, end_date, severity, data):
+        """다음 폴링까지의 권장 간격(초) 계산"""
+        try:
+            start = datetime.strptime(start_date, '%Y-%m-%d').date()
+            end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            return RefreshHintUtils.DEFAULT_INTERVAL
+
+        today = RefreshHintUtils.get_today()
+        if end < today:
+            return RefreshHintUtils.FINISHED_INTERVAL
+        if start > today:
+            return RefreshHintUtils.MAX_INTERVAL
+
+        key = (route_key, start_date, end_date, severity)
+        data_hash = RefreshHintUtils.hash_payload(data)
+
+        now = time.monotonic()
+        with RefreshHintUtils._lock:
+            entry = RefreshHintUtils._state.get(key)
+            if entry is None:
+                # 처음 보는 키는 마지막 변경 시각을 알 수 없음
+                entry = {'hash': data_hash, 'last_changed_at': now, 'change_observed': False}
+                RefreshHintUtils._state[key] = entry
+            elif entry['hash'] != data_hash:
+                entry.update(hash=data_hash, last_changed_at=now, change_observed=True)
+
+            # 오래 변하지 않은 데이터일수록 간격을 늘림
+            interval = int((now - entry['last_changed_at']) * RefreshHintUtils.CHANGE_AGE_RATIO)
+            if not entry['change_observed']:
+                interval = max(interval, RefreshHintUtils.DEFAULT_INTERVAL)
+            interval = min(RefreshHintUtils.MAX_INTERVAL, max(RefreshHintUtils.MIN_INTERVAL, interval))
+
+            RefreshHintUtils._state.move_to_end(key)
+            while len(RefreshHintUtils._state) > RefreshHintUtils.MAX_ENTRIES:
+                RefreshHintUtils._state.popitem(last=False)
+
+        return interval
+
+    @staticmethod
+    def apply(response, route_key, start_date, end_date, severity, data):
+        """응답에 폴링 간격 힌트 헤더 추가"""
+        interval = RefreshHintUtils.suggest_interval(route_key, start_date, end_date, severity, data)
+        response.headers[RefreshHintUtils.HEADER_NAME] = str(interval)
+        return response
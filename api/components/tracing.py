@@ -0,0 +1,129 @@
+from contextlib import contextmanager
+import contextvars
+import os
+import re
+import threading
+import time
+import uuid
+from flask import g, request
+
+# 요청 추적 - 브라우저가 보낸 X-Trace-Id 를 백엔드까지 전달하고 Server-Timing 으로 구간별 시간 반환
+TRACE_HEADER = 'X-Trace-Id'
+# TRACE_LOG=1 이면 요청마다 추적 ID 와 구간별 시간을 로그로 출력
+TRACE_LOG = os.environ.get('TRACE_LOG', '0') == '1'
+
+# 외부에서 받은 추적 ID 허용 형식 (헤더 주입 방지)
+_TRACE_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{8,64}$')
+
+_current_trace = contextvars.ContextVar('voda_trace', default=None)
+
+
+class Trace:
+    """요청 1건의 추적 ID 와 구간별 누적 시간(ms)"""
+
+    # Server-Timing 헤더 구간 순서
+    SPAN_ORDER = ('cache', 'queue', 'upstream', 'parse', 'render', 'serialize')
+
+    def __init__(self, trace_id):
+        self.trace_id = trace_id
+        self.started = time.perf_counter()
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, duration_ms):
+        """구간 시간 누적 (팬아웃처럼 여러 번 호출되면 합계와 횟수 기록)"""
+        with self._lock:
+            total, count = self._spans.get(name, (0.0, 0))
+            self._spans[name] = (total + duration_ms, count + 1)
+
+    def server_timing(self):
+        """Server-Timing 헤더 값 생성"""
+        with self._lock:
+            spans = dict(self._spans)
+
+        names = [name for name in Trace.SPAN_ORDER if name in spans]
+        names += sorted(name for name in spans if name not in Trace.SPAN_ORDER)
+
+        parts = []
+        for name in names:
+            total, count = spans[name]
+            part = f"{name};dur={total:.2f}"
+            if count > 1:
+                part += f';desc="{count} calls"'
+            parts.append(part)
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ', '.join(parts)
+
+
+class Tracing:
+    """요청 추적 유틸리티"""
+
+    TIMING_HEADER = 'Server-Timing'
+
+    @staticmethod
+    def current():
+        """현재 요청의 Trace (추적 중이 아니면 None)"""
+        return _current_trace.get()
+
+    @staticmethod
+    def trace_id():
+        trace = _current_trace.get()
+        return trace.trace_id if trace is not None else None
+
+    @staticmethod
+    def outgoing_headers():
+        """백엔드 호출에 붙일 추적 헤더"""
+        trace = _current_trace.get()
+        return {TRACE_HEADER: trace.trace_id} if trace is not None else {}
+
+    @staticmethod
+    def add(name, duration_ms):
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add(name, duration_ms)
+
+    @staticmethod
+    @contextmanager
+    def span(name):
+        """with 블록 소요 시간을 구간 시간으로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            Tracing.add(name, (time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def propagate(func):
+        """다른 스레드(팬아웃 스레드 풀)에서도 현재 추적을 이어가도록 감싼 함수 반환"""
+        context = contextvars.copy_context()
+        return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+    @staticmethod
+    def before_request():
+        """요청 추적 시작 - 올바른 X-Trace-Id 가 없으면 새로 생성"""
+        if not request.path.startswith('/api/'):
+            return None
+
+        trace_id = request.headers.get(TRACE_HEADER, '')
+        if not _TRACE_ID_PATTERN.match(trace_id):
+            trace_id = uuid.uuid4().hex[:16]
+
+        g.trace = Trace(trace_id)
+        _current_trace.set(g.trace)
+        return None
+
+    @staticmethod
+    def after_request(response):
+        """응답에 추적 ID 와 Server-Timing 헤더 추가"""
+        trace = g.pop('trace', None)
+        if trace is None:
+            return response
+
+        server_timing = trace.server_timing()
+        response.headers[TRACE_HEADER] = trace.trace_id
+        response.headers.add(Tracing.TIMING_HEADER, server_timing)
+        _current_trace.set(None)
+
+        if TRACE_LOG:
+            print(f"[TRACE] {trace.trace_id} {request.method} {request.path} {response.status_code} - {server_timing}")
+        return response
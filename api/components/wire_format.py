@@ -0,0 +1,119 @@
+from flask import jsonify, request
+from components.tracing import Tracing
+
+# 컬럼형(struct-of-arrays) JSON 응답 MIME 타입 - Accept 헤더로 선택
+COLUMNAR_MIME = 'application/vnd.voda.columnar+json'
+COLUMNAR_FORMAT = 'columnar-v1'
+
+
+class StringDictionary:
+    """반복되는 문자열을 인덱스로 치환하는 문자열 사전"""
+
+    def __init__(self):
+        self.values = []
+        self._index = {}
+
+    def encode(self, value):
+        """문자열의 사전 인덱스 반환 (None 은 -1)"""
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.values)
+            self._index[value] = index
+            self.values.append(value)
+        return index
+
+
+def _is_nested_rows(value):
+    """행 목록(dict 의 리스트)인지 확인"""
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def encode_table(rows, strings):
+    """dict 행 목록을 컬럼형 테이블로 인코딩 (행 스키마 전체 보존)
+
+    - fields: 모든 행의 키 합집합 (처음 등장한 순서)
+    - 문자열(또는 None)만 담긴 컬럼은 사전 인덱스로 치환 (dict_fields)
+    - dict 리스트만 담긴 컬럼은 offsets 로 구간을 나눈 하위 테이블로 인코딩 (nested_fields)
+    - 키가 없는 행은 missing 에 행 번호로 기록하여 복원 시 키를 생략
+    """
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    table = {
+        'row_count': len(rows),
+        'fields': fields,
+        'dict_fields': [],
+        'nested_fields': [],
+        'missing': {},
+        'columns': {}
+    }
+
+    for field in fields:
+        missing_rows = [index for index, row in enumerate(rows) if field not in row]
+        if missing_rows:
+            table['missing'][field] = missing_rows
+        values = [row.get(field) for row in rows]
+        present = [row[field] for row in rows if field in row]
+
+        if all(_is_nested_rows(value) for value in present):
+            offsets = [0]
+            flattened = []
+            for value in values:
+                flattened.extend(value or [])
+                offsets.append(len(flattened))
+            table['nested_fields'].append(field)
+            table['columns'][field] = {'offsets': offsets, 'table': encode_table(flattened, strings)}
+        elif all(value is None or isinstance(value, str) for value in present):
+            table['dict_fields'].append(field)
+            table['columns'][field] = [strings.encode(value) for value in values]
+        else:
+            table['columns'][field] = values
+
+    return table
+
+
+def encode_payload(kind, raw_data, table_fields):
+    """응답 데이터를 컬럼형 구조로 인코딩
+
+    table_fields 중 행 목록인 필드는 encode_table 로 인코딩하여 tables 에 담고,
+    나머지 최상위 필드는 meta 로 그대로 전달하여 복원 시 JSON 응답과 동일하게 한다.
+    """
+    raw_data = raw_data or {}
+    strings = StringDictionary()
+    tables = {}
+    meta = {}
+    for key, value in raw_data.items():
+        if key in table_fields and _is_nested_rows(value):
+            tables[key] = encode_table(value, strings)
+        else:
+            meta[key] = value
+
+    return {
+        'format': COLUMNAR_FORMAT,
+        'kind': kind,
+        'dict': strings.values,
+        'tables': tables,
+        'meta': meta
+    }
+
+
+class WireFormat:
+    """응답 인코딩 협상 유틸리티"""
+
+    @staticmethod
+    def wants_columnar():
+        """클라이언트가 컬럼형 응답을 JSON 보다 우선하는지 확인"""
+        accept = request.accept_mimetypes
+        return accept[COLUMNAR_MIME] > 0 and accept[COLUMNAR_MIME] >= accept['application/json']
+
+    @staticmethod
+    def respond(data, columnar_encoder):
+        """Accept 헤더에 따라 일반 JSON 또는 컬럼형 JSON 응답 생성"""
+        with Tracing.span('serialize'):
+            if not WireFormat.wants_columnar():
+                response = jsonify(data)
+            else:
+                response = jsonify(columnar_encoder(data))
+                response.mimetype = COLUMNAR_MIME
+        response.headers['Vary'] = 'Accept'
+        return response
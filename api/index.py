@@ -1,52 +1,201 @@
 import os
 import sys
+import ast
+import time
+import importlib
+import importlib.util
+
+_startup_begin = time.perf_counter()
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+# 시작 프로파일 모드 - STARTUP_PROFILE=1 이면 모듈별 import 시간 출력
+STARTUP_PROFILE = os.environ.get('STARTUP_PROFILE', '0') == '1'
+# 지연 로딩 모드 - LAZY_IMPORTS=0 이면 기존처럼 시작 시 모든 블루프린트 등록
+LAZY_IMPORTS = os.environ.get('LAZY_IMPORTS', '1') != '0'
+# 채널 모니터 이벤트 스트림 사용 여부 (components.channel_monitor 와 같은 설정) - 대시보드 구독 여부 결정
+CHANNEL_MONITOR_ENABLED = os.environ.get('CHANNEL_MONITOR_ENABLED', '0') == '1'
+
+# 모듈별 import 소요 시간 (ms)
+STARTUP_TIMINGS = {}
+
+
+def _record_import_time(module_name, started):
+    """모듈 import 소요 시간 기록"""
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    STARTUP_TIMINGS[module_name] = elapsed_ms
+    if STARTUP_PROFILE:
+        print(f"[STARTUP] import {module_name}: {elapsed_ms}ms")
+    return elapsed_ms
+
+
+def _timed_import(module_name):
+    """소요 시간을 기록하며 모듈 import"""
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if module_name not in STARTUP_TIMINGS:
+        _record_import_time(module_name, started)
+    return module
+
+
+_flask_started = time.perf_counter()
 from flask import Flask, render_template_string, jsonify, request
-from components.event_summary_panel import event_summary_bp
-from components.event_analytics_graphs import event_analytics_bp
-from components.channel_stats_panel import channel_stats_bp
-from components.channel_detail_modal import channel_detail_bp
-import requests
+_record_import_time('flask', _flask_started)
 
 app = Flask(__name__, static_folder='../static')
 
-# 백엔드 URL - 환경변수에서 가져오기 (Vercel 설정에서 추가)
-BACKEND_URL = os.environ.get('BACKEND_URL', 'http://127.0.0.1:8000')
+class LazyView:
+    """첫 요청 시점에 컴포넌트 모듈을 import 하는 뷰 래퍼"""
+
+    def __init__(self, import_name):
+        self.__module__, self.__name__ = import_name.rsplit('.', 1)
+        self.import_name = import_name
+        self._view = None
+
+    def _load(self):
+        if self._view is None:
+            module = _timed_import(self.__module__)
+            self._view = getattr(module, self.__name__)
+        return self._view
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+
+# 컴포넌트 블루프린트 목록 (모듈, 블루프린트 변수명) - 라우트는 각 블루프린트에만 정의
+COMPONENT_BLUEPRINTS = [
+    ('components.event_summary_panel', 'event_summary_bp'),
+    ('components.event_analytics_graphs', 'event_analytics_bp'),
+    ('components.channel_stats_panel', 'channel_stats_bp'),
+    ('components.channel_detail_modal', 'channel_detail_bp'),
+    ('components.channel_monitor', 'channel_monitor_bp'),
+]
+BLUEPRINT_URL_PREFIX = '/api'
+
+
+def _literal(node, default=None):
+    """AST 노드의 리터럴 값 (리터럴이 아니면 기본값)"""
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return default
+
+
+def discover_blueprint_routes(module_name, blueprint_attr):
+    """모듈을 import 하지 않고 소스에서 블루프린트 라우트 목록 추출
+
+    `@<blueprint>.route(rule, methods=...)` 데코레이터를 읽어 (rule, 함수명, methods) 반환
+    """
+    spec = importlib.util.find_spec(module_name)
+    with open(spec.origin, encoding='utf-8') as source_file:
+        tree = ast.parse(source_file.read(), filename=spec.origin)
+
+    routes = []
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if not (isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Attribute)
+                    and decorator.func.attr == 'route'
+                    and isinstance(decorator.func.value, ast.Name)
+                    and decorator.func.value.id == blueprint_attr
+                    and decorator.args):
+                continue
+            rule = _literal(decorator.args[0])
+            if not isinstance(rule, str):
+                raise RuntimeError(f"{module_name}.{node.name}: 라우트 규칙은 문자열 리터럴이어야 합니다")
+            options = {kw.arg: _literal(kw.value) for kw in decorator.keywords if kw.arg}
+            routes.append((rule, node.name, options.get('methods')))
+    return routes
+
 
 # 컴포넌트 블루프린트 등록
-app.register_blueprint(event_summary_bp, url_prefix='/api')
-app.register_blueprint(event_analytics_bp, url_prefix='/api')
-app.register_blueprint(channel_stats_bp, url_prefix='/api')
-app.register_blueprint(channel_detail_bp, url_prefix='/api')
+if LAZY_IMPORTS:
+    for module_name, blueprint_attr in COMPONENT_BLUEPRINTS:
+        for rule, function_name, methods in discover_blueprint_routes(module_name, blueprint_attr):
+            app.add_url_rule(BLUEPRINT_URL_PREFIX + rule, endpoint=function_name, methods=methods,
+                             view_func=LazyView(f"{module_name}.{function_name}"))
+else:
+    for module_name, blueprint_attr in COMPONENT_BLUEPRINTS:
+        blueprint = getattr(_timed_import(module_name), blueprint_attr)
+        app.register_blueprint(blueprint, url_prefix=BLUEPRINT_URL_PREFIX)
+
+
+# 요청 추적 (X-Trace-Id 전달, Server-Timing 구간별 시간) - 요청 제한보다 먼저 등록하여
+# 제한된 요청도 추적하고 after_request 는 가장 마지막에 실행되도록 함
+tracing = _timed_import('components.tracing')
+app.before_request(tracing.Tracing.before_request)
+app.after_request(tracing.Tracing.after_request)
+
+# 프록시 API 요청 제한 (클라이언트+라우트별 토큰 버킷, 백엔드 동시 호출 상한)
+rate_limiter = _timed_import('components.rate_limiter')
+app.before_request(rate_limiter.RateLimiter.before_request)
+app.after_request(rate_limiter.RateLimiter.after_request)
+
+
+def _date_range_cached():
+    """날짜 범위 캐시 적중 여부 (캐시 응답은 요청 제한에서 제외)"""
+    date_range = sys.modules.get('components.date_range')
+    return date_range is not None and date_range.DateRangeCache.get_cached(request.args.get('site')) is not None
+
+
+rate_limiter.RateLimiter.register_cache_probe('get_date_range', _date_range_cached)
+
+
+# 프록시 요청 날짜 중앙 검증 (형식/순서/조회 가능 범위) - 첫 프록시 요청 시 모듈 import
+@app.before_request
+def validate_proxy_dates():
+    if not request.path.startswith('/api/proxy/'):
+        return None
+    return _timed_import('components.date_range').DateRangeValidator.before_request()
 
 
 # 날짜 범위 API 라우트
 @app.route('/api/date-range')
 def get_date_range():
-    """날짜 범위 조회 API 프록시"""
-    try:
-        response = requests.get(f"{BACKEND_URL}/api/v1/date-range", timeout=10)
-        if response.ok:
-            data = response.json()
-            print(f"[DATE_RANGE] API 호출 성공: {data}")
-            return jsonify(data)
-        else:
-            error_msg = f"Backend returned {response.status_code}"
-            print(f"[DATE_RANGE] API 오류: {error_msg}")
-            return jsonify({"error": error_msg}), response.status_code
-    except requests.RequestException as e:
-        error_msg = f"Connection error: {str(e)}"
-        print(f"[DATE_RANGE] 연결 오류: {error_msg}")
-        return jsonify({"error": error_msg}), 500
+    """날짜 범위 조회 API 프록시 (여러 사이트면 전체 범위로 병합, 사이트별로 몇 분간 캐시)"""
+    date_range = _timed_import('components.date_range')
+    site = request.args.get('site')
+    # 캐시 조회 시간만 cache 구간으로 기록 (미스 시 팬아웃은 upstream 구간에 기록됨)
+    with tracing.Tracing.span('cache'):
+        entry = date_range.DateRangeCache.get_cached(site)
+
+    if entry is not None:
+        data, results, cache_hit = entry['data'], entry['results'], True
+    else:
+        data, results, cache_hit = date_range.DateRangeCache.fetch(site)
+
+    if data is None:
+        status_code, error_msg = date_range.BackendRegistry.first_error(results)
+        print(f"[DATE_RANGE] API 오류: {error_msg}")
+        return jsonify({"error": error_msg}), status_code
+
+    print(f"[DATE_RANGE] {'캐시 적중' if cache_hit else 'API 호출 성공'}: {data}")
+    with tracing.Tracing.span('serialize'):
+        response = jsonify(data)
+    response.headers['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+    if cache_hit:
+        rate_limiter.RateLimiter.mark_cache_hit()
+    entry = date_range.DateRangeCache.get_cached(site)
+    max_age = date_range.DateRangeCache.remaining_ttl(entry) if entry else 0
+    response.headers['Cache-Control'] = f"private, max-age={max_age}"
+    return date_range.BackendRegistry.mark_partial(response, results)
 
 
 @app.route('/')
 def dashboard():
-    """통합 대시보드 메인 페이지"""
-    return render_template_string(HTML_TEMPLATE)
+    """통합 대시보드 메인 페이지
+
+    날짜 범위가 캐시되어 있으면 페이지에 포함하여 별도 조회를 생략하고,
+    없으면 백엔드 조회로 페이지 응답을 늦추지 않도록 클라이언트가 /api/date-range 로 조회
+    (캐시 모듈이 아직 로드되지 않았으면 캐시도 비어 있으므로 import 하지 않음)
+    """
+    date_range = sys.modules.get('components.date_range')
+    entry = date_range.DateRangeCache.get_cached() if date_range is not None else None
+    data = entry['data'] if entry else None
+    return render_template_string(HTML_TEMPLATE, date_range=data, channel_events=CHANNEL_MONITOR_ENABLED)
 
 
 # 헬스체크 엔드포인트
@@ -70,6 +219,48 @@ def debug_routes():
     return {'routes': routes}
 
 
+# 백엔드 레지스트리 상태 확인용 디버그 라우트
+@app.route('/api/debug/backends')
+def debug_backends():
+    """백엔드별 라우팅 설정 및 헬스 상태 확인용"""
+    registry = _timed_import('components.backend_registry')
+    return jsonify({'backends': [backend.to_dict() for backend in registry.BackendRegistry.get_backends()]})
+
+
+# 요약 계산 모드 통계 확인용 디버그 라우트
+@app.route('/api/debug/summary-derivation')
+def debug_summary_derivation():
+    """채널 응답 기반 요약 계산/대조/불일치 횟수 확인용"""
+    summary_panel = _timed_import('components.event_summary_panel')
+    return jsonify(summary_panel.SummaryDerivationStats.snapshot())
+
+
+# 요청 제한 통계 확인용 디버그 라우트
+@app.route('/api/debug/rate-limits')
+def debug_rate_limits():
+    """라우트별 요청 제한 거절 횟수 및 백엔드 대기열 상태 확인용"""
+    return jsonify(rate_limiter.RateLimiter.snapshot())
+
+
+# 채널 모니터 상태 확인용 디버그 라우트
+@app.route('/api/debug/channel-monitor')
+def debug_channel_monitor():
+    """채널 상태 변경/이상 징후 평가 통계 및 최근 이벤트 확인용"""
+    channel_monitor = _timed_import('components.channel_monitor')
+    return jsonify(channel_monitor.ChannelMonitor.snapshot())
+
+
+# 시작 프로파일 확인용 디버그 라우트
+@app.route('/api/debug/startup')
+def debug_startup():
+    """모듈별 import 소요 시간 확인용"""
+    return jsonify({
+        'lazy_imports': LAZY_IMPORTS,
+        'startup_ms': STARTUP_TOTAL_MS,
+        'imports_ms': STARTUP_TIMINGS
+    })
+
+
 # HTML 템플릿
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -189,6 +380,11 @@ HTML_TEMPLATE = '''
                         </div>
                     </div>
                 </div>
+
+                <div class="archive-section">
+                    <h3 class="section-title" id="archiveTitle">이벤트 로그 현황 아카이브</h3>
+                    <div id="archiveContent"></div>
+                </div>
             </div>
         </div>
     </div>
@@ -196,12 +392,20 @@ HTML_TEMPLATE = '''
     <!-- 툴팁 -->
     <div class="tooltip" id="tooltip" style="display: none;"></div>
 
+    <script src="/static/render_prep.js"></script>
+    <script>window.DASHBOARD_DATE_RANGE = {{ date_range | tojson }};</script>
+    <script>window.DASHBOARD_CHANNEL_EVENTS = {{ channel_events | tojson }};</script>
     <script src="/static/dashboard.js"></script>
 </body>
 </html>
 '''
 
 
+STARTUP_TOTAL_MS = round((time.perf_counter() - _startup_begin) * 1000, 2)
+if STARTUP_PROFILE:
+    print(f"[STARTUP] 전체 시작 시간: {STARTUP_TOTAL_MS}ms")
+
+
 # Vercel serverless function handler
 def handler(request):
     with app.request_context(request.environ):
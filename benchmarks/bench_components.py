@@ -0,0 +1,75 @@
+"""컴포넌트 포맷 함수 마이크로벤치마크
+
+EventAnalyticsComponent, ChannelStatsComponent 의 포맷/통계 함수를
+가짜 백엔드 데이터로 반복 실행하여 호출당 소요 시간을 측정한다.
+
+사용 예:
+    python benchmarks/bench_components.py --channels 500 --types 10
+    python benchmarks/bench_components.py --baseline benchmarks/results/components-<rev>.json
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'api'))
+
+from common import compare_results, save_results
+from fake_backend import FakeBackendData
+from components.event_analytics_graphs import EventAnalyticsComponent
+from components.channel_stats_panel import ChannelStatsComponent
+
+
+def build_cases(data):
+    """벤치마크 대상 함수와 입력 데이터 구성"""
+    analytics = data.events_analytics('2025-08-01', '2025-08-31')
+    channels_raw = data.channels('2025-08-01', '2025-08-31')
+    hourly = EventAnalyticsComponent.format_hourly_bar_data(analytics)
+    grid = ChannelStatsComponent.format_channel_grid_data(channels_raw)
+
+    return {
+        'analytics.format_type_pie_data': lambda: EventAnalyticsComponent.format_type_pie_data(analytics),
+        'analytics.format_hourly_bar_data': lambda: EventAnalyticsComponent.format_hourly_bar_data(analytics),
+        'analytics.get_peak_hour': lambda: EventAnalyticsComponent.get_peak_hour(hourly),
+        'analytics.get_severity_distribution': lambda: EventAnalyticsComponent.get_severity_distribution(analytics),
+        'analytics.get_active_hours': lambda: EventAnalyticsComponent.get_active_hours(hourly),
+        'channels.format_channel_grid_data': lambda: ChannelStatsComponent.format_channel_grid_data(channels_raw),
+        'channels.get_channel_status_summary': lambda: ChannelStatsComponent.get_channel_status_summary(grid),
+        'channels.get_top_active_channels': lambda: ChannelStatsComponent.get_top_active_channels(grid),
+        'channels.calculate_channel_event_distribution':
+            lambda: ChannelStatsComponent.calculate_channel_event_distribution(grid),
+        'channels.get_channel_tooltip_data': lambda: [ChannelStatsComponent.get_channel_tooltip_data(ch) for ch in grid],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='컴포넌트 포맷 함수 마이크로벤치마크')
+    parser.add_argument('--channels', type=int, default=500)
+    parser.add_argument('--types', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--no-save', action='store_true', help='결과 파일 저장 안 함')
+    args = parser.parse_args()
+
+    config = {'channels': args.channels, 'types': args.types, 'repeat': args.repeat, 'number': args.number}
+    cases = build_cases(FakeBackendData(channel_count=args.channels, type_count=args.types))
+
+    results = {}
+    for name, func in cases.items():
+        timings = timeit.repeat(func, repeat=args.repeat, number=args.number)
+        results[name] = {
+            'best_us': round(min(timings) / args.number * 1e6, 2),
+            'mean_us': round(sum(timings) / len(timings) / args.number * 1e6, 2)
+        }
+        print(f"{name:<50}{results[name]['best_us']:>12} us{results[name]['mean_us']:>12} us")
+
+    if not args.no_save:
+        print(f"\n결과 저장: {save_results('components', results, config)}")
+    if args.baseline:
+        compare_results(args.baseline, results, 'best_us')
+
+
+if __name__ == '__main__':
+    main()
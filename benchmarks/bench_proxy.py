@@ -0,0 +1,170 @@
+"""프록시 레이어 부하 벤치마크
+
+가짜 백엔드와 Flask 앱을 로컬에서 띄운 뒤 지정한 동시성으로 각 라우트를 호출하여
+p50/p95/p99 지연 시간, 처리량, RSS 를 측정한다. 앱은 별도 프로세스로 실행하여
+부하 생성기와 가짜 백엔드를 제외한 앱 프로세스의 RSS 만 측정한다.
+
+사용 예:
+    python benchmarks/bench_proxy.py --concurrency 8 --requests 200 --latency-ms 20 --channels 500
+    python benchmarks/bench_proxy.py --baseline benchmarks/results/proxy-<rev>.json
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'api'))
+
+from common import compare_results, get_rss_mb, percentile, save_results
+from fake_backend import start_fake_backend
+
+QUERY = 'start=2025-08-01&end=2025-08-31&severity=all'
+
+ROUTES = {
+    'health': '/health',
+    'dashboard': '/',
+    'date_range': '/api/date-range',
+    'events_summary': f'/api/proxy/events/summary?{QUERY}',
+    'events_analytics': f'/api/proxy/events/analytics?{QUERY}',
+    'channels': f'/api/proxy/channels?{QUERY}',
+    'channel_detail': f'/api/proxy/channels/1?{QUERY}',
+    'channel_fragments': f'/api/proxy/channels/1/fragments?{QUERY}',
+}
+
+
+def serve_app(backend_url):
+    """(자식 프로세스) BACKEND_URL 을 가짜 백엔드로 지정한 뒤 Flask 앱 서버 실행
+
+    바인딩된 포트를 stdout 첫 줄로 알린 뒤 이후 출력은 버림
+    """
+    os.environ['BACKEND_URL'] = backend_url
+    # 단일 클라이언트로 부하를 주므로 요청 제한은 끄고 측정
+    os.environ.setdefault('RATE_LIMIT_ENABLED', '0')
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    from werkzeug.serving import make_server
+    import index
+
+    server = make_server('127.0.0.1', 0, index.app, threaded=True)
+    print(server.server_port, flush=True)
+    # 프록시의 응답 로그가 파이프를 채워 앱이 멈추지 않도록 stdout 을 버림
+    sys.stdout = open(os.devnull, 'w')
+    server.serve_forever()
+
+
+def start_app_server(backend_url):
+    """Flask 앱을 별도 프로세스로 시작하고 (프로세스, URL) 반환"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--serve-app', backend_url],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    port_line = process.stdout.readline().strip()
+    if not port_line.isdigit():
+        process.kill()
+        raise RuntimeError(f"앱 서버 시작 실패 (exit={process.poll()})")
+    return process, f"http://127.0.0.1:{port_line}"
+
+
+def stop_app_server(process):
+    """앱 서버 프로세스 종료"""
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _timed_get(url):
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            body = response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status = e.code
+    return (time.perf_counter() - started) * 1000, status, len(body)
+
+
+def run_route(base_url, path, total_requests, concurrency, app_pid):
+    """단일 라우트에 대해 동시 요청 실행 후 통계 반환 (RSS 는 앱 프로세스 기준)"""
+    url = f"{base_url}{path}"
+    _timed_get(url)  # 워밍업 (지연 로딩 모듈 import 포함)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(lambda _: _timed_get(url), range(total_requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [sample[0] for sample in samples]
+    errors = sum(1 for sample in samples if sample[1] >= 400)
+    return {
+        'requests': total_requests,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'throughput_rps': round(total_requests / elapsed, 1) if elapsed > 0 else 0,
+        'response_bytes': samples[-1][2] if samples else 0,
+        'rss_mb': get_rss_mb(app_pid)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='프록시 레이어 부하 벤치마크')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='라우트별 요청 수')
+    parser.add_argument('--latency-ms', type=float, default=10, help='가짜 백엔드 응답 지연')
+    parser.add_argument('--channels', type=int, default=64, help='가짜 백엔드 채널 수')
+    parser.add_argument('--types', type=int, default=5, help='채널별 이벤트 타입 수 (페이로드 크기)')
+    parser.add_argument('--routes', default=','.join(ROUTES), help='측정할 라우트 (쉼표 구분)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--no-save', action='store_true', help='결과 파일 저장 안 함')
+    parser.add_argument('--serve-app', metavar='BACKEND_URL', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_app:
+        serve_app(args.serve_app)
+        return
+
+    config = {
+        'concurrency': args.concurrency,
+        'requests': args.requests,
+        'latency_ms': args.latency_ms,
+        'channels': args.channels,
+        'types': args.types
+    }
+
+    backend, backend_url = start_fake_backend(
+        latency_ms=args.latency_ms, channel_count=args.channels, type_count=args.types
+    )
+    app_process, app_url = start_app_server(backend_url)
+
+    results = {}
+    try:
+        for name in args.routes.split(','):
+            results[name] = run_route(app_url, ROUTES[name], args.requests, args.concurrency, app_process.pid)
+    finally:
+        stop_app_server(app_process)
+        backend.shutdown()
+
+    print(f"{'route':<20}{'p50':>9}{'p95':>9}{'p99':>9}{'rps':>9}{'bytes':>10}{'rss_mb':>9}{'err':>6}")
+    for name, stats in results.items():
+        print(f"{name:<20}{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+              f"{stats['throughput_rps']:>9}{stats['response_bytes']:>10}{stats['rss_mb'] or '-':>9}{stats['errors']:>6}")
+
+    if not args.no_save:
+        print(f"\n결과 저장: {save_results('proxy', results, config)}")
+    if args.baseline:
+        compare_results(args.baseline, results, 'p95_ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""벤치마크 결과 저장 및 리비전 간 비교 유틸리티"""
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def get_revision():
+    """현재 git 리비전 (short hash) 반환"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def get_rss_mb(pid=None):
+    """프로세스 RSS (MB) 반환 - pid 미지정 시 현재 프로세스"""
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return round(int(line.split()[1]) / 1024, 2)
+    except OSError:
+        pass
+
+    if pid is not None:
+        # /proc 이 없는 환경에서는 다른 프로세스의 RSS 를 읽을 수 없음
+        return None
+
+    import resource
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2)
+
+
+def percentile(values, pct):
+    """정렬된 값 목록에서 백분위수 계산 (nearest-rank)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def save_results(suite, results, config):
+    """결과를 results/<suite>-<revision>.json 으로 저장"""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    revision = get_revision()
+    path = os.path.join(RESULTS_DIR, f"{suite}-{revision}.json")
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump({
+            'suite': suite,
+            'revision': revision,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'config': config,
+            'results': results
+        }, output, ensure_ascii=False, indent=2)
+    return path
+
+
+def compare_results(baseline_path, results, metric):
+    """기준 결과 파일과 비교하여 항목별 변화율 출력"""
+    with open(baseline_path, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    print(f"\n기준 리비전 {baseline['revision']} 대비 {metric} 변화:")
+    for name, current in results.items():
+        previous = baseline['results'].get(name)
+        if not previous or not previous.get(metric):
+            print(f"  {name:<40} (기준 없음)")
+            continue
+        change = (current[metric] - previous[metric]) / previous[metric] * 100
+        print(f"  {name:<40} {previous[metric]:>10} -> {current[metric]:>10} ({change:+.1f}%)")
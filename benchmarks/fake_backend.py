@@ -0,0 +1,164 @@
+"""벤치마크용 로컬 가짜 NVR 백엔드
+
+/api/v1/date-range, /events/summary, /events/analytics, /channels, /channels/<id>
+엔드포인트를 흉내내며 지연 시간, 페이로드 크기, 채널 수를 조절할 수 있다.
+
+단독 실행:
+    python benchmarks/fake_backend.py --port 8000 --latency-ms 20 --channels 500
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+EVENT_TYPES = [
+    ('FIRE', '화재'), ('SMOKE', '연기'), ('INTRUSION', '침입'), ('FALL', '쓰러짐'),
+    ('HELMET', '안전모 미착용'), ('VEST', '안전조끼 미착용'), ('FORKLIFT', '지게차 접근'),
+    ('CROWD', '밀집'), ('LOITER', '배회'), ('SPILL', '누출')
+]
+
+
+class FakeBackendData:
+    """가짜 백엔드 응답 데이터 생성기 (seed 고정으로 재현 가능)"""
+
+    def __init__(self, channel_count=16, type_count=5, seed=42):
+        self.channel_count = channel_count
+        self.type_count = max(1, min(type_count, len(EVENT_TYPES)))
+        self.seed = seed
+        self._channels = self._build_channels()
+        # 최근 요청 (경로, X-Trace-Id) - 추적 헤더 전달 확인용
+        self.received = deque(maxlen=256)
+
+    def _build_channels(self):
+        rng = random.Random(self.seed)
+        channels = []
+        for ch in range(1, self.channel_count + 1):
+            by_type = []
+            for type_code, label in EVENT_TYPES[:self.type_count]:
+                by_type.append({'type_code': type_code, 'label': label, 'count': rng.randint(0, 50)})
+            critical = rng.randint(0, 30)
+            warn = rng.randint(0, 30)
+            info = rng.randint(0, 30)
+            channels.append({
+                'channel_id': str(ch),
+                'name': f"CH{str(ch).zfill(2)}",
+                'count': sum(item['count'] for item in by_type),
+                'status': 'ON' if rng.random() > 0.1 else 'OFF',
+                'by_type': by_type,
+                'counts': {'total': critical + warn + info, 'critical': critical, 'warn': warn, 'info': info},
+                'fov_location_name': f"설비 {ch}",
+                'area_name': f"공정 {(ch - 1) // 10 + 1}",
+                'emap_image_url': 'emap_1.png',
+                'fov_thumbnail_url': 'thumb_1.png'
+            })
+        return channels
+
+    def date_range(self):
+        return {'start': '2025-07-26', 'end': '2025-09-24'}
+
+    def events_summary(self, start, end):
+        counts = {'total': 0, 'critical': 0, 'warn': 0, 'info': 0}
+        for channel in self._channels:
+            for key in counts:
+                counts[key] += channel['counts'][key]
+        return {'counts': counts, 'range': {'start': start, 'end': end}}
+
+    def events_analytics(self, start, end):
+        rng = random.Random(self.seed + 1)
+        type_pie = []
+        for index, (type_code, label) in enumerate(EVENT_TYPES[:self.type_count]):
+            type_pie.append({
+                'type_code': type_code,
+                'label': label,
+                'count': sum(ch['by_type'][index]['count'] for ch in self._channels)
+            })
+        hourly_bar = [{'hour': hour, 'count': rng.randint(0, 20 * self.channel_count)} for hour in range(24)]
+        return {'type_pie': type_pie, 'hourly_bar': hourly_bar, 'range': {'start': start, 'end': end}}
+
+    def channels(self, start, end):
+        items = [
+            {key: ch[key] for key in ('channel_id', 'name', 'count', 'status', 'by_type')}
+            for ch in self._channels
+        ]
+        return {'items': items, 'range': {'start': start, 'end': end}}
+
+    def channel_detail(self, channel_id, start, end):
+        for channel in self._channels:
+            if channel['channel_id'] == str(channel_id):
+                return dict(channel, range={'start': start, 'end': end})
+        return None
+
+
+def _make_handler(data, latency_ms):
+    class FakeBackendHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if latency_ms > 0:
+                time.sleep(latency_ms / 1000)
+
+            parsed = urlparse(self.path)
+            params = dict(pair.split('=', 1) for pair in parsed.query.split('&') if '=' in pair)
+            start = params.get('start', '2025-07-26')
+            end = params.get('end', '2025-09-24')
+            path = parsed.path.rstrip('/')
+            data.received.append((path, self.headers.get('X-Trace-Id')))
+
+            if path == '/api/v1/date-range':
+                return self._send_json(200, data.date_range())
+            if path == '/api/v1/events/summary':
+                return self._send_json(200, data.events_summary(start, end))
+            if path == '/api/v1/events/analytics':
+                return self._send_json(200, data.events_analytics(start, end))
+            if path == '/api/v1/channels':
+                return self._send_json(200, data.channels(start, end))
+            if path.startswith('/api/v1/channels/'):
+                detail = data.channel_detail(path.rsplit('/', 1)[1], start, end)
+                if detail is None:
+                    return self._send_json(404, {'error': 'not_found', 'path': path})
+                return self._send_json(200, detail)
+
+            return self._send_json(404, {'error': 'not_found', 'path': path})
+
+    return FakeBackendHandler
+
+
+def start_fake_backend(host='127.0.0.1', port=0, latency_ms=0, channel_count=16, type_count=5):
+    """백그라운드 스레드로 가짜 백엔드 시작 - (server, base_url) 반환"""
+    data = FakeBackendData(channel_count=channel_count, type_count=type_count)
+    server = ThreadingHTTPServer((host, port), _make_handler(data, latency_ms))
+    server.daemon_threads = True
+    server.data = data
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VODA NVR 가짜 백엔드')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--channels', type=int, default=16)
+    parser.add_argument('--types', type=int, default=5)
+    args = parser.parse_args()
+
+    server, url = start_fake_backend(args.host, args.port, args.latency_ms, args.channels, args.types)
+    print(f"[FAKE_BACKEND] {url} 에서 실행 중 (채널 {args.channels}개, 지연 {args.latency_ms}ms)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
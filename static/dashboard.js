@@ -1,11 +1,21 @@
 // 전역 변수
-let autoRefreshInterval = null;
+let autoRefreshTimer = null;
+let autoRefreshEnabled = false;
+let lastDataLoadAt = 0;
+let dataLoadGeneration = 0; // loadAllData 호출 세대 - 이전 조회의 늦은 응답/재검증 무시용
+let serverDerivesSummary = false; // 서버가 채널 응답에서 요약을 계산해 주는지 (확인 전까지는 요약 API 별도 호출)
 let eventTypeChart = null;
 let hourlyChart = null;
+let hourlyChartSeverity = 'all';
 let dateRange = { start: null, end: null }
 let currentSeverityFilter = 'all'; 
 let focusedElementBeforeModal;
 
+// 자동 새로고침 주기 설정 (서버의 X-Poll-Interval 힌트로 조정됨)
+const AUTO_REFRESH_DEFAULT_MS = 30000;
+const AUTO_REFRESH_HIDDEN_MULTIPLIER = 4;
+let suggestedPollIntervalMs = AUTO_REFRESH_DEFAULT_MS;
+
 // ========== 새로 추가된 오류 처리 함수들 ==========
 
 // 백엔드 오류 응답을 한국어로 변환하는 함수
@@ -91,12 +101,22 @@ function translateBackendError(errorData, statusCode) {
             userMessage = '잘못된 요청입니다. 입력값을 확인해주세요.';
             errorType = 'bad_request';
         }
+    } else if (statusCode === 400 && errorData.error === 'date_out_of_range') {
+        const range = errorData.range || {};
+        userMessage = `선택한 날짜가 조회 가능 범위(${range.start} ~ ${range.end})를 벗어났습니다.\n날짜를 확인해주세요.`;
+        errorType = 'validation';
     } else if (statusCode === 400) {
         userMessage = '필수 매개변수가 누락되었습니다.\n시작일과 종료일을 YYYY-MM-DD 형식으로 입력해주세요.';
         errorType = 'missing_params';
     } else if (statusCode === 413) {
         userMessage = '요청 데이터가 너무 큽니다.\n날짜 범위를 줄여서 다시 시도해주세요.';
         errorType = 'payload_too_large';
+    } else if (statusCode === 429) {
+        userMessage = `요청이 너무 많습니다.\n${errorData.retry_after || '잠시'}초 후 다시 시도해주세요.`;
+        errorType = 'rate_limited';
+    } else if (statusCode === 503) {
+        userMessage = '백엔드 서버가 혼잡합니다.\n잠시 후 다시 시도해주세요.';
+        errorType = 'upstream_busy';
     } else if (statusCode === 500) {
         userMessage = '서버 내부 오류가 발생했습니다.\n잠시 후 다시 시도해주세요.';
         errorType = 'server_error';
@@ -119,29 +139,124 @@ function translateBackendError(errorData, statusCode) {
     };
 }
 
+// ========== Web Worker 응답 처리 ==========
+
+let dashboardWorker = null;
+let dashboardWorkerDisabled = false;
+let dashboardWorkerRequestId = 0;
+const dashboardWorkerPending = new Map();
+
+// Worker 생성 (미지원 또는 실패 시 null - 메인 스레드에서 처리)
+function getDashboardWorker() {
+    if (dashboardWorker || dashboardWorkerDisabled) return dashboardWorker;
+    if (!window.Worker) {
+        dashboardWorkerDisabled = true;
+        return null;
+    }
+
+    try {
+        dashboardWorker = new Worker('/static/dashboard_worker.js');
+    } catch (error) {
+        console.warn('[WORKER] 생성 실패 - 메인 스레드에서 처리합니다:', error);
+        dashboardWorkerDisabled = true;
+        return null;
+    }
+
+    dashboardWorker.onmessage = (event) => {
+        const pending = dashboardWorkerPending.get(event.data.id);
+        if (!pending) return;
+        dashboardWorkerPending.delete(event.data.id);
+
+        if (event.data.networkError) {
+            pending.reject(new Error(event.data.networkError));
+        } else {
+            pending.resolve(event.data);
+        }
+    };
+
+    dashboardWorker.onerror = (event) => {
+        console.warn('[WORKER] 오류 - 메인 스레드 처리로 전환합니다:', event.message);
+        dashboardWorker.terminate();
+        dashboardWorker = null;
+        dashboardWorkerDisabled = true;
+        dashboardWorkerPending.forEach(pending => pending.reject(new Error('worker_failed')));
+        dashboardWorkerPending.clear();
+    };
+
+    return dashboardWorker;
+}
+
+// 응답 가져오기 + JSON 파싱 + 렌더링 준비 (가능하면 Worker 에서 수행)
+async function fetchPreparedResponse(url, kind, severity, traceId = null) {
+    const worker = getDashboardWorker();
+    if (worker) {
+        try {
+            return await new Promise((resolve, reject) => {
+                const id = ++dashboardWorkerRequestId;
+                dashboardWorkerPending.set(id, { resolve, reject });
+                worker.postMessage({ id, url, kind, severity, traceId });
+            });
+        } catch (error) {
+            if (error.message !== 'worker_failed') throw error;
+        }
+    }
+
+    return (await fetchAndPrepare(url, kind, severity, traceId)).response;
+}
+
 // 개선된 API 호출 함수
-async function makeApiCall(url, apiName = 'API') {
+// kind: 렌더링 준비 데이터 종류 ('analytics', 'channels' 등, 없으면 원본만 반환)
+// trace: loadAllData 추적 사이클 (요청마다 추적 ID 를 붙이고 워터폴에 기록)
+async function makeApiCall(url, apiName = 'API', { kind = null, severity = 'all', trace = null } = {}) {
+    const traceId = nextTraceId(trace);
+    const startedAt = performance.now();
+
     try {
-        console.log(`[${apiName}] 호출 시작: ${url}`);
+        console.log(`[${apiName}] 호출 시작: ${url} (trace ${traceId})`);
+        
+        const response = await fetchPreparedResponse(url, kind, severity, traceId);
+        const responseData = response.data;
+        
+        recordTraceSpan(trace, {
+            name: apiName,
+            traceId: response.traceId || traceId,
+            status: response.status,
+            start: startedAt,
+            duration: performance.now() - startedAt,
+            serverTiming: parseServerTiming(response.serverTiming),
+            clientTiming: response.clientTiming
+        });
         
-        const response = await fetch(url);
-        const responseData = await response.json();
+        // 서버가 제안한 다음 폴링 간격 (초)
+        const pollHeader = response.pollInterval;
+        const pollInterval = pollHeader !== null && !isNaN(parseInt(pollHeader)) ? parseInt(pollHeader) : null;
         
         if (response.ok) {
             console.log(`[${apiName}] 성공:`, responseData);
-            return { success: true, data: responseData };
+            return { success: true, data: responseData, pollInterval, prepared: response.prepared };
         } else {
             console.error(`[${apiName}] 오류 응답:`, responseData);
             const errorInfo = translateBackendError(responseData, response.status);
             
+            // 요청 제한/백엔드 혼잡 시 서버가 알려준 재시도 대기 시간 (초)
+            const retryAfter = parseInt(response.retryAfter);
+            
             return { 
                 success: false, 
                 error: errorInfo,
-                rawError: responseData
+                rawError: responseData,
+                retryAfter: isNaN(retryAfter) ? null : retryAfter
             };
         }
     } catch (networkError) {
         console.error(`[${apiName}] 네트워크 오류:`, networkError);
+        recordTraceSpan(trace, {
+            name: apiName,
+            traceId,
+            status: 0,
+            start: startedAt,
+            duration: performance.now() - startedAt
+        });
         
         return {
             success: false,
@@ -156,6 +271,312 @@ async function makeApiCall(url, apiName = 'API') {
     }
 }
 
+// ========== 요청 추적 (Trace ID + Server-Timing 워터폴) ==========
+
+// ?trace=1 또는 localStorage 'voda-trace-overlay' = '1' 이면 워터폴 디버그 오버레이 표시
+const TRACE_OVERLAY_ENABLED = (() => {
+    try {
+        return new URLSearchParams(window.location.search).has('trace') ||
+            localStorage.getItem('voda-trace-overlay') === '1';
+    } catch (error) {
+        return false;
+    }
+})();
+// 워터폴 막대 구간 순서 (서버 Server-Timing 구간 → 네트워크 → 클라이언트 처리)
+const TRACE_SEGMENT_ORDER = ['cache', 'queue', 'upstream', 'parse', 'render', 'serialize', 'network', 'decode', 'prepare'];
+
+let lastTraceCycle = null;
+
+function generateTraceId() {
+    const bytes = new Uint8Array(8);
+    crypto.getRandomValues(bytes);
+    return Array.from(bytes, byte => byte.toString(16).padStart(2, '0')).join('');
+}
+
+// loadAllData 1회 = 추적 사이클 1개, 사이클 내 요청은 `${사이클 ID}-${순번}` 추적 ID 사용
+function beginTraceCycle() {
+    lastTraceCycle = { id: generateTraceId(), seq: 0, startedAt: performance.now(), finishedAt: null, spans: [] };
+    return lastTraceCycle;
+}
+
+function nextTraceId(cycle) {
+    return cycle ? `${cycle.id}-${++cycle.seq}` : generateTraceId();
+}
+
+// Server-Timing 헤더 파싱 - [{ name, dur, desc }]
+function parseServerTiming(header) {
+    if (!header) return [];
+    return header.split(',').map(entry => {
+        const [name, ...params] = entry.trim().split(';');
+        const metric = { name: name.trim(), dur: 0, desc: '' };
+        params.forEach(param => {
+            const [key, value = ''] = param.trim().split('=');
+            if (key === 'dur') metric.dur = parseFloat(value) || 0;
+            if (key === 'desc') metric.desc = value.replace(/^"|"$/g, '');
+        });
+        return metric;
+    }).filter(metric => metric.name);
+}
+
+function recordTraceSpan(cycle, span) {
+    if (!cycle) return;
+    cycle.spans.push({ ...span, start: span.start - cycle.startedAt });
+    // 사이클 종료 후 도착한 백그라운드 재검증 응답도 반영
+    if (cycle.finishedAt !== null) {
+        renderTraceOverlay(cycle);
+    }
+}
+
+function finishTraceCycle(cycle) {
+    cycle.finishedAt = performance.now();
+    if (TRACE_OVERLAY_ENABLED) {
+        console.table(cycle.spans.map(span => ({
+            name: span.name,
+            traceId: span.traceId || '-',
+            cache: span.cache || '-',
+            start: Math.round(span.start),
+            duration: Math.round(span.duration),
+            server: (span.serverTiming || []).map(metric => `${metric.name}=${metric.dur}`).join(' ')
+        })));
+    }
+    renderTraceOverlay(cycle);
+}
+
+// 요청 1건의 막대 구간 (ms) - 서버 구간, 서버 밖 네트워크 시간, 클라이언트 디코딩/준비 시간
+function getTraceSegments(span) {
+    const segments = {};
+    let serverTotal = 0;
+    (span.serverTiming || []).forEach(metric => {
+        if (metric.name === 'total') {
+            serverTotal = metric.dur;
+        } else {
+            segments[metric.name] = (segments[metric.name] || 0) + metric.dur;
+        }
+    });
+    if (span.clientTiming) {
+        segments.network = Math.max(0, span.clientTiming.network - serverTotal);
+        segments.decode = span.clientTiming.decode;
+        segments.prepare = span.clientTiming.prepare;
+    }
+    return TRACE_SEGMENT_ORDER.filter(name => segments[name] > 0).map(name => ({ name, dur: segments[name] }));
+}
+
+function escapeTraceText(value) {
+    return String(value).replace(/[&<>"']/g, char => `&#${char.charCodeAt(0)};`);
+}
+
+function renderTraceOverlay(cycle) {
+    if (!TRACE_OVERLAY_ENABLED || cycle !== lastTraceCycle) return;
+
+    let overlay = document.getElementById('traceOverlay');
+    if (!overlay) {
+        overlay = document.createElement('div');
+        overlay.id = 'traceOverlay';
+        overlay.className = 'trace-overlay';
+        document.body.appendChild(overlay);
+    }
+
+    const cycleDuration = Math.max(
+        1,
+        cycle.finishedAt - cycle.startedAt,
+        ...cycle.spans.map(span => span.start + span.duration)
+    );
+
+    const rows = cycle.spans.map(span => {
+        const left = (span.start / cycleDuration) * 100;
+        const width = Math.max(0.5, (span.duration / cycleDuration) * 100);
+        const segments = getTraceSegments(span);
+        const segmentTotal = segments.reduce((sum, segment) => sum + segment.dur, 0);
+        const segmentHtml = segments.map(segment => `
+            <div class="trace-segment trace-${segment.name}"
+                 style="width: ${(segment.dur / segmentTotal) * 100}%"
+                 title="${segment.name}: ${segment.dur.toFixed(1)}ms"></div>`).join('');
+        const label = span.cache ? `${span.name} (캐시 ${span.cache})` : span.name;
+
+        return `
+            <div class="trace-row" title="trace ${escapeTraceText(span.traceId || '-')}">
+                <div class="trace-label">${escapeTraceText(label)}</div>
+                <div class="trace-track">
+                    <div class="trace-bar${span.cache ? ' trace-bar-cache' : ''}" style="left: ${left}%; width: ${width}%">${segmentHtml}</div>
+                </div>
+                <div class="trace-ms">${Math.round(span.duration)}ms</div>
+            </div>`;
+    }).join('');
+
+    const legend = TRACE_SEGMENT_ORDER.map(name =>
+        `<span class="trace-legend-item"><span class="trace-segment trace-${name}"></span>${name}</span>`
+    ).join('');
+
+    overlay.innerHTML = `
+        <div class="trace-header">추적 ${cycle.id} · ${Math.round(cycleDuration)}ms</div>
+        ${rows || '<div class="trace-row">요청 없음</div>'}
+        <div class="trace-legend">${legend}</div>`;
+}
+
+// ========== API 응답 캐시 (메모리 LRU + IndexedDB) ==========
+
+const API_CACHE_TTL_MS = 60000;
+const API_CACHE_MAX_ENTRIES = 100;
+const API_CACHE_PERSIST_MAX_AGE_MS = 24 * 60 * 60 * 1000;
+const API_CACHE_DB_NAME = 'voda-dashboard-cache';
+const API_CACHE_STORE_NAME = 'responses';
+
+const apiMemoryCache = new Map();
+const apiInflightRequests = new Map();
+let apiCacheDbPromise = null;
+
+// IndexedDB 열기 (지원하지 않거나 실패하면 null - 메모리 캐시만 사용)
+function openApiCacheDb() {
+    if (apiCacheDbPromise) return apiCacheDbPromise;
+
+    apiCacheDbPromise = new Promise(resolve => {
+        if (!window.indexedDB) {
+            resolve(null);
+            return;
+        }
+        const request = indexedDB.open(API_CACHE_DB_NAME, 1);
+        request.onupgradeneeded = () => {
+            request.result.createObjectStore(API_CACHE_STORE_NAME, { keyPath: 'url' });
+        };
+        request.onsuccess = () => {
+            const db = request.result;
+            pruneApiCacheDb(db);
+            resolve(db);
+        };
+        request.onerror = () => {
+            console.warn('[CACHE] IndexedDB 사용 불가:', request.error);
+            resolve(null);
+        };
+    });
+    return apiCacheDbPromise;
+}
+
+// 오래된 영구 캐시 항목 정리
+function pruneApiCacheDb(db) {
+    const store = db.transaction(API_CACHE_STORE_NAME, 'readwrite').objectStore(API_CACHE_STORE_NAME);
+    store.openCursor().onsuccess = (event) => {
+        const cursor = event.target.result;
+        if (!cursor) return;
+        if (Date.now() - cursor.value.storedAt > API_CACHE_PERSIST_MAX_AGE_MS) {
+            cursor.delete();
+        }
+        cursor.continue();
+    };
+}
+
+async function readPersistedApiCache(url) {
+    const db = await openApiCacheDb();
+    if (!db) return null;
+
+    return new Promise(resolve => {
+        const request = db.transaction(API_CACHE_STORE_NAME, 'readonly').objectStore(API_CACHE_STORE_NAME).get(url);
+        request.onsuccess = () => resolve(request.result || null);
+        request.onerror = () => resolve(null);
+    });
+}
+
+async function writePersistedApiCache(entry) {
+    const db = await openApiCacheDb();
+    if (!db) return;
+
+    try {
+        db.transaction(API_CACHE_STORE_NAME, 'readwrite').objectStore(API_CACHE_STORE_NAME).put(entry);
+    } catch (error) {
+        console.warn('[CACHE] IndexedDB 저장 실패:', error);
+    }
+}
+
+// 메모리 LRU 저장 (Map 삽입 순서를 사용 순서로 활용)
+function rememberApiCacheEntry(entry) {
+    apiMemoryCache.delete(entry.url);
+    apiMemoryCache.set(entry.url, entry);
+    while (apiMemoryCache.size > API_CACHE_MAX_ENTRIES) {
+        apiMemoryCache.delete(apiMemoryCache.keys().next().value);
+    }
+}
+
+async function getApiCacheEntry(url) {
+    const memoryEntry = apiMemoryCache.get(url);
+    if (memoryEntry) {
+        rememberApiCacheEntry(memoryEntry);
+        return memoryEntry;
+    }
+
+    const persistedEntry = await readPersistedApiCache(url);
+    if (persistedEntry) {
+        rememberApiCacheEntry(persistedEntry);
+    }
+    return persistedEntry;
+}
+
+// 동일 URL 진행 중 요청은 하나로 합치고, 성공 응답은 캐시에 저장
+function fetchAndCache(url, apiName, prepareOptions = {}) {
+    if (apiInflightRequests.has(url)) {
+        return apiInflightRequests.get(url);
+    }
+
+    const request = makeApiCall(url, apiName, prepareOptions).then(result => {
+        if (result.success) {
+            const entry = { url, data: result.data, pollInterval: result.pollInterval, storedAt: Date.now() };
+            rememberApiCacheEntry(entry);
+            writePersistedApiCache(entry);
+        }
+        return result;
+    }).finally(() => {
+        apiInflightRequests.delete(url);
+    });
+
+    apiInflightRequests.set(url, request);
+    return request;
+}
+
+function cacheEntryToResult(entry, stale) {
+    return { success: true, data: entry.data, pollInterval: entry.pollInterval, fromCache: true, stale };
+}
+
+// 캐시 적용 API 호출
+// - 신선한 캐시: 즉시 반환
+// - 만료된 캐시: 즉시 반환 후 백그라운드 재검증, 데이터가 바뀌면 onRevalidate 호출
+// - bypassCache: 네트워크 우선 (실패 시 캐시로 대체)
+// - kind/severity: Worker 에서 미리 계산할 렌더링 준비 데이터 지정 (캐시 적중 시에는 prepared 없음)
+// - trace: 추적 사이클 (캐시 적중도 워터폴에 기록)
+async function cachedApiCall(url, apiName = 'API', { bypassCache = false, onRevalidate = null, kind = null, severity = 'all', trace = null } = {}) {
+    const prepareOptions = { kind, severity, trace };
+    const lookupStartedAt = performance.now();
+    const cached = await getApiCacheEntry(url);
+
+    if (bypassCache || !cached) {
+        const result = await fetchAndCache(url, apiName, prepareOptions);
+        if (!result.success && cached) {
+            console.warn(`[${apiName}] 네트워크 실패 - 캐시된 데이터 사용`);
+            return { ...cacheEntryToResult(cached, true), retryAfter: result.retryAfter };
+        }
+        return result;
+    }
+
+    const age = Date.now() - cached.storedAt;
+    recordTraceSpan(trace, {
+        name: apiName,
+        cache: age < API_CACHE_TTL_MS ? 'fresh' : 'stale',
+        start: lookupStartedAt,
+        duration: performance.now() - lookupStartedAt
+    });
+
+    if (age < API_CACHE_TTL_MS) {
+        console.log(`[${apiName}] 캐시 적중 (${Math.round(age / 1000)}초 전 데이터)`);
+        return cacheEntryToResult(cached, false);
+    }
+
+    console.log(`[${apiName}] 만료된 캐시 반환 후 재검증`);
+    const previousSnapshot = JSON.stringify(cached.data);
+    fetchAndCache(url, apiName, prepareOptions).then(result => {
+        if (result.success && onRevalidate && JSON.stringify(result.data) !== previousSnapshot) {
+            onRevalidate(result);
+        }
+    });
+    return cacheEntryToResult(cached, true);
+}
+
 // 날짜 유효성 검사
 function validateDatesBeforeSubmit(startDate, endDate) {
     const errors = [];
@@ -276,7 +697,8 @@ function showErrorWithDetails(error, duration = 7000) {
 // ========== 기존 핵심 기능들 (수정됨) ==========
 
 // 전체 데이터 로드 - 오류 처리 개선
-async function loadAllData(severityOverride = null) {
+// bypassCache: 자동 새로고침처럼 최신 데이터가 필요한 경우 캐시를 건너뜀
+async function loadAllData(severityOverride = null, { bypassCache = false } = {}) {
     const startDate = document.getElementById('startDate')?.value;
     const endDate = document.getElementById('endDate')?.value;
     const severity = severityOverride || currentSeverityFilter;
@@ -311,6 +733,10 @@ async function loadAllData(severityOverride = null) {
     updateReportTitle(startDate, endDate, severity);
 
     showStatus('데이터를 불러오는 중...', 'loading');
+    lastDataLoadAt = Date.now();
+    const generation = ++dataLoadGeneration;
+    const isCurrentLoad = () => generation === dataLoadGeneration;
+    const traceCycle = beginTraceCycle();
 
     try {
         const params = new URLSearchParams({
@@ -320,40 +746,96 @@ async function loadAllData(severityOverride = null) {
             channel_id: channel_id
         });
 
+        // 전체 채널 조회 시 서버가 요약을 계산할 수 있으면 채널 응답에 포함해서 받음
+        // (서버가 계산한 요약을 한 번이라도 받기 전까지는 요약 API 도 별도로 호출)
+        const includeSummary = channel_id === 'all';
+        const summaryFromChannels = includeSummary && serverDerivesSummary;
+        const channelParams = new URLSearchParams(params);
+        if (includeSummary) {
+            channelParams.set('include', 'summary');
+        }
+
         // API 호출들
         const apiCalls = [
-            { 
-                name: '이벤트 요약', 
-                url: `/api/proxy/events/summary?${params}`,
-                handler: (data) => updateEventSummary(data.counts, severity)
-            },
             { 
                 name: '이벤트 분석', 
                 url: `/api/proxy/events/analytics?${params}`,
-                handler: (data) => {
-                    createEventTypeChart(data.type_pie, severity);
-                    createHourlyChart(data.hourly_bar, severity);
+                kind: 'analytics',
+                handler: (data, prepared) => {
+                    createEventTypeChart(data.type_pie, severity, prepared?.typeChart);
+                    createHourlyChart(data.hourly_bar, severity, prepared?.hourlyCounts);
                 }
             },
             { 
                 name: '채널 정보', 
-                url: `/api/proxy/channels?${params}`,
-                handler: (data) => {
+                url: `/api/proxy/channels?${channelParams}`,
+                kind: channel_id === 'all' ? 'channels' : null,
+                handler: (data, prepared) => {
+                    if (includeSummary) {
+                        if (data.summary) {
+                            serverDerivesSummary = true;
+                            updateEventSummary(data.summary.counts, severity);
+                        } else {
+                            serverDerivesSummary = false;
+                            // 요약 API 호출을 생략했는데 요약이 없으면 이전 카드 값을 유지하지 않고 다시 조회
+                            if (summaryFromChannels) {
+                                loadEventSummaryFallback(params, severity, isCurrentLoad);
+                            }
+                        }
+                    }
                     const channelData = channel_id === 'all' ? data : { items: [data] };
-                    displayChannelData(channelData, severity);
+                    displayChannelData(channelData, severity, prepared);
+                    if (channel_id === 'all') {
+                        detectChannelStatusChanges(data.items);
+                    }
                 }
             }
         ];
 
+        if (!summaryFromChannels) {
+            apiCalls.unshift({
+                name: '이벤트 요약', 
+                url: `/api/proxy/events/summary?${params}`,
+                handler: (data) => updateEventSummary(data.counts, severity)
+            });
+        }
+
         let successCount = 0;
         let errorMessages = [];
+        const pollHints = [];
+        const retryHints = [];
 
         for (const apiCall of apiCalls) {
-            const result = await makeApiCall(apiCall.url, apiCall.name);
+            const result = await cachedApiCall(apiCall.url, apiCall.name, {
+                bypassCache,
+                kind: apiCall.kind,
+                severity,
+                trace: traceCycle,
+                onRevalidate: (fresh) => {
+                    // 그 사이 severity/날짜/채널이 바뀌어 새로 조회했다면 이전 조회의 재검증 결과는 버림
+                    if (!isCurrentLoad()) {
+                        console.log(`[CACHE] ${apiCall.name} 재검증 결과 무시 (이후 새 조회 시작됨)`);
+                        return;
+                    }
+                    apiCall.handler(fresh.data, fresh.prepared);
+                }
+            });
+
+            // 응답을 기다리는 사이 새 조회가 시작됐으면 이 조회의 나머지 처리는 중단
+            if (!isCurrentLoad()) {
+                return;
+            }
+            
+            if (result.success && result.pollInterval !== null) {
+                pollHints.push(result.pollInterval);
+            }
+            if (result.retryAfter) {
+                retryHints.push(result.retryAfter);
+            }
             
             if (result.success) {
                 try {
-                    apiCall.handler(result.data);
+                    apiCall.handler(result.data, result.prepared);
                     successCount++;
                 } catch (handlerError) {
                     console.error(`${apiCall.name} 데이터 처리 오류:`, handlerError);
@@ -369,6 +851,8 @@ async function loadAllData(severityOverride = null) {
             }
         }
 
+        updatePollInterval(pollHints, retryHints);
+
         // 결과 요약 표시
         if (successCount === apiCalls.length) {
             const severityLabel = getSeverityLabel(severity);
@@ -395,6 +879,8 @@ async function loadAllData(severityOverride = null) {
             apiInfo: { path: 'javascript', method: 'CLIENT', status: 'JS_ERROR' },
             originalError: unexpectedError
         }, 10000);
+    } finally {
+        finishTraceCycle(traceCycle);
     }
 }
 
@@ -506,18 +992,69 @@ async function handleSeverityCardClick(severity) {
     }
 }
 
+// 서버 힌트로 자동 새로고침 간격 갱신 (가장 짧은 간격 사용, 모두 0이면 종료된 기간)
+function updatePollInterval(pollHints, retryHints = []) {
+    if (pollHints.length === 0) {
+        suggestedPollIntervalMs = AUTO_REFRESH_DEFAULT_MS;
+    } else if (pollHints.every(hint => hint === 0)) {
+        suggestedPollIntervalMs = 0;
+    } else {
+        suggestedPollIntervalMs = Math.min(...pollHints.filter(hint => hint > 0)) * 1000;
+    }
+
+    // 요청이 제한되었으면 Retry-After 이후에 다시 시도
+    if (retryHints.length > 0) {
+        suggestedPollIntervalMs = Math.max(suggestedPollIntervalMs, Math.max(...retryHints) * 1000);
+    }
+}
+
+// 다음 자동 새로고침 예약 (탭이 숨겨진 동안은 간격을 늘림)
+function scheduleNextAutoRefresh() {
+    if (autoRefreshTimer) {
+        clearTimeout(autoRefreshTimer);
+        autoRefreshTimer = null;
+    }
+    if (!autoRefreshEnabled) return;
+
+    if (suggestedPollIntervalMs === 0) {
+        autoRefreshEnabled = false;
+        showStatus('선택한 기간은 종료되어 더 이상 갱신되지 않으므로 자동 새로고침을 중지했습니다', 'success');
+        setTimeout(hideStatus, 3000);
+        return;
+    }
+
+    const multiplier = document.hidden ? AUTO_REFRESH_HIDDEN_MULTIPLIER : 1;
+    const elapsed = Date.now() - lastDataLoadAt;
+    const delay = Math.max(0, suggestedPollIntervalMs * multiplier - elapsed);
+    autoRefreshTimer = setTimeout(runAutoRefresh, delay);
+}
+
+async function runAutoRefresh() {
+    autoRefreshTimer = null;
+    await loadAllData(null, { bypassCache: true });
+    scheduleNextAutoRefresh();
+}
+
+// 탭 표시 상태가 바뀌면 남은 대기 시간 재계산
+document.addEventListener('visibilitychange', () => {
+    if (autoRefreshEnabled && autoRefreshTimer) {
+        scheduleNextAutoRefresh();
+    }
+});
+
 // 자동 새로고침
 function startAutoRefresh() {
-    if (autoRefreshInterval) clearInterval(autoRefreshInterval);
-    autoRefreshInterval = setInterval(() => loadAllData(), 30000);
-    showStatus('자동 새로고침이 시작되었습니다 (30초마다)', 'success');
+    autoRefreshEnabled = true;
+    suggestedPollIntervalMs = AUTO_REFRESH_DEFAULT_MS;
+    scheduleNextAutoRefresh();
+    showStatus('자동 새로고침이 시작되었습니다 (데이터 변경 빈도에 따라 간격 자동 조정)', 'success');
     setTimeout(hideStatus, 2000);
 }
 
 function stopAutoRefresh() {
-    if (autoRefreshInterval) {
-        clearInterval(autoRefreshInterval);
-        autoRefreshInterval = null;
+    if (autoRefreshEnabled) {
+        autoRefreshEnabled = false;
+        scheduleNextAutoRefresh();
         showStatus('자동 새로고침이 중지되었습니다', 'success');
         setTimeout(hideStatus, 2000);
     }
@@ -544,27 +1081,92 @@ window.addEventListener('DOMContentLoaded', async () => {
     enableImageZoom();
     enableKeyboardNavigation();
     
-    // 동적으로 생성되는 채널 카드 감시
-    const observer = new MutationObserver(function(mutations) {
-        mutations.forEach(function(mutation) {
-            if (mutation.type === 'childList') {
-                updateChannelCardAccessibility();
-            }
-        });
-    });
-
-    observer.observe(document.getElementById('channelGrid'), {
-        childList: true,
-        subtree: true
-    });
+    // 채널 그리드 위임 이벤트 (툴팁, 클릭, 스크롤 윈도잉)
+    setupChannelGridEvents();
     
     // 날짜 검증 설정
     setupDateValidation();
     
     // 데이터 로드
     loadAllData();
+    
+    // 채널 상태 변경/이상 징후 알림 구독 (서버에서 채널 모니터를 켠 경우만)
+    // 꺼져 있으면 폴링 응답끼리 비교하여 상태 변경만 알림 (detectChannelStatusChanges)
+    if (window.DASHBOARD_CHANNEL_EVENTS) {
+        startChannelEventStream();
+    }
 });
 
+// ========== 채널 상태 변경/이상 징후 알림 (Server-Sent Events) ==========
+
+let channelEventSource = null;
+
+function startChannelEventStream() {
+    if (!window.EventSource || channelEventSource) return;
+
+    // 연결이 끊기면 EventSource 가 Last-Event-ID 로 자동 재연결하여 놓친 이벤트를 받음
+    channelEventSource = new EventSource('/api/stream/channel-events');
+    channelEventSource.addEventListener('status_change', (event) => {
+        handleChannelEvent(JSON.parse(event.data));
+    });
+    channelEventSource.addEventListener('critical_spike', (event) => {
+        handleChannelEvent(JSON.parse(event.data));
+    });
+}
+
+// 직전 폴링 응답의 채널별 상태 (이벤트 스트림을 쓰지 않을 때 상태 변경 감지용)
+let previousChannelStatuses = null;
+
+function detectChannelStatusChanges(items) {
+    if (channelEventSource) return;
+
+    const statuses = new Map();
+    (items || []).forEach(item => {
+        statuses.set(String(item.channel_id), String(item.status || 'OFF').toUpperCase());
+    });
+
+    if (previousChannelStatuses) {
+        (items || []).forEach(item => {
+            const channelId = String(item.channel_id);
+            const from = previousChannelStatuses.get(channelId);
+            const to = statuses.get(channelId);
+            if (from && from !== to) {
+                handleChannelEvent({
+                    type: 'status_change',
+                    channel_id: channelId,
+                    name: item.name || `CH${channelId.padStart(2, '0')}`,
+                    from,
+                    to
+                });
+            }
+        });
+    }
+    previousChannelStatuses = statuses;
+}
+
+function handleChannelEvent(channelEvent) {
+    console.log('[CHANNEL_EVENT]', channelEvent);
+
+    if (channelEvent.type === 'status_change') {
+        // 보이는 채널 카드 상태 즉시 반영
+        const channel = channelGridState.byId.get(String(channelEvent.channel_id));
+        if (channel) {
+            channel.status = channelEvent.to;
+            channelGridState.firstRow = -1;
+            channelGridState.lastRow = -1;
+            scheduleChannelGridRender();
+        }
+        const type = channelEvent.to === 'ON' ? 'success' : 'error';
+        showStatus(`${channelEvent.name} 상태 변경: ${channelEvent.from} → ${channelEvent.to}`, type);
+    } else if (channelEvent.type === 'critical_spike') {
+        showStatus(
+            `${channelEvent.name} ${channelEvent.label} 긴급 이벤트 급증: ${channelEvent.count}건 (기준 ${channelEvent.baseline_mean}건)`,
+            'error'
+        );
+    }
+    setTimeout(hideStatus, 8000);
+}
+
 // 이벤트 요약 업데이트
 function updateEventSummary(data, severity = 'all') {
     document.getElementById('statsContainer').style.display = 'grid';
@@ -583,42 +1185,116 @@ function updateEventSummary(data, severity = 'all') {
     }
 }
 
-// 이벤트 타입 차트 생성
-function createEventTypeChart(typeData, severity = 'all') {
-    const ctx = document.getElementById('eventTypeChart').getContext('2d');
+// 요약 카드 값 비우기 (요약 데이터를 받지 못한 경우)
+function clearEventSummary() {
+    ['totalEvents', 'criticalEvents', 'warnEvents', 'infoEvents'].forEach(elementId => {
+        document.getElementById(elementId).textContent = '-';
+    });
+}
 
-    if (eventTypeChart) {
-        eventTypeChart.destroy();
+// 채널 응답에 요약이 없을 때 요약 API 를 직접 호출하여 카드 갱신
+async function loadEventSummaryFallback(params, severity, isCurrentLoad) {
+    clearEventSummary();
+    const result = await cachedApiCall(`/api/proxy/events/summary?${params}`, '이벤트 요약', { severity });
+    if (!isCurrentLoad()) return;
+
+    if (result.success) {
+        updateEventSummary(result.data.counts, severity);
+    } else {
+        console.warn('[SUMMARY] 요약 데이터를 불러오지 못했습니다:', result.error.userMessage);
+        showStatus(`이벤트 요약: ${result.error.userMessage}`, 'warning');
+        setTimeout(hideStatus, 5000);
+    }
+}
+
+// 배열 내용 비교 (차트 데이터 변경 여부 판단용)
+function arraysEqual(a, b) {
+    if (!a || !b || a.length !== b.length) return false;
+    for (let i = 0; i < a.length; i++) {
+        if (a[i] !== b[i]) return false;
+    }
+    return true;
+}
+
+// 배열 객체는 유지한 채 내용만 교체 (Chart.js 데이터셋 제자리 갱신)
+function replaceArrayContents(target, source) {
+    target.length = 0;
+    source.forEach(value => target.push(value));
+}
+
+// 차트 제목 업데이트 (변경된 경우에만 DOM 쓰기)
+function updateChartTitle(canvasId, text) {
+    const titleElement = document.getElementById(canvasId).parentElement.parentElement.querySelector('.chart-title');
+    if (titleElement && titleElement.textContent !== text) {
+        titleElement.textContent = text;
+    }
+}
+
+// 데이터가 없을 때 캔버스는 유지하고 안내 문구만 표시
+function showChartNoData(canvasId, message) {
+    const canvas = document.getElementById(canvasId);
+    const container = canvas.parentElement;
+    let noData = container.querySelector('.no-data');
+    if (!noData) {
+        noData = document.createElement('div');
+        noData.className = 'no-data';
+        container.appendChild(noData);
     }
+    noData.textContent = message;
+    noData.style.display = '';
+    canvas.style.display = 'none';
+}
+
+function hideChartNoData(canvasId) {
+    const canvas = document.getElementById(canvasId);
+    const noData = canvas.parentElement.querySelector('.no-data');
+    if (noData) noData.style.display = 'none';
+    canvas.style.display = '';
+}
+
+// 이벤트 타입 차트 생성 - 기존 차트가 있으면 데이터만 제자리 갱신
+// prepared: Worker 에서 미리 계산한 라벨/값/색상 (없으면 여기서 계산)
+function createEventTypeChart(typeData, severity = 'all', prepared = null) {
+    const severityLabel = getSeverityLabel(severity);
+    updateChartTitle('eventTypeChart', `📊 이벤트 타입별 분석 - ${severityLabel}`);
 
     if (!typeData || typeData.length === 0) {
-        const container = document.querySelector('#eventTypeChart').parentElement.parentElement;
-        const severityLabel = getSeverityLabel(severity);
-        container.innerHTML = `
-            <div class="chart-title">📊 이벤트 타입별 분석 - ${severityLabel}</div>
-            <div class="no-data">${severityLabel} 이벤트 타입 데이터가 없습니다.</div>
-        `;
+        if (eventTypeChart) {
+            eventTypeChart.destroy();
+            eventTypeChart = null;
+        }
+        showChartNoData('eventTypeChart', `${severityLabel} 이벤트 타입 데이터가 없습니다.`);
         return;
     }
+    hideChartNoData('eventTypeChart');
 
-    const labels = typeData.map(item => item.label);
-    const data = typeData.map(item => item.count);
-    const colors = getSeverityColors(severity);
+    const chartData = prepared || prepareEventTypeChart(typeData, severity);
+    const labels = chartData.labels;
+    const data = Array.from(chartData.counts);
+    const colors = chartData.colors;
 
-    // 차트 제목 업데이트
-    const titleElement = document.querySelector('#eventTypeChart').parentElement.parentElement.querySelector('.chart-title');
-    if (titleElement) {
-        const severityLabel = getSeverityLabel(severity);
-        titleElement.textContent = `📊 이벤트 타입별 분석 - ${severityLabel}`;
+    if (eventTypeChart) {
+        const dataset = eventTypeChart.data.datasets[0];
+        if (arraysEqual(eventTypeChart.data.labels, labels) &&
+            arraysEqual(dataset.data, data) &&
+            arraysEqual(dataset.backgroundColor, colors)) {
+            return;
+        }
+        replaceArrayContents(eventTypeChart.data.labels, labels);
+        replaceArrayContents(dataset.data, data);
+        dataset.backgroundColor = colors;
+        eventTypeChart.update('none');
+        return;
     }
 
+    const ctx = document.getElementById('eventTypeChart').getContext('2d');
     eventTypeChart = new Chart(ctx, {
         type: 'doughnut',
         data: {
             labels: labels,
             datasets: [{
                 data: data,
-                backgroundColor: colors.slice(0, data.length),
+                backgroundColor: colors,
                 borderWidth: 2,
                 borderColor: 'rgba(255, 255, 255, 0.8)'
             }]
@@ -657,46 +1333,51 @@ function createEventTypeChart(typeData, severity = 'all') {
     });
 }
 
-// 시간대별 차트 생성
-function createHourlyChart(hourlyData, severity = 'all') {
-    const ctx = document.getElementById('hourlyChart').getContext('2d');
-
-    if (hourlyChart) {
-        hourlyChart.destroy();
-    }
+// 시간대별 차트 생성 - 기존 차트가 있으면 데이터만 제자리 갱신
+// preparedCounts: Worker 에서 미리 계산한 24시간 값 배열 (없으면 여기서 계산)
+function createHourlyChart(hourlyData, severity = 'all', preparedCounts = null) {
+    const severityLabel = getSeverityLabel(severity);
+    updateChartTitle('hourlyChart', `📊 시간대별 이벤트 분석 - ${severityLabel}`);
 
     if (!hourlyData || hourlyData.length === 0) {
-        const container = document.querySelector('#hourlyChart').parentElement.parentElement;
-        const severityLabel = getSeverityLabel(severity);
-        container.innerHTML = `
-            <div class="chart-title">📊 시간대별 이벤트 분석 - ${severityLabel}</div>
-            <div class="no-data">${severityLabel} 시간대별 데이터가 없습니다.</div>
-        `;
+        if (hourlyChart) {
+            hourlyChart.destroy();
+            hourlyChart = null;
+        }
+        showChartNoData('hourlyChart', `${severityLabel} 시간대별 데이터가 없습니다.`);
         return;
     }
+    hideChartNoData('hourlyChart');
 
-    const hours = Array.from({length: 24}, (_, i) => i);
-    const counts = hours.map(hour => {
-        const hourData = hourlyData.find(item => item.hour === hour);
-        return hourData ? hourData.count : 0;
-    });
+    const counts = Array.from(preparedCounts || prepareHourlyCounts(hourlyData));
+    const backgroundColor = getSeverityColor(severity, 0.7);
+    const borderColor = getSeverityColor(severity, 1);
+    hourlyChartSeverity = severity;
 
-    // 차트 제목 업데이트
-    const titleElement = document.querySelector('#hourlyChart').parentElement.parentElement.querySelector('.chart-title');
-    if (titleElement) {
-        const severityLabel = getSeverityLabel(severity);
-        titleElement.textContent = `📊 시간대별 이벤트 분석 - ${severityLabel}`;
+    if (hourlyChart) {
+        const dataset = hourlyChart.data.datasets[0];
+        if (arraysEqual(dataset.data, counts) &&
+            dataset.backgroundColor === backgroundColor &&
+            dataset.borderColor === borderColor) {
+            return;
+        }
+        replaceArrayContents(dataset.data, counts);
+        dataset.backgroundColor = backgroundColor;
+        dataset.borderColor = borderColor;
+        hourlyChart.update('none');
+        return;
     }
 
+    const ctx = document.getElementById('hourlyChart').getContext('2d');
     hourlyChart = new Chart(ctx, {
         type: 'bar',
         data: {
-            labels: hours.map(h => `${h}시`),
+            labels: Array.from({length: 24}, (_, hour) => `${hour}시`),
             datasets: [{
                 label: '이벤트 수',
                 data: counts,
-                backgroundColor: getSeverityColor(severity,0.7),
-                borderColor:getSeverityColor(severity,1),
+                backgroundColor: backgroundColor,
+                borderColor: borderColor,
                 borderWidth: 2,
                 borderRadius: 4
             }]
@@ -723,7 +1404,8 @@ function createHourlyChart(hourlyData, severity = 'all') {
                     bodyColor: '#fff',
                     callbacks: {
                         label: function(context) {
-                            const severityLabel = getSeverityLabel(severity);
+                            // 차트 재사용 시에도 현재 severity 라벨 표시
+                            const severityLabel = getSeverityLabel(hourlyChartSeverity);
                             return `${severityLabel} 이벤트: ${context.parsed.y}건`;
                         }
                     }
@@ -751,36 +1433,38 @@ function getSeverityColor(severity, alpha = 1) {
     }
 }
 
-// severity별 색상 배열 반환
-function getSeverityColors(severity) {
-    switch(severity) {
-        case 'critical':
-            return ['#DD2E44', '#E74C3C', '#C0392B', '#A93226', '#922B21'];
-        case 'warn':
-            return ['#F4900C', '#E67E22', '#D68910', '#B7950B', '#9A7D0A'];
-        case 'info':
-            return ['#77B256', '#58D68D', '#52C41A', '#389E0D', '#237804'];
-        default:
-            return ['#FF6384', '#6EC6FF', '#FFCE56', '#4BC0C0', '#9966FF'];
-    }
-}
-
-// 채널 데이터 표시
-function displayChannelData(data, severity = 'all') {
+// ========== 채널 그리드 (가상화 렌더링) ==========
+
+// 보이는 행 위아래로 추가 렌더링할 행 수
+const CHANNEL_GRID_OVERSCAN_ROWS = 3;
+// 카드 높이 측정 전 기본 행 간격 (카드 85px + gap 8px)
+const CHANNEL_GRID_DEFAULT_ROW_STRIDE = 93;
+
+const channelGridState = {
+    channels: [],
+    byId: new Map(),
+    rowStride: CHANNEL_GRID_DEFAULT_ROW_STRIDE,
+    columns: 6,
+    firstRow: -1,
+    lastRow: -1,
+    renderPending: false
+};
+
+// 채널 데이터 표시 - 전체 목록은 상태로만 보관하고 보이는 행만 렌더링
+// prepared: Worker 에서 미리 정렬한 채널 목록 (없으면 여기서 정렬)
+function displayChannelData(data, severity = 'all', prepared = null) {
     const grid = document.getElementById('channelGrid');
 
     if (!data.items || data.items.length === 0) {
         const severityLabel = getSeverityLabel(severity);
+        channelGridState.channels = [];
+        channelGridState.byId = new Map();
         grid.innerHTML = `<div class="no-data">선택된 기간에 ${severityLabel} 이벤트 데이터가 없습니다.</div>`;
         return;
     }
 
     // 채널 번호순으로 정렬
-    const sortedChannels = data.items.sort((a, b) => {
-        const channelA = parseInt(a.channel_id);
-        const channelB = parseInt(b.channel_id);
-        return channelA - channelB;
-    });
+    const sortedChannels = (prepared || prepareChannelGrid(data.items)).channels;
 
     // 차트 제목 업데이트
     const titleElement = grid.parentElement.querySelector('.chart-title');
@@ -789,38 +1473,136 @@ function displayChannelData(data, severity = 'all') {
         titleElement.textContent = `📺 채널별 이벤트 통계 - ${severityLabel} (클릭하여 상세 정보 보기)`;
     }
 
-    let html = '';
-    sortedChannels.forEach(channel => {
-        const channelNum = channel.channel_id.padStart(2, '0');
-        const statusClass = channel.status === 'ON' ? 'status-on' : 'status-off';
-
-        html += `
-            <div class="channel-card" 
-                    data-channel-id="${channel.channel_id}"
-                    onmouseenter="showTooltip(event, this)" 
-                    onmouseleave="hideTooltip()" 
-                    onmousemove="moveTooltip(event)"
-                    onclick="openChannelModal('${channel.channel_id}')">
-                <div class="channel-number">CH${channelNum}</div>
-                <div class="channel-events">${channel.count}건</div>
-                <div class="channel-status ${statusClass}">${channel.status}</div>
-            </div>
-        `;
+    channelGridState.channels = sortedChannels;
+    channelGridState.byId = new Map(sortedChannels.map(channel => [String(channel.channel_id), channel]));
+    // 데이터가 바뀌었으므로 현재 윈도우도 다시 그리도록 무효화
+    channelGridState.firstRow = -1;
+    channelGridState.lastRow = -1;
+    scheduleChannelGridRender();
+}
+
+// 다음 애니메이션 프레임에 한 번만 렌더링 (스크롤/리사이즈/데이터 갱신 묶음 처리)
+function scheduleChannelGridRender() {
+    if (channelGridState.renderPending) return;
+    channelGridState.renderPending = true;
+    requestAnimationFrame(renderChannelGridWindow);
+}
+
+function buildChannelCardHtml(channel) {
+    const channelNum = String(channel.channel_id).padStart(2, '0');
+    const statusClass = channel.status === 'ON' ? 'status-on' : 'status-off';
+
+    return `
+        <div class="channel-card" 
+                data-channel-id="${channel.channel_id}"
+                tabindex="0"
+                role="button"
+                aria-label="채널 ${channel.channel_id} 상세 정보 보기">
+            <div class="channel-number">CH${channelNum}</div>
+            <div class="channel-events">${channel.count}건</div>
+            <div class="channel-status ${statusClass}">${channel.status}</div>
+        </div>
+    `;
+}
+
+// 현재 스크롤 위치에서 보이는 행(+여유 행)만 DOM에 렌더링
+function renderChannelGridWindow() {
+    channelGridState.renderPending = false;
+
+    const grid = document.getElementById('channelGrid');
+    const channels = channelGridState.channels;
+    if (!grid || channels.length === 0) return;
+
+    // 읽기 단계 - 레이아웃 값 측정
+    const gridStyle = getComputedStyle(grid);
+    const columns = gridStyle.gridTemplateColumns.split(' ').filter(Boolean).length || 6;
+    const rowGap = parseFloat(gridStyle.rowGap) || 0;
+    const rowStride = channelGridState.rowStride;
+    const totalRows = Math.ceil(channels.length / columns);
+
+    const firstRow = Math.max(0, Math.floor(grid.scrollTop / rowStride) - CHANNEL_GRID_OVERSCAN_ROWS);
+    const lastRow = Math.min(totalRows - 1,
+        Math.ceil((grid.scrollTop + grid.clientHeight) / rowStride) + CHANNEL_GRID_OVERSCAN_ROWS);
+
+    if (firstRow === channelGridState.firstRow && lastRow === channelGridState.lastRow &&
+        columns === channelGridState.columns) {
+        return;
+    }
+
+    // 쓰기 단계 - 윈도우 영역 카드를 한 번에 교체
+    const focusedId = document.activeElement?.classList.contains('channel-card')
+        ? document.activeElement.getAttribute('data-channel-id')
+        : null;
+
+    const topHeight = firstRow > 0 ? firstRow * rowStride - rowGap : 0;
+    const bottomRows = totalRows - 1 - lastRow;
+    const bottomHeight = bottomRows > 0 ? bottomRows * rowStride - rowGap : 0;
+
+    const html = [];
+    if (topHeight > 0) {
+        html.push(`<div class="channel-grid-spacer" style="height: ${topHeight}px"></div>`);
+    }
+    channels.slice(firstRow * columns, (lastRow + 1) * columns).forEach(channel => {
+        html.push(buildChannelCardHtml(channel));
     });
+    if (bottomHeight > 0) {
+        html.push(`<div class="channel-grid-spacer" style="height: ${bottomHeight}px"></div>`);
+    }
+    grid.innerHTML = html.join('');
 
-    grid.innerHTML = html;
+    channelGridState.firstRow = firstRow;
+    channelGridState.lastRow = lastRow;
+    channelGridState.columns = columns;
 
-    // 채널 카드에 툴팁 데이터 추가
-    sortedChannels.forEach(channel => {
-        const card = document.querySelector(`[data-channel-id="${channel.channel_id}"]`);
+    if (focusedId) {
+        grid.querySelector(`[data-channel-id="${focusedId}"]`)?.focus({ preventScroll: true });
+    }
+
+    // 실제 카드 높이로 행 간격 보정 (반응형 CSS 로 카드 높이가 달라질 수 있음)
+    const sampleCard = grid.querySelector('.channel-card');
+    if (sampleCard) {
+        const measuredStride = sampleCard.offsetHeight + rowGap;
+        if (measuredStride > 0 && Math.abs(measuredStride - rowStride) > 0.5) {
+            channelGridState.rowStride = measuredStride;
+            channelGridState.firstRow = -1;
+            scheduleChannelGridRender();
+        }
+    }
+}
+
+// 카드별 리스너 대신 그리드 컨테이너에 위임 이벤트 등록
+function setupChannelGridEvents() {
+    const grid = document.getElementById('channelGrid');
+    if (!grid) return;
+
+    grid.addEventListener('click', (event) => {
+        const card = event.target.closest('.channel-card');
         if (card) {
-            card.setAttribute('data-channel', JSON.stringify(channel));
+            openChannelModal(card.getAttribute('data-channel-id'));
         }
     });
-    // 접근성 개선 적용
-    setTimeout(() => {
-        updateChannelCardAccessibility();
-    }, 100);
+
+    grid.addEventListener('mouseover', (event) => {
+        const card = event.target.closest('.channel-card');
+        if (card && !card.contains(event.relatedTarget)) {
+            showTooltip(event, card);
+        }
+    });
+
+    grid.addEventListener('mouseout', (event) => {
+        const card = event.target.closest('.channel-card');
+        if (card && !card.contains(event.relatedTarget)) {
+            hideTooltip();
+        }
+    });
+
+    grid.addEventListener('mousemove', moveTooltip);
+    grid.addEventListener('scroll', scheduleChannelGridRender, { passive: true });
+
+    window.addEventListener('resize', () => {
+        channelGridState.firstRow = -1;
+        scheduleChannelGridRender();
+    });
 }
 
 // 채널 모달창 열기 - 개선된 오류 처리
@@ -841,6 +1623,7 @@ async function openChannelModal(channelId) {
     title.textContent = `${chStr} 채널 상세 정보 - ${severityLabel} (로딩 중...)`;
     
     modal.style.display = "block";
+    modal.dataset.channelId = String(channelId);
     
     // 포커스 이동
     setTimeout(() => {
@@ -859,7 +1642,10 @@ async function openChannelModal(channelId) {
     };
     
     Object.entries(sections).forEach(([id, message]) => {
-        document.getElementById(id).innerHTML = `<div class="loading-spinner">${message}</div>`;
+        const element = document.getElementById(id);
+        if (element) {
+            element.innerHTML = `<div class="loading-spinner">${message}</div>`;
+        }
     });
 
     try {
@@ -877,28 +1663,33 @@ async function openChannelModal(channelId) {
             severity: currentSeverityFilter
         });
 
-        const result = await makeApiCall(`/api/proxy/channels/${channelId}?${params}`, `채널-${channelId}`);
+        // 서버에서 렌더링된 모달 HTML 조각 요청 (서버 측 조각 캐시 사용)
+        const renderModal = (payload) => {
+            // 상세 정보 / 위치 정보 / 아카이브 섹션 업데이트
+            applyModalFragments(payload.fragments, chStr, severityLabel);
+            // 이미지 섹션 업데이트
+            updateModalImageSections(payload.channel.location_info, chStr);
+        };
+
+        const result = await cachedApiCall(`/api/proxy/channels/${channelId}/fragments?${params}`, `채널-${channelId}`, {
+            onRevalidate: (fresh) => {
+                // 재검증 완료 시 같은 채널 모달이 열려 있을 때만 갱신
+                if (modal.style.display === 'block' && modal.dataset.channelId === String(channelId)) {
+                    renderModal(fresh.data);
+                }
+            }
+        });
         
         if (!result.success) {
             throw new Error(result.error.userMessage);
         }
 
-        const channelData = result.data;
+        const channelData = result.data.channel;
         
         // 모달 제목 업데이트
         title.textContent = `${chStr} 채널 상세 정보 - ${severityLabel}`;
 
-        // 상세 정보 섹션 업데이트
-        updateModalDetailSection(channelData, chStr, severityLabel);
-        
-        // 위치 정보 섹션 업데이트
-        updateModalLocationSection(channelData, chStr);
-        
-        // 이미지 섹션 업데이트
-        updateModalImageSections(channelData, chStr);
-        
-        // 아카이브 섹션 업데이트
-        updateModalArchiveSection(channelData, chStr, severityLabel);
+        renderModal(result.data);
 
         console.log(`[MODAL] 채널 ${channelId} 상세 정보 로드 완료 (${severityLabel}):`, channelData);
 
@@ -911,7 +1702,9 @@ async function openChannelModal(channelId) {
         locationInfo.innerHTML = '<div class="error-message">위치 정보를 불러오지 못했습니다.</div>';
         emapContainer.innerHTML = '<div class="placeholder error">E-MAP을 불러올 수 없습니다</div>';
         fovContainer.innerHTML = '<div class="placeholder error">FOV를 불러올 수 없습니다</div>';
-        archiveContent.innerHTML = '<div class="error-message">아카이브 데이터를 불러오지 못했습니다.</div>';
+        if (archiveContent) {
+            archiveContent.innerHTML = '<div class="error-message">아카이브 데이터를 불러오지 못했습니다.</div>';
+        }
     }
 }
 
@@ -1119,40 +1912,50 @@ function preventOutOfRangeSelection(event) {
     }, 100);
 }
 
-// 날짜 범위 가져오기
+// 날짜 범위 적용 - 날짜 입력 필드 min/max 설정 및 범위 밖 값 조정
+function applyDateRange(data) {
+    dateRange = data;
+    
+    // 날짜 입력 필드에 min/max 설정
+    const startDateInput = document.getElementById('startDate');
+    const endDateInput = document.getElementById('endDate');
+    
+    if (startDateInput && endDateInput) {
+        startDateInput.min = data.start;
+        startDateInput.max = data.end;
+        endDateInput.min = data.start;
+        endDateInput.max = data.end;
+        
+        // 현재 값이 범위를 벗어난 경우 조정
+        if (startDateInput.value && (startDateInput.value < data.start || startDateInput.value > data.end)) {
+            startDateInput.value = data.start;
+            showStatus(`시작일이 허용 범위를 벗어나서 ${data.start}로 조정했습니다.`, 'error');
+        }
+        if (endDateInput.value && (endDateInput.value < data.start || endDateInput.value > data.end)) {
+            endDateInput.value = data.end;
+            showStatus(`종료일이 허용 범위를 벗어나서 ${data.end}로 조정했습니다.`, 'error');
+        }
+        
+        // 날짜 입력 필드 초기화
+        initializeDateInputs();
+    }
+    
+    console.log(`날짜 범위 설정: ${data.start} ~ ${data.end}`);
+    return data;
+}
+
+// 날짜 범위 가져오기 (서버가 페이지에 포함한 범위가 있으면 API 호출 생략)
 async function fetchDateRange() {
+    const inlineRange = window.DASHBOARD_DATE_RANGE;
+    const isIsoDate = (value) => /^\d{4}-\d{2}-\d{2}$/.test(value || '');
+    if (inlineRange && isIsoDate(inlineRange.start) && isIsoDate(inlineRange.end)) {
+        return applyDateRange(inlineRange);
+    }
+
     try {
-        const response = await fetch('/api/date-range');
+        const response = await fetch('/api/date-range', { headers: { [TRACE_HEADER]: generateTraceId() } });
         if (response.ok) {
-            const data = await response.json();
-            dateRange = data;
-            
-            // 날짜 입력 필드에 min/max 설정
-            const startDateInput = document.getElementById('startDate');
-            const endDateInput = document.getElementById('endDate');
-            
-            if (startDateInput && endDateInput) {
-                startDateInput.min = data.start;
-                startDateInput.max = data.end;
-                endDateInput.min = data.start;
-                endDateInput.max = data.end;
-                
-                // 현재 값이 범위를 벗어난 경우 조정
-                if (startDateInput.value && (startDateInput.value < data.start || startDateInput.value > data.end)) {
-                    startDateInput.value = data.start;
-                    showStatus(`시작일이 허용 범위를 벗어나서 ${data.start}로 조정했습니다.`, 'error');
-                }
-                if (endDateInput.value && (endDateInput.value < data.start || endDateInput.value > data.end)) {
-                    endDateInput.value = data.end;
-                    showStatus(`종료일이 허용 범위를 벗어나서 ${data.end}로 조정했습니다.`, 'error');
-                }
-                
-                // 날짜 입력 필드 초기화
-                initializeDateInputs();
-            }
-            
-            console.log(`날짜 범위 설정: ${data.start} ~ ${data.end}`);
-            return data;
+            return applyDateRange(await response.json());
         }
     } catch (error) {
         console.error('날짜 범위 가져오기 실패:', error);
@@ -1210,7 +2013,8 @@ function animateCounter(elementId, targetValue) {
 // 툴팁 표시
 function showTooltip(event, element) {
     const tooltip = document.getElementById('tooltip');
-    const channelData = JSON.parse(element.getAttribute('data-channel'));
+    const channelData = channelGridState.byId.get(element.getAttribute('data-channel-id'));
+    if (!channelData) return;
     const severityLabel = getSeverityLabel(currentSeverityFilter);
 
     let tooltipContent = `
@@ -1338,15 +2142,6 @@ function enableKeyboardNavigation() {
     });
 }
 
-function updateChannelCardAccessibility() {
-    const channelCards = document.querySelectorAll('.channel-card[data-channel-id]');
-    channelCards.forEach(card => {
-        card.setAttribute('tabindex', '0');
-        card.setAttribute('role', 'button');
-        card.setAttribute('aria-label', `채널 ${card.getAttribute('data-channel-id')} 상세 정보 보기`);
-    });
-}
-
 // 오류 처리 개선
 function handleImageError(img, container, altText) {
     container.innerHTML = `
@@ -1359,66 +2154,19 @@ function handleImageError(img, container, altText) {
 
 // ========== 모달 업데이트 함수들 ==========
 
-// 모달 상세 정보 섹션 업데이트
-function updateModalDetailSection(channelData, chStr, severityLabel) {
-    const detailContent = document.getElementById('detailContent');
-    const counts = channelData.counts || { total: 0, critical: 0, warn: 0, info: 0 };
-
-    let detailHtml = `
-        <div class="detail-item">
-            <span>${severityLabel} 이벤트:</span>
-            <strong>${counts.total}건</strong>
-        </div>
-        <div class="detail-item">
-            <span>Critical:</span>
-            <strong>${counts.critical}건</strong>
-        </div>
-        <div class="detail-item">
-            <span>Warning:</span>
-            <strong>${counts.warn}건</strong>
-        </div>
-        <div class="detail-item">
-            <span>Info:</span>
-            <strong>${counts.info}건</strong>
-        </div>
-    `;
+// 서버 렌더링 HTML 조각을 모달에 적용
+function applyModalFragments(fragments, chStr, severityLabel) {
+    document.getElementById('detailContent').innerHTML = fragments.detail;
+    document.getElementById('locationInfo').innerHTML = fragments.location;
 
-    // 이벤트 타입별 상세 정보
-    if (channelData.by_type && channelData.by_type.length > 0) {
-        detailHtml += `<div style="border-top: 1px solid #dee2e6; margin: 15px 0; padding-top: 15px;"></div>`;
-        channelData.by_type.forEach(eventType => {
-            detailHtml += `
-                <div class="detail-item">
-                    <span>${eventType.label || eventType.type_name || eventType.type_code}:</span>
-                    <strong>${eventType.count}건</strong>
-                </div>
-            `;
-        });
+    const archiveTitle = document.getElementById('archiveTitle');
+    const archiveContent = document.getElementById('archiveContent');
+    if (archiveTitle) {
+        archiveTitle.textContent = `${chStr} 이벤트 로그 현황 아카이브 - ${severityLabel}`;
+    }
+    if (archiveContent) {
+        archiveContent.innerHTML = fragments.archive;
     }
-
-    detailContent.innerHTML = detailHtml;
-}
-
-function updateModalLocationSection(channelData, chStr) {
-    const locationInfo = document.getElementById('locationInfo');
-    locationInfo.innerHTML = `
-        <div class="location-item">
-            <h4>채널 번호</h4>
-            <p>${chStr}</p>
-        </div>
-        <div class="location-item">
-            <h4>설비명</h4>
-            <p>${channelData.fov_location_name || '정보 없음'}</p>
-        </div>
-        <div class="location-item">
-            <h4>공정명</h4>
-            <p>${channelData.area_name || '정보 없음'}</p>
-        </div>
-        <div class="location-item">
-            <h4>상태</h4>
-            <p>${channelData.status || 'OFF'}</p>
-        </div>
-    `;
 }
 
 function updateModalImageSections(channelData, chStr) {
@@ -1464,48 +2212,60 @@ function updateModalImageSections(channelData, chStr) {
     }
 }
 
-function updateModalArchiveSection(channelData, chStr, severityLabel) {
-    const archiveTitle = document.getElementById('archiveTitle');
-    const archiveContent = document.getElementById('archiveContent');
 
-    archiveTitle.textContent = `${chStr} 이벤트 로그 현황 아카이브 - ${severityLabel}`;
-    
-    let archiveHtml = '';
+// ========== 차트 업데이트 프레임 시간 측정 (개발용) ==========
 
-    if (channelData.by_type && channelData.by_type.length > 0) {
-        channelData.by_type.forEach(eventType => {
-            archiveHtml += `
-                <div class="archive-item">
-                    <h4 class="archive-subtitle">${eventType.label || eventType.type_name || eventType.type_code} (${eventType.count}건)</h4>
-                    <div class="detail-item">
-                        <span>발생 건수:</span>
-                        <strong>${eventType.count}건</strong>
-                    </div>
-                    <div class="detail-item">
-                        <span>타입 코드:</span>
-                        <strong>${eventType.type_code || 'N/A'}</strong>
-                    </div>
-                </div>
-            `;
-        });
-    } else {
-        const range = channelData.range || { start: 'N/A', end: 'N/A' };
-        const counts = channelData.counts || { total: 0 };
-        
-        archiveHtml = `
-            <div class="archive-item">
-                <h4 class="archive-subtitle">표시할 이벤트 아카이브가 없습니다</h4>
-                <div class="detail-item">
-                    <span>기간:</span>
-                    <strong>${range.start} ~ ${range.end}</strong>
-                </div>
-                <div class="detail-item">
-                    <span>총 이벤트:</span>
-                    <strong>${counts.total}건</strong>
-                </div>
-            </div>
-        `;
+// 콘솔에서 benchmarkChartUpdates() 실행
+// - iterations: 업데이트 횟수
+// - changeEvery: N회마다 데이터 변경 (그 사이에는 동일 데이터로 업데이트 생략 경로 측정)
+// - recreate: true 이면 매번 차트를 파기 후 재생성 (기존 방식 비교용)
+async function benchmarkChartUpdates(iterations = 60, { changeEvery = 1, recreate = false } = {}) {
+    const severity = currentSeverityFilter;
+    const labels = ['화재', '연기', '침입', '쓰러짐', '안전모 미착용'];
+    const updateTimes = [];
+    const frameTimes = [];
+
+    const percentileOf = (values, pct) => {
+        const sorted = [...values].sort((a, b) => a - b);
+        return sorted[Math.min(sorted.length - 1, Math.ceil(pct / 100 * sorted.length) - 1)] || 0;
+    };
+
+    let lastFrame = performance.now();
+    for (let i = 0; i < iterations; i++) {
+        const variant = Math.floor(i / changeEvery);
+        const typeData = labels.map((label, index) => ({ label, count: 10 + ((variant * 7 + index * 13) % 50) }));
+        const hourlyData = Array.from({length: 24}, (_, hour) => ({ hour, count: (variant * 3 + hour * 5) % 40 }));
+
+        if (recreate) {
+            if (eventTypeChart) { eventTypeChart.destroy(); eventTypeChart = null; }
+            if (hourlyChart) { hourlyChart.destroy(); hourlyChart = null; }
+        }
+
+        const started = performance.now();
+        createEventTypeChart(typeData, severity);
+        createHourlyChart(hourlyData, severity);
+        updateTimes.push(performance.now() - started);
+
+        await new Promise(resolve => requestAnimationFrame(resolve));
+        const now = performance.now();
+        frameTimes.push(now - lastFrame);
+        lastFrame = now;
     }
 
-    archiveContent.innerHTML = archiveHtml;
+    const summary = {
+        mode: recreate ? 'recreate' : 'incremental',
+        iterations,
+        changeEvery,
+        update_p50_ms: +percentileOf(updateTimes, 50).toFixed(2),
+        update_p95_ms: +percentileOf(updateTimes, 95).toFixed(2),
+        frame_p50_ms: +percentileOf(frameTimes, 50).toFixed(2),
+        frame_p95_ms: +percentileOf(frameTimes, 95).toFixed(2),
+        frame_max_ms: +Math.max(...frameTimes).toFixed(2),
+        long_frames: frameTimes.filter(time => time > 1000 / 60).length
+    };
+    console.table([summary]);
+
+    // 측정 후 실제 데이터로 복원
+    loadAllData();
+    return summary;
 }
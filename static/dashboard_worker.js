@@ -0,0 +1,14 @@
+// 대시보드 응답 처리 Web Worker
+// 프록시 API 호출, JSON 파싱, 렌더링 준비 데이터 계산을 메인 스레드 밖에서 수행한다.
+importScripts('/static/render_prep.js');
+
+self.onmessage = async (event) => {
+    const { id, url, kind, severity, traceId } = event.data;
+
+    try {
+        const { response, transfer } = await fetchAndPrepare(url, kind, severity, traceId);
+        self.postMessage({ id, ...response }, transfer);
+    } catch (error) {
+        self.postMessage({ id, networkError: error.message });
+    }
+};
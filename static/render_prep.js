@@ -0,0 +1,179 @@
+// 렌더링 준비 함수 (DOM 비의존)
+// 메인 스레드와 Web Worker(dashboard_worker.js) 양쪽에서 사용한다.
+
+// 컬럼형 응답 (서버 components/wire_format.py 와 동일한 형식)
+const COLUMNAR_MIME = 'application/vnd.voda.columnar+json';
+const COLUMNAR_FORMAT = 'columnar-v1';
+const COLUMNAR_KINDS = ['channels', 'analytics'];
+
+// 요청 추적 헤더 (서버 components/tracing.py 와 동일)
+const TRACE_HEADER = 'X-Trace-Id';
+
+// 응답 종류별 요청 헤더 - 컬럼형을 지원하는 API 는 Accept 로 우선 요청, 추적 ID 가 있으면 함께 전달
+function getRequestHeaders(kind, traceId = null) {
+    const headers = {};
+    if (COLUMNAR_KINDS.includes(kind)) {
+        headers['Accept'] = `${COLUMNAR_MIME}, application/json;q=0.9`;
+    }
+    if (traceId) {
+        headers[TRACE_HEADER] = traceId;
+    }
+    return headers;
+}
+
+// API 호출 후 디코딩/렌더링 준비까지 수행하며 구간별 시간(ms) 측정
+// 반환값의 transfer 는 Worker 에서 postMessage 로 넘길 버퍼 목록이다.
+async function fetchAndPrepare(url, kind, severity, traceId = null) {
+    const started = performance.now();
+    const response = await fetch(url, { headers: getRequestHeaders(kind, traceId) });
+    const received = performance.now();
+    const data = decodeColumnarPayload(await response.json());
+    const parsed = performance.now();
+
+    let prepared = null;
+    let transfer = [];
+    if (response.ok) {
+        ({ prepared, transfer } = prepareApiPayload(kind, data, severity));
+    }
+
+    return {
+        response: {
+            ok: response.ok,
+            status: response.status,
+            data,
+            pollInterval: response.headers.get('X-Poll-Interval'),
+            retryAfter: response.headers.get('Retry-After'),
+            traceId: response.headers.get(TRACE_HEADER) || traceId,
+            serverTiming: response.headers.get('Server-Timing'),
+            clientTiming: {
+                network: received - started,
+                decode: parsed - received,
+                prepare: performance.now() - parsed
+            },
+            prepared
+        },
+        transfer
+    };
+}
+
+// 컬럼형 응답을 기존 JSON 응답 구조로 복원 (일반 JSON 이면 그대로 반환)
+// 컬럼형 테이블(encode_table)을 행 목록으로 복원 - 스키마가 맞지 않으면 예외
+function decodeColumnarTable(table, dict) {
+    const rowCount = table.row_count;
+    const rows = Array.from({ length: rowCount }, () => ({}));
+
+    for (const field of table.fields) {
+        const column = table.columns[field];
+        const isNested = table.nested_fields.includes(field);
+        const isDict = table.dict_fields.includes(field);
+        const expectedLength = isNested ? rowCount + 1 : rowCount;
+        const actualLength = isNested ? column?.offsets?.length : column?.length;
+        if (actualLength !== expectedLength) {
+            throw new Error(`컬럼형 응답 스키마 불일치: ${field} (길이 ${actualLength}, 예상 ${expectedLength})`);
+        }
+
+        const missing = new Set(table.missing[field] || []);
+        const nestedRows = isNested ? decodeColumnarTable(column.table, dict) : null;
+
+        for (let row = 0; row < rowCount; row++) {
+            if (missing.has(row)) continue;
+            if (isNested) {
+                rows[row][field] = nestedRows.slice(column.offsets[row], column.offsets[row + 1]);
+            } else if (isDict) {
+                const index = column[row];
+                if (index >= dict.length) {
+                    throw new Error(`컬럼형 응답 사전 인덱스 범위 초과: ${field}[${row}] = ${index}`);
+                }
+                rows[row][field] = index >= 0 ? dict[index] : null;
+            } else {
+                rows[row][field] = column[row];
+            }
+        }
+    }
+
+    return rows;
+}
+
+function decodeColumnarPayload(data) {
+    if (!data || data.format !== COLUMNAR_FORMAT) return data;
+
+    if (!COLUMNAR_KINDS.includes(data.kind) || !data.tables) {
+        throw new Error(`알 수 없는 컬럼형 응답: ${data.kind}`);
+    }
+
+    // 행 목록 필드는 테이블에서 복원하고 나머지 최상위 필드는 그대로 사용
+    const dict = data.dict || [];
+    const decoded = { ...data.meta };
+    for (const [field, table] of Object.entries(data.tables)) {
+        decoded[field] = decodeColumnarTable(table, dict);
+    }
+    return decoded;
+}
+
+// severity별 색상 배열 반환
+function getSeverityColors(severity) {
+    switch(severity) {
+        case 'critical':
+            return ['#DD2E44', '#E74C3C', '#C0392B', '#A93226', '#922B21'];
+        case 'warn':
+            return ['#F4900C', '#E67E22', '#D68910', '#B7950B', '#9A7D0A'];
+        case 'info':
+            return ['#77B256', '#58D68D', '#52C41A', '#389E0D', '#237804'];
+        default:
+            return ['#FF6384', '#6EC6FF', '#FFCE56', '#4BC0C0', '#9966FF'];
+    }
+}
+
+// 이벤트 타입 차트용 라벨/값/색상
+function prepareEventTypeChart(typeData, severity) {
+    const items = typeData || [];
+    const counts = new Float64Array(items.length);
+    items.forEach((item, index) => { counts[index] = item.count || 0; });
+
+    return {
+        labels: items.map(item => item.label),
+        counts: counts,
+        colors: getSeverityColors(severity).slice(0, items.length)
+    };
+}
+
+// 시간대별 차트용 24시간 값 배열
+function prepareHourlyCounts(hourlyData) {
+    const counts = new Float64Array(24);
+    (hourlyData || []).forEach(item => {
+        if (item.hour >= 0 && item.hour < 24) {
+            counts[item.hour] = item.count || 0;
+        }
+    });
+    return counts;
+}
+
+// 채널 그리드용 채널 번호순 정렬 목록
+function prepareChannelGrid(items) {
+    return {
+        channels: (items || []).slice().sort((a, b) => parseInt(a.channel_id) - parseInt(b.channel_id))
+    };
+}
+
+// API 응답 종류별 렌더링 준비 데이터 생성
+// transfer 에는 Worker → 메인 스레드로 복사 없이 넘길 수 있는 버퍼 목록이 담긴다.
+function prepareApiPayload(kind, data, severity) {
+    if (!data) {
+        return { prepared: null, transfer: [] };
+    }
+
+    switch (kind) {
+        case 'analytics': {
+            const typeChart = prepareEventTypeChart(data.type_pie, severity);
+            const hourlyCounts = prepareHourlyCounts(data.hourly_bar);
+            return {
+                prepared: { typeChart, hourlyCounts },
+                transfer: [typeChart.counts.buffer, hourlyCounts.buffer]
+            };
+        }
+        case 'channels':
+            return { prepared: prepareChannelGrid(data.items), transfer: [] };
+        default:
+            return { prepared: null, transfer: [] };
+    }
+}
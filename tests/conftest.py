@@ -0,0 +1,61 @@
+"""테스트 공통 설정 - 가짜 백엔드를 띄우고 BACKEND_URL 을 지정한 뒤 앱 import"""
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'api'))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+from fake_backend import start_fake_backend
+
+# 백엔드/요청 제한 설정은 모듈 import 시점에 읽으므로 앱 import 전에 지정
+_fake_backend, FAKE_BACKEND_URL = start_fake_backend()
+os.environ['BACKEND_URL'] = FAKE_BACKEND_URL
+os.environ['RATE_LIMIT_ENABLED'] = '0'
+os.environ.pop('BACKEND_SITES', None)
+os.environ.pop('RATE_LIMIT_TRUST_FORWARDED', None)
+os.environ.pop('CHANNEL_MONITOR_ENABLED', None)
+
+import index
+from components import backend_registry, date_range, rate_limiter, refresh_hints
+from components.channel_detail_modal import ChannelFragmentCache
+from components.channel_monitor import ChannelMonitor
+
+QUERY = 'start=2025-08-01&end=2025-08-31&severity=all'
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    """요청 간 공유되는 클래스 상태 초기화"""
+    backend_registry.BackendRegistry._backends = None
+    backend_registry.BackendRegistry._rings = {}
+    date_range.DateRangeCache.clear()
+    ChannelFragmentCache._entries.clear()
+    refresh_hints.RefreshHintUtils._state.clear()
+    rate_limiter.RateLimiter._buckets.clear()
+    rate_limiter.RateLimiter._route_limits = None
+    ChannelMonitor._states.clear()
+    ChannelMonitor._baselines.clear()
+    ChannelMonitor._recent.clear()
+    yield
+
+
+@pytest.fixture
+def client():
+    return index.app.test_client()
+
+
+@pytest.fixture
+def upstream_calls(monkeypatch):
+    """백엔드 호출 경로 목록 (Backend._get 호출 기록)"""
+    calls = []
+    original = backend_registry.Backend._get
+
+    def recording_get(self, path, params=None):
+        calls.append(path)
+        return original(self, path, params)
+
+    monkeypatch.setattr(backend_registry.Backend, '_get', recording_get)
+    return calls
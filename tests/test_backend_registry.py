@@ -0,0 +1,77 @@
+"""백엔드 호출 결과 처리와 헬스 상태 (비 JSON 응답, 전체 장애 시 복구 확인 간격)"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from components.backend_registry import Backend, BackendRegistry
+
+
+class HtmlHandler(BaseHTTPRequestHandler):
+    """200 이지만 JSON 이 아닌 응답을 주는 백엔드 (프록시 오류 페이지 등)"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = b'<html>maintenance</html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def html_backend_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), HtmlHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_non_json_response_is_a_failed_result(html_backend_url):
+    backend = Backend('html', html_backend_url)
+
+    result = backend.get('/api/v1/date-range')
+
+    assert not result.ok
+    assert result.status_code == 502
+    assert 'invalid JSON' in result.error
+    assert backend.consecutive_failures == 1
+
+
+def test_non_json_response_marks_backend_unhealthy(html_backend_url):
+    backend = Backend('html', html_backend_url)
+
+    for _ in range(Backend.FAILURE_THRESHOLD):
+        backend.get('/api/v1/date-range')
+
+    assert not backend.is_healthy()
+
+
+def test_all_unhealthy_backends_are_probed_once_per_interval(monkeypatch, upstream_calls):
+    backend = Backend('down', 'http://127.0.0.1:9')
+    backend.consecutive_failures = Backend.FAILURE_THRESHOLD
+    backend.last_failure_at = float('inf')
+    monkeypatch.setattr(BackendRegistry, '_backends', [backend])
+
+    results = [BackendRegistry.fan_out('/api/v1/date-range')[0] for _ in range(5)]
+
+    assert len(upstream_calls) == 1
+    assert [result.status_code for result in results[1:]] == [503] * 4
+    assert all('cooling down' in result.error for result in results[1:])
+
+    backend.last_probe_at -= Backend.PROBE_INTERVAL_SECONDS
+    BackendRegistry.fan_out('/api/v1/date-range')
+    assert len(upstream_calls) == 2
+
+
+def test_proxy_returns_backend_error_for_non_json(client, monkeypatch, html_backend_url):
+    monkeypatch.setattr(BackendRegistry, '_backends', [Backend('html', html_backend_url)])
+
+    response = client.get('/api/date-range')
+
+    assert response.status_code == 502
+    assert 'invalid JSON' in response.get_json()['error']
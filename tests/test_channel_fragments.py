@@ -0,0 +1,88 @@
+"""채널 상세 모달 조각 캐시 (/api/proxy/channels/<id>/fragments)"""
+from fake_backend import FakeBackendData
+from components import channel_detail_modal
+
+from conftest import QUERY
+
+FRAGMENTS_URL = f'/api/proxy/channels/1/fragments?{QUERY}'
+
+
+def _detail_calls(upstream_calls):
+    # 날짜 범위 검증용 조회는 제외
+    return [path for path in upstream_calls if path.startswith('/api/v1/channels/')]
+
+
+def test_fresh_entry_is_served_without_backend_call(client, upstream_calls):
+    first = client.get(FRAGMENTS_URL)
+    second = client.get(FRAGMENTS_URL)
+
+    assert first.status_code == 200
+    assert first.headers['X-Fragment-Cache'] == 'MISS'
+    assert second.headers['X-Fragment-Cache'] == 'HIT'
+    assert second.get_json() == first.get_json()
+    assert _detail_calls(upstream_calls) == ['/api/v1/channels/1']
+
+
+def test_expired_entry_is_revalidated_against_backend(client, upstream_calls, monkeypatch):
+    client.get(FRAGMENTS_URL)
+    monkeypatch.setattr(channel_detail_modal, 'FRAGMENT_CACHE_TTL', 0)
+
+    response = client.get(FRAGMENTS_URL)
+
+    assert response.headers['X-Fragment-Cache'] == 'REVALIDATED'
+    assert len(_detail_calls(upstream_calls)) == 2
+
+
+def test_cache_key_includes_severity(client, upstream_calls):
+    client.get(FRAGMENTS_URL)
+    response = client.get(FRAGMENTS_URL.replace('severity=all', 'severity=critical'))
+
+    assert response.headers['X-Fragment-Cache'] == 'MISS'
+    assert len(_detail_calls(upstream_calls)) == 2
+
+
+def test_fragments_include_severity_label_and_type_code(client):
+    response = client.get(FRAGMENTS_URL.replace('severity=all', 'severity=critical'))
+    fragments = response.get_json()['fragments']
+
+    assert '🔴 위험 이벤트:' in fragments['detail']
+    assert '타입 코드:' in fragments['archive']
+    assert 'FIRE' in fragments['archive']
+
+
+SCRIPT = '<script>alert(1)</script>'
+
+
+def test_backend_strings_are_escaped_in_fragments(client, monkeypatch):
+    def channel_detail(self, channel_id, start, end):
+        return {
+            'channel_id': '1', 'count': 1, 'status': SCRIPT,
+            'counts': {'total': 1, 'critical': 1, 'warn': 0, 'info': 0},
+            'by_type': [{'type_code': SCRIPT, 'label': SCRIPT, 'count': 1}],
+            'fov_location_name': SCRIPT, 'area_name': SCRIPT,
+        }
+
+    monkeypatch.setattr(FakeBackendData, 'channel_detail', channel_detail)
+    fragments = client.get(FRAGMENTS_URL).get_json()['fragments']
+
+    for name in ('detail', 'location', 'archive'):
+        assert '<script>' not in fragments[name]
+    assert fragments['location'].count('&lt;script&gt;') == 3
+    assert fragments['archive'].count('&lt;script&gt;') == 2
+
+
+def test_empty_archive_escapes_range(client, monkeypatch):
+    monkeypatch.setattr(FakeBackendData, 'channel_detail', lambda self, channel_id, start, end: {
+        'channel_id': '1', 'by_type': [], 'range': {'start': SCRIPT, 'end': '2025-08-31'},
+    })
+    archive = client.get(FRAGMENTS_URL).get_json()['fragments']['archive']
+
+    assert '<script>' not in archive
+    assert '&lt;script&gt;alert(1)&lt;/script&gt; ~ 2025-08-31' in archive
+
+
+def test_dashboard_has_archive_container(client):
+    html = client.get('/').get_data(as_text=True)
+
+    assert 'id="archiveContent"' in html
+    assert 'id="archiveTitle"' in html
@@ -0,0 +1,98 @@
+"""채널 모니터 (상태 변경/긴급 이벤트 급증 감지, 비활성화 기본값)"""
+from datetime import datetime, timedelta, timezone
+
+from fake_backend import FakeBackendData
+from components import channel_monitor, channel_stats_panel
+from components.channel_monitor import ChannelMonitor
+from components.refresh_hints import RefreshHintUtils
+
+KST = timezone(timedelta(hours=9))
+
+
+def _snapshot(status='ON', critical=0):
+    """severity=critical 채널 목록 응답 (가짜 백엔드와 같은 by_type 형태 - 중요도 필드 없음)"""
+    by_type = [{'type_code': 'FIRE', 'label': '화재', 'count': critical}]
+    return {'items': [{'channel_id': '1', 'name': 'CH01', 'status': status, 'count': critical, 'by_type': by_type}]}
+
+
+def test_stream_is_disabled_by_default(client):
+    response = client.get('/api/stream/channel-events')
+
+    assert response.status_code == 404
+    assert response.get_json()['error'] == 'channel monitor disabled'
+
+
+def test_dashboard_does_not_subscribe_when_disabled(client):
+    html = client.get('/').get_data(as_text=True)
+    assert 'window.DASHBOARD_CHANNEL_EVENTS = false;' in html
+
+
+def test_snapshots_are_ignored_when_disabled():
+    today = RefreshHintUtils.get_today().isoformat()
+    ChannelMonitor._pending_snapshot = None
+
+    ChannelMonitor.offer_snapshot(_snapshot(), today, today)
+
+    assert ChannelMonitor._pending_snapshot is None
+
+
+def test_snapshots_are_kept_when_enabled(monkeypatch):
+    monkeypatch.setattr(channel_monitor, 'CHANNEL_MONITOR_ENABLED', True)
+    today = RefreshHintUtils.get_today().isoformat()
+
+    ChannelMonitor.offer_snapshot(_snapshot(), today, today)
+
+    assert ChannelMonitor._pending_snapshot is not None
+    ChannelMonitor._pending_snapshot = None
+
+
+def test_proxy_offers_only_critical_snapshots(client, monkeypatch):
+    monkeypatch.setattr(channel_monitor, 'CHANNEL_MONITOR_ENABLED', True)
+    today = RefreshHintUtils.get_today().isoformat()
+    monkeypatch.setattr(FakeBackendData, 'date_range', lambda self: {'start': '2025-07-26', 'end': today})
+    ChannelMonitor._pending_snapshot = None
+
+    client.get(f'/api/proxy/channels?start={today}&end={today}&severity=all')
+    assert ChannelMonitor._pending_snapshot is None
+
+    client.get(f'/api/proxy/channels?start={today}&end={today}&severity=critical')
+    assert ChannelMonitor._pending_snapshot is not None
+    ChannelMonitor._pending_snapshot = None
+
+
+def test_tick_fetches_critical_channel_list(monkeypatch):
+    requested = []
+
+    def fetch_channel_list(start_date, end_date, severity='all', site=None):
+        requested.append(severity)
+        return _snapshot(), []
+
+    monkeypatch.setattr(channel_stats_panel, 'fetch_channel_list', fetch_channel_list)
+    ChannelMonitor._pending_snapshot = None
+
+    ChannelMonitor.tick()
+
+    assert requested == ['critical']
+
+
+def test_status_change_is_emitted_once():
+    now = datetime(2025, 8, 1, 10, 0, tzinfo=KST)
+
+    assert ChannelMonitor.evaluate(_snapshot('ON'), now) == []
+    events = ChannelMonitor.evaluate(_snapshot('OFF'), now + timedelta(minutes=1))
+    repeated = ChannelMonitor.evaluate(_snapshot('OFF'), now + timedelta(minutes=2))
+
+    assert [(event['type'], event['from'], event['to']) for event in events] == [('status_change', 'ON', 'OFF')]
+    assert repeated == []
+
+
+def test_critical_spike_is_emitted_once_per_hour():
+    now = datetime(2025, 8, 1, 10, 0, tzinfo=KST)
+
+    ChannelMonitor.evaluate(_snapshot(critical=0), now)
+    events = ChannelMonitor.evaluate(_snapshot(critical=40), now + timedelta(minutes=5))
+    repeated = ChannelMonitor.evaluate(_snapshot(critical=80), now + timedelta(minutes=10))
+
+    assert [event['type'] for event in events] == ['critical_spike']
+    assert events[0]['count'] == 40
+    assert repeated == []
@@ -0,0 +1,153 @@
+"""날짜 범위 캐시와 프록시 요청 날짜 중앙 검증"""
+from datetime import timedelta
+import threading
+import time
+
+import pytest
+
+from fake_backend import FakeBackendData
+from components import date_range
+from components.backend_registry import Backend, BackendRegistry
+from components.refresh_hints import RefreshHintUtils
+
+SUMMARY_URL = '/api/proxy/events/summary'
+
+
+def _range_calls(upstream_calls):
+    return [path for path in upstream_calls if path == '/api/v1/date-range']
+
+
+@pytest.fixture
+def backend_range(monkeypatch):
+    """가짜 백엔드가 반환하는 조회 가능 범위 (테스트 중 변경 가능)"""
+    current = {'start': '2025-07-26', 'end': '2025-09-24'}
+    monkeypatch.setattr(FakeBackendData, 'date_range', lambda self: dict(current))
+    return current
+
+
+@pytest.mark.parametrize('query, field', [
+    ('start=2025-8-01&end=2025-08-31', 'start'),
+    ('start=2025-08-01&end=2025-02-30', 'end'),
+    ('start=2025-08-31&end=2025-08-01', 'end'),
+])
+def test_invalid_dates_are_rejected_in_backend_error_shape(client, upstream_calls, query, field):
+    response = client.get(f'{SUMMARY_URL}?{query}')
+    body = response.get_json()
+
+    assert response.status_code == 400
+    assert body['error'] == 'invalid_request'
+    assert body['detail'][0]['loc'] == ['query', field]
+    assert '/api/v1/events/summary' not in upstream_calls
+
+
+@pytest.mark.parametrize('query', [
+    'start=2025-07-25&end=2025-08-01',
+    'start=2025-08-01&end=2025-09-25',
+])
+def test_dates_outside_backend_range_are_rejected(client, backend_range, query):
+    response = client.get(f'{SUMMARY_URL}?{query}')
+    body = response.get_json()
+
+    assert response.status_code == 400
+    assert body['error'] == 'date_out_of_range'
+    assert body['range'] == backend_range
+
+
+def test_range_bounds_are_inclusive(client, backend_range):
+    response = client.get(f'{SUMMARY_URL}?start=2025-07-26&end=2025-09-24')
+    assert response.status_code == 200
+
+
+def test_date_range_is_cached_with_bounded_max_age(client, upstream_calls):
+    first = client.get('/api/date-range')
+    second = client.get('/api/date-range')
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.get_json() == first.get_json()
+    max_age = int(second.headers['Cache-Control'].rsplit('=', 1)[1])
+    assert 0 < max_age <= date_range.DATE_RANGE_CACHE_TTL
+    assert len(_range_calls(upstream_calls)) == 1
+
+
+def test_expired_entry_is_fetched_again(client, upstream_calls):
+    client.get('/api/date-range')
+    date_range.DateRangeCache._entries[None]['ttl'] = 0
+
+    assert client.get('/api/date-range').headers['X-Cache'] == 'MISS'
+    assert len(_range_calls(upstream_calls)) == 2
+
+
+def test_concurrent_misses_share_one_fetch(upstream_calls, monkeypatch):
+    def slow_range(self):
+        time.sleep(0.2)
+        return {'start': '2025-07-26', 'end': '2025-09-24'}
+
+    monkeypatch.setattr(FakeBackendData, 'date_range', slow_range)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(date_range.DateRangeCache.fetch()))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(_range_calls(upstream_calls)) == 1
+    assert [data for data, _, _ in results] == [{'start': '2025-07-26', 'end': '2025-09-24'}] * 5
+
+
+def test_failed_fetch_is_cached_briefly(client, monkeypatch, upstream_calls):
+    monkeypatch.setattr(BackendRegistry, '_backends', [Backend('down', 'http://127.0.0.1:9')])
+
+    first = client.get('/api/date-range')
+    second = client.get('/api/date-range')
+
+    assert first.status_code == second.status_code == 500
+    assert len(_range_calls(upstream_calls)) == 1
+    assert date_range.DateRangeCache.get_cached()['ttl'] == date_range.DATE_RANGE_NEGATIVE_TTL
+
+
+def test_advanced_backend_end_is_refetched_before_rejecting(client, backend_range, upstream_calls, monkeypatch):
+    today = RefreshHintUtils.get_today()
+    backend_range['end'] = (today - timedelta(days=1)).isoformat()
+    client.get('/api/date-range')
+
+    # 백엔드 종료일이 오늘로 늘어남
+    backend_range['end'] = today.isoformat()
+    monkeypatch.setattr(date_range, 'DATE_RANGE_RECHECK_AGE', 0)
+    response = client.get(f'{SUMMARY_URL}?start={today}&end={today}')
+
+    assert response.status_code == 200
+    assert len(_range_calls(upstream_calls)) == 2
+
+
+def test_recent_entry_is_not_refetched_for_rejections(client, backend_range, upstream_calls):
+    today = RefreshHintUtils.get_today()
+    backend_range['end'] = (today - timedelta(days=1)).isoformat()
+    client.get('/api/date-range')
+
+    responses = [client.get(f'{SUMMARY_URL}?start={today}&end={today}') for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [400] * 3
+    assert len(_range_calls(upstream_calls)) == 1
+
+
+def test_future_dates_do_not_trigger_refetch(client, backend_range, upstream_calls, monkeypatch):
+    monkeypatch.setattr(date_range, 'DATE_RANGE_RECHECK_AGE', 0)
+    future = (RefreshHintUtils.get_today() + timedelta(days=30)).isoformat()
+    backend_range['end'] = RefreshHintUtils.get_today().isoformat()
+
+    response = client.get(f'{SUMMARY_URL}?start={future}&end={future}')
+
+    assert response.status_code == 400
+    assert len(_range_calls(upstream_calls)) == 1
+
+
+def test_dashboard_inlines_range_only_on_cache_hit(client, upstream_calls):
+    miss = client.get('/').get_data(as_text=True)
+    assert 'window.DASHBOARD_DATE_RANGE = null;' in miss
+    assert _range_calls(upstream_calls) == []
+
+    client.get('/api/date-range')
+    hit = client.get('/').get_data(as_text=True)
+    assert '"end": "2025-09-24"' in hit
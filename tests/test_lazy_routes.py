@@ -0,0 +1,63 @@
+"""지연 로딩 라우트 등록 (블루프린트 소스에서 라우트 추출)"""
+import importlib
+import os
+import subprocess
+import sys
+
+from flask import Flask
+
+import index
+
+from conftest import ROOT_DIR
+
+
+def _blueprint_rules(module_name, blueprint_attr):
+    app = Flask(__name__)
+    blueprint = getattr(importlib.import_module(module_name), blueprint_attr)
+    app.register_blueprint(blueprint, url_prefix=index.BLUEPRINT_URL_PREFIX)
+    return {
+        (rule.rule, rule.endpoint.rsplit('.', 1)[-1], frozenset(rule.methods))
+        for rule in app.url_map.iter_rules() if rule.endpoint != 'static'
+    }
+
+
+def test_discovered_routes_match_blueprints():
+    for module_name, blueprint_attr in index.COMPONENT_BLUEPRINTS:
+        app = Flask(__name__)
+        for rule, function_name, methods in index.discover_blueprint_routes(module_name, blueprint_attr):
+            app.add_url_rule(index.BLUEPRINT_URL_PREFIX + rule, endpoint=function_name,
+                             methods=methods, view_func=lambda: None)
+        discovered = {
+            (rule.rule, rule.endpoint, frozenset(rule.methods))
+            for rule in app.url_map.iter_rules() if rule.endpoint != 'static'
+        }
+        assert discovered == _blueprint_rules(module_name, blueprint_attr)
+
+
+def test_every_blueprint_route_is_registered_on_app():
+    registered = {rule.rule for rule in index.app.url_map.iter_rules()}
+    for module_name, blueprint_attr in index.COMPONENT_BLUEPRINTS:
+        for rule, _, _ in index.discover_blueprint_routes(module_name, blueprint_attr):
+            assert index.BLUEPRINT_URL_PREFIX + rule in registered
+
+
+def test_components_are_not_imported_at_startup():
+    code = (
+        "import sys, index; "
+        "print(','.join(m for m, _ in index.COMPONENT_BLUEPRINTS if m in sys.modules))"
+    )
+    env = dict(os.environ, LAZY_IMPORTS='1')
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.join(ROOT_DIR, 'api'), env=env)
+    assert output.decode().strip() == ''
+
+
+def test_dashboard_request_does_not_import_backend_modules():
+    code = (
+        "import sys, index; "
+        "index.app.test_client().get('/'); "
+        "print(','.join(m for m in ('requests', 'components.date_range', 'components.backend_registry') "
+        "if m in sys.modules))"
+    )
+    env = dict(os.environ, LAZY_IMPORTS='1')
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.join(ROOT_DIR, 'api'), env=env)
+    assert output.decode().strip() == ''
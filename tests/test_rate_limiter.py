@@ -0,0 +1,81 @@
+"""프록시 API 요청 제한 (429 응답, 캐시 응답 토큰 반환, 클라이언트 식별)"""
+import pytest
+
+from components import rate_limiter
+from components.rate_limiter import RateLimiter
+
+from conftest import QUERY
+
+SUMMARY_URL = f'/api/proxy/events/summary?{QUERY}'
+FRAGMENTS_URL = f'/api/proxy/channels/1/fragments?{QUERY}'
+BURST = 2
+
+
+@pytest.fixture(autouse=True)
+def limited(monkeypatch):
+    """모든 라우트를 버스트 2, 보충 거의 없음으로 제한"""
+    monkeypatch.setattr(rate_limiter, 'RATE_LIMIT_ENABLED', True)
+    monkeypatch.setattr(rate_limiter, 'RATE_LIMIT_RATE', 0.001)
+    monkeypatch.setattr(rate_limiter, 'RATE_LIMIT_BURST', BURST)
+
+
+def test_exhausted_bucket_returns_429_with_retry_after(client):
+    statuses = [client.get(SUMMARY_URL).status_code for _ in range(BURST + 1)]
+    response = client.get(SUMMARY_URL)
+
+    assert statuses == [200] * BURST + [429]
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert response.get_json()['error'] == 'rate_limited'
+
+
+def test_buckets_are_per_route(client):
+    for _ in range(BURST):
+        client.get(SUMMARY_URL)
+
+    assert client.get(SUMMARY_URL).status_code == 429
+    assert client.get(f'/api/proxy/events/analytics?{QUERY}').status_code == 200
+
+
+def test_fragment_cache_hits_refund_tokens(client):
+    responses = [client.get(FRAGMENTS_URL) for _ in range(BURST * 3)]
+
+    assert [response.status_code for response in responses] == [200] * (BURST * 3)
+    assert [response.headers['X-Fragment-Cache'] for response in responses[1:]] == ['HIT'] * (BURST * 3 - 1)
+
+
+def test_date_range_cache_hits_refund_tokens(client):
+    responses = [client.get('/api/date-range') for _ in range(BURST * 3)]
+
+    assert all(response.status_code == 200 for response in responses)
+    assert responses[-1].headers['X-Cache'] == 'HIT'
+
+
+def test_forwarded_header_is_ignored_by_default(client):
+    statuses = [
+        client.get(SUMMARY_URL, headers={'X-Forwarded-For': f'10.0.0.{index}'}).status_code
+        for index in range(BURST + 1)
+    ]
+    assert statuses[-1] == 429
+
+
+def test_trusted_proxy_hop_is_taken_from_the_right(client, monkeypatch):
+    monkeypatch.setattr(rate_limiter, 'RATE_LIMIT_TRUST_FORWARDED', 1)
+
+    # 클라이언트가 넣은 왼쪽 주소를 바꿔도 같은 버킷
+    spoofed = [
+        client.get(SUMMARY_URL, headers={'X-Forwarded-For': f'10.0.0.{index}, 203.0.113.5'}).status_code
+        for index in range(BURST + 1)
+    ]
+    assert spoofed[-1] == 429
+
+    # 신뢰 프록시가 기록한 주소가 다르면 다른 클라이언트
+    other = client.get(SUMMARY_URL, headers={'X-Forwarded-For': '10.0.0.1, 203.0.113.6'})
+    assert other.status_code == 200
+
+
+def test_rejections_are_counted_per_route(client):
+    for _ in range(BURST + 1):
+        client.get(SUMMARY_URL)
+
+    assert RateLimiter.snapshot()['rejected']['proxy_events_summary']['rate_limited'] >= 1
@@ -0,0 +1,57 @@
+"""폴링 간격 힌트 (마지막 데이터 변경 후 경과 시간 기준)"""
+import pytest
+
+from components import refresh_hints
+from components.refresh_hints import RefreshHintUtils
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(refresh_hints.time, 'monotonic', fake)
+    return fake
+
+
+def _suggest(data, date=None):
+    today = (date or RefreshHintUtils.get_today()).isoformat()
+    return RefreshHintUtils.suggest_interval('channels', today, today, 'all', data)
+
+
+def test_first_poll_uses_default_interval(clock):
+    assert _suggest({'v': 1}) == RefreshHintUtils.DEFAULT_INTERVAL
+
+
+def test_interval_does_not_depend_on_poll_count(clock):
+    _suggest({'v': 1})
+    # 여러 클라이언트가 같은 시점에 폴링해도 간격이 바뀌지 않음
+    intervals = {_suggest({'v': 1}) for _ in range(10)}
+    assert intervals == {RefreshHintUtils.DEFAULT_INTERVAL}
+
+
+def test_interval_grows_with_time_since_last_change(clock):
+    _suggest({'v': 1})
+    clock.now += 10
+    assert _suggest({'v': 2}) == RefreshHintUtils.MIN_INTERVAL
+
+    clock.now += 60
+    assert _suggest({'v': 2}) == 30
+    clock.now += 600
+    assert _suggest({'v': 2}) == RefreshHintUtils.MAX_INTERVAL
+
+
+def test_finished_period_needs_no_polling(clock):
+    assert RefreshHintUtils.suggest_interval('channels', '2020-01-01', '2020-01-31', 'all', {}) == \
+        RefreshHintUtils.FINISHED_INTERVAL
+
+
+def test_header_is_set_on_proxy_response(client):
+    response = client.get('/api/proxy/events/summary?start=2025-08-01&end=2025-08-31')
+    assert response.headers[RefreshHintUtils.HEADER_NAME] == '0'
@@ -0,0 +1,70 @@
+"""채널 응답에 포함하는 요약 카드 데이터 (include=summary)"""
+import pytest
+
+from fake_backend import FakeBackendData
+from components import event_summary_panel
+from components.event_summary_panel import EventSummaryComponent
+
+from conftest import QUERY
+
+CHANNELS_URL = f'/api/proxy/channels?{QUERY}&include=summary'
+TYPE_SEVERITY = {'FIRE': 'critical', 'SMOKE': 'critical', 'INTRUSION': 'warn', 'FALL': 'warn', 'HELMET': 'info'}
+
+
+@pytest.fixture
+def no_verification(monkeypatch):
+    monkeypatch.setattr(event_summary_panel, 'SUMMARY_VERIFY_SAMPLE_RATE', 0)
+
+
+@pytest.fixture
+def backend_with_severity(monkeypatch):
+    """by_type 에 severity 필드를 주는 백엔드"""
+    original = FakeBackendData.channels
+
+    def channels(self, start, end):
+        data = original(self, start, end)
+        for item in data['items']:
+            item['by_type'] = [dict(event_type, severity=TYPE_SEVERITY[event_type['type_code']])
+                               for event_type in item['by_type']]
+        return data
+
+    monkeypatch.setattr(FakeBackendData, 'channels', channels)
+
+
+def test_summary_is_derived_when_backend_reports_severity(client, upstream_calls, no_verification,
+                                                          backend_with_severity):
+    response = client.get(CHANNELS_URL)
+    data = response.get_json()
+
+    expected = {'total': 0, 'critical': 0, 'warn': 0, 'info': 0}
+    for item in data['items']:
+        expected['total'] += item['count']
+        for event_type in item['by_type']:
+            expected[event_type['severity']] += event_type['count']
+
+    assert data['summary']['source'] == 'derived'
+    assert data['summary']['counts'] == expected
+    assert data['summary']['distribution']['total_events'] == expected['total']
+    assert data['summary']['distribution']['max_events'] == max(item['count'] for item in data['items'])
+    assert '/api/v1/events/summary' not in upstream_calls
+
+
+def test_summary_is_omitted_without_severity(client, upstream_calls, no_verification):
+    # 현재 백엔드 스키마(by_type 에 severity 없음)에서는 계산하지 않고, 채널 요청 안에서 요약 API 도 호출하지 않음
+    response = client.get(CHANNELS_URL)
+
+    assert response.status_code == 200
+    assert response.get_json()['summary'] is None
+    assert upstream_calls.count('/api/v1/channels') == 1
+    assert '/api/v1/events/summary' not in upstream_calls
+
+
+def test_labels_are_not_guessed_into_severity():
+    assert EventSummaryComponent.classify_event_severity({'label': 'critical fire', 'type_code': 'WARN'}) is None
+    assert EventSummaryComponent.classify_event_severity({'severity': 'WARN'}) == 'warn'
+
+
+def test_mismatched_type_totals_are_not_derived():
+    channels = {'items': [{'channel_id': '1', 'count': 5,
+                           'by_type': [{'severity': 'critical', 'count': 3}]}]}
+    assert EventSummaryComponent.derive_summary_from_channels(channels) is None
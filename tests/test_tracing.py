@@ -0,0 +1,99 @@
+"""요청 추적 - X-Trace-Id 전달과 Server-Timing 헤더"""
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import FAKE_BACKEND_URL, _fake_backend
+from components import tracing
+from components.backend_registry import Backend, BackendRegistry
+from components.tracing import Trace, Tracing
+
+TRACE_ID = 'trace-test-0001'
+
+
+def _received_trace_ids(path):
+    return [trace_id for received, trace_id in list(_fake_backend.data.received) if received == path]
+
+
+def _timing_spans(response):
+    """Server-Timing 헤더를 (구간 이름, 나머지 항목) 목록으로 분해"""
+    spans = []
+    for part in response.headers['Server-Timing'].split(', '):
+        name, _, rest = part.partition(';')
+        spans.append((name, rest))
+    return spans
+
+
+def test_invalid_trace_id_is_replaced(client):
+    for bad in ('short', 'has space-12345', 'x' * 65, 'inject;X-Evil=1'):
+        response = client.get('/api/date-range', headers={'X-Trace-Id': bad})
+        trace_id = response.headers['X-Trace-Id']
+
+        assert trace_id != bad
+        assert tracing._TRACE_ID_PATTERN.match(trace_id)
+
+
+def test_missing_trace_id_is_generated(client):
+    response = client.get('/api/date-range')
+
+    assert tracing._TRACE_ID_PATTERN.match(response.headers['X-Trace-Id'])
+
+
+def test_trace_id_is_echoed_and_sent_to_backend(client):
+    _fake_backend.data.received.clear()
+
+    response = client.get('/api/date-range', headers={'X-Trace-Id': TRACE_ID})
+
+    assert response.status_code == 200
+    assert response.headers['X-Trace-Id'] == TRACE_ID
+    assert _received_trace_ids('/api/v1/date-range') == [TRACE_ID]
+
+
+def test_non_api_paths_are_not_traced(client):
+    response = client.get('/', headers={'X-Trace-Id': TRACE_ID})
+
+    assert 'X-Trace-Id' not in response.headers
+    assert 'Server-Timing' not in response.headers
+
+
+def test_server_timing_lists_spans_in_order_with_total(client):
+    response = client.get('/api/date-range')
+    names = [name for name, _ in _timing_spans(response)]
+
+    assert names[-1] == 'total'
+    assert {'cache', 'queue', 'upstream', 'parse', 'serialize'} <= set(names)
+    assert names[:-1] == [name for name in Trace.SPAN_ORDER if name in names]
+    for _, rest in _timing_spans(response):
+        assert rest.startswith('dur=')
+
+
+def test_server_timing_counts_fan_out_calls(client, monkeypatch):
+    monkeypatch.setattr(BackendRegistry, '_backends', [
+        Backend('nvr-1', FAKE_BACKEND_URL, site='s1'),
+        Backend('nvr-2', FAKE_BACKEND_URL, site='s1'),
+    ])
+    _fake_backend.data.received.clear()
+
+    response = client.get('/api/date-range?site=s1', headers={'X-Trace-Id': TRACE_ID})
+    spans = dict(_timing_spans(response))
+
+    assert response.status_code == 200
+    assert spans['upstream'].endswith(';desc="2 calls"')
+    assert spans['queue'].endswith(';desc="2 calls"')
+    assert 'desc=' not in spans['total']
+    # 팬아웃 스레드 풀에서 실행된 두 요청 모두 같은 추적 ID 를 전달
+    assert _received_trace_ids('/api/v1/date-range') == [TRACE_ID, TRACE_ID]
+
+
+def test_propagate_carries_trace_into_worker_threads():
+    trace = Trace(TRACE_ID)
+    token = tracing._current_trace.set(trace)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            propagated = executor.submit(Tracing.propagate(Tracing.trace_id)).result()
+            plain = executor.submit(Tracing.trace_id).result()
+            executor.submit(Tracing.propagate(Tracing.add), 'upstream', 1.5).result()
+    finally:
+        tracing._current_trace.reset(token)
+
+    assert propagated == TRACE_ID
+    assert plain is None
+    assert trace.server_timing().startswith('upstream;dur=1.50, total;dur=')
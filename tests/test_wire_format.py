@@ -0,0 +1,104 @@
+"""컬럼형 응답 인코딩 (행 스키마 보존, 클라이언트 디코더 왕복)"""
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from components.channel_stats_panel import ChannelStatsComponent
+from components.event_analytics_graphs import EventAnalyticsComponent
+from components.wire_format import COLUMNAR_MIME, StringDictionary, encode_table
+
+from conftest import QUERY, ROOT_DIR
+
+RENDER_PREP_JS = os.path.join(ROOT_DIR, 'static', 'render_prep.js')
+
+CHANNELS = {
+    'items': [
+        {'channel_id': 1, 'name': 'CH01', 'count': 3, 'status': 'ON', 'location_name': '설비 1',
+         'by_type': [{'type_code': 'FIRE', 'label': '화재', 'count': 3, 'severity': 'critical'}],
+         'tags': ['a', 'b']},
+        {'channel_id': '2', 'count': 0, 'status': 'OFF', 'by_type': [],
+         'location_info': {'area': '공정 1'}, 'note': None},
+    ],
+    'range': {'start': '2025-08-01', 'end': '2025-08-31'},
+    'summary': None
+}
+
+ANALYTICS = {
+    'type_pie': [{'type_code': 'FIRE', 'label': '화재', 'count': 5}, {'type_code': 'ETC', 'count': 0}],
+    'hourly_bar': [{'hour': 3, 'count': 2}, {'hour': 14, 'count': 9}],
+    'range': {'start': '2025-08-01', 'end': '2025-08-31'}
+}
+
+
+def _decode_with_client(payload):
+    script = (
+        f"{open(RENDER_PREP_JS, encoding='utf-8').read()}\n"
+        "const input = require('fs').readFileSync(0, 'utf8');\n"
+        "process.stdout.write(JSON.stringify(decodeColumnarPayload(JSON.parse(input))));\n"
+    )
+    result = subprocess.run(['node', '-e', script], input=json.dumps(payload),
+                            capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout)
+
+
+def test_grid_format_accepts_integer_channel_id():
+    formatted = ChannelStatsComponent.format_channel_grid_data({'items': [{'channel_id': 7}]})
+    assert formatted[0]['name'] == 'CH07'
+
+
+def test_encode_table_keeps_schema_and_dictionary_encodes_strings():
+    strings = StringDictionary()
+    table = encode_table(CHANNELS['items'], strings)
+
+    assert table['row_count'] == 2
+    assert set(table['fields']) == {'channel_id', 'name', 'count', 'status', 'location_name',
+                                    'by_type', 'tags', 'location_info', 'note'}
+    assert 'status' in table['dict_fields']
+    assert table['nested_fields'] == ['by_type']
+    assert table['missing']['name'] == [1]
+    assert table['columns']['channel_id'] == [1, '2']
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node 필요')
+def test_columnar_round_trip_matches_json():
+    assert _decode_with_client(ChannelStatsComponent.to_columnar(CHANNELS)) == CHANNELS
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node 필요')
+def test_decoder_rejects_schema_mismatch():
+    payload = ChannelStatsComponent.to_columnar(CHANNELS)
+    payload['tables']['items']['columns']['count'].pop()
+
+    with pytest.raises(RuntimeError, match='스키마 불일치'):
+        _decode_with_client(payload)
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node 필요')
+def test_proxy_columnar_response_decodes_to_json_response(client):
+    url = f'/api/proxy/channels?{QUERY}'
+    plain = client.get(url).get_json()
+    columnar = client.get(url, headers={'Accept': COLUMNAR_MIME})
+
+    assert columnar.mimetype == COLUMNAR_MIME
+    assert _decode_with_client(columnar.get_json()) == plain
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node 필요')
+def test_analytics_round_trip_keeps_backend_shape():
+    # 타입 코드/누락된 라벨/비어 있는 시간대를 보정하지 않고 그대로 복원
+    assert _decode_with_client(EventAnalyticsComponent.to_columnar(ANALYTICS)) == ANALYTICS
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node 필요')
+def test_proxy_analytics_columnar_response_decodes_to_json_response(client):
+    url = f'/api/proxy/events/analytics?{QUERY}'
+    plain = client.get(url).get_json()
+    columnar = client.get(url, headers={'Accept': COLUMNAR_MIME})
+
+    assert columnar.mimetype == COLUMNAR_MIME
+    assert _decode_with_client(columnar.get_json()) == plain